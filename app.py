@@ -1,19 +1,40 @@
-import json
+import csv
 import os
 import threading
 import math
+import time
 from datetime import date, datetime
 
-import numpy as np
-import pandas as pd
-
-from flask import Flask, redirect, render_template, request, session, url_for, jsonify
+from flask import Flask, Response, abort, redirect, render_template, request, send_from_directory, session, stream_with_context, url_for, jsonify
+from archive import OfferArchive, parse_archive_query, write_arrow, write_parquet
+from best_deals import DEFAULT_TOP, MAX_TOP, BestDealCache
+from events import Broadcaster
+from manual_offers_repo import ManualOfferStore, ManualOffersRepository
+from last_run import load_last_run, save_last_run
+from metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    RUN_DURATION,
+    RUN_ROWS,
+    TimedLock,
+    observe_request,
+    record_dealer_metrics,
+    render_metrics,
+)
+from profiling import ProfileStore, parse_targets, wants_profile
+from offer_index import OfferIndexCache, parse_query
 from registry import SCRAPERS
+from results_cache import ResultsCache, encode_json, negotiate
+from shared_state import SharedScrapeState
+from run_history import RunHistoryStore
+from scrapers.base.stage_timer import StageTimer
 from scraper_monitor import (
-    SCRAPER_MONITOR,
     # finish_monitoring,
+    export_monitor,
+    monitor_snapshot,
     record_dealer_exception,
     record_dealer_result,
+    replace_monitor,
+    restore_monitor,
     start_monitoring,
 )
 
@@ -24,6 +45,8 @@ app.secret_key = os.environ.get("FLASK_SECRET_KEY", "dev-secret-key")
 app.config["JSONIFY_ALLOW_NAN"] = False
 
 MANUAL_OFFERS_DIR = os.path.join(os.path.dirname(__file__), "manual_offers")
+DATA_DIR = os.environ.get("SCRAPE_DATA_DIR", os.path.join(os.path.dirname(__file__), "data"))
+LAST_RUN_PATH = os.path.join(DATA_DIR, "last_run.json.gz")
 
 # ---------------- AUTH ----------------
 
@@ -34,15 +57,140 @@ CREDENTIALS = {
 
 # ---------------- GLOBAL SCRAPE STATE ----------------
 
-SCRAPE_LOCK = threading.Lock()
+SCRAPE_LOCK = TimedLock("scrape_state")
 
 SCRAPE_STATE = {
     "running": False,
+    # Claimed by start_scraping (under SCRAPE_LOCK) until background_scrape sets running
+    "starting": False,
     "progress": 0,
     "total": len(SCRAPERS),
+    # Published buffer: the last complete run. Never mutated in place; a
+    # finished run replaces it wholesale (see background_scrape).
     "rows": [],
+    "run_id": None,
+    # Identifies the published rows; delta cursors from other generations reset
+    "generation": 0,
+    # Staging buffer filled by the run in progress (served with ?live=1); None between runs
+    "staging": None,
+    "staging_generation": None,
+    # True while serving the previous process's last run (see warm_load_last_run)
+    "stale": False,
+    "last_completed_at": None,
+}
+
+# Push channel for /events; publishes happen under SCRAPE_LOCK so event ids
+# line up with what /scrape-results/delta reports
+EVENTS = Broadcaster()
+
+# Pre-encoded /scrape-results bodies, rebuilt only when the rows change;
+# one cache per buffer so live and published readers don't evict each other
+RESULTS_CACHE = ResultsCache()
+LIVE_RESULTS_CACHE = ResultsCache()
+
+
+def result_buffer(live=False):
+    """(generation, rows) to serve: staging while a run is filling it (live), else published. Call under SCRAPE_LOCK."""
+    if live and SCRAPE_STATE["staging"] is not None:
+        return SCRAPE_STATE["staging_generation"], SCRAPE_STATE["staging"]
+    return SCRAPE_STATE["generation"], SCRAPE_STATE["rows"]
+
+
+def results_version(live=False):
+    """Rows are append-only within a generation, so this pins their content. Call under SCRAPE_LOCK."""
+    generation, rows = result_buffer(live)
+    return f"{generation}.{len(rows)}"
+
+
+def load_results(live=False):
+    with SCRAPE_LOCK:
+        return results_version(live), result_buffer(live)[1][:]
+
+
+DEALER_BRANDS = {
+    getattr(scraper, "dealer_name", None): getattr(scraper, "brand", None) for scraper in SCRAPERS
+}
+KNOWN_BRANDS = sorted({brand for brand in DEALER_BRANDS.values() if brand})
+
+
+def brand_for(dealer):
+    """Scraper brand, or a brand named in the dealership (manual offers), else "Other"."""
+    brand = DEALER_BRANDS.get(dealer)
+    if brand:
+        return brand
+    lowered = dealer.lower()
+    for brand in KNOWN_BRANDS:
+        if brand.split("-")[0].lower() in lowered:
+            return brand
+    return "Other"
+
+
+# Filter / sort indexes for /scrape-results/query, one per results version
+OFFER_INDEX = OfferIndexCache(brand_for)
+
+
+def current_offer_index():
+    with SCRAPE_LOCK:
+        version = results_version()
+    return OFFER_INDEX.get(version, load_results)
+
+
+# Per-model dealer rankings by effective monthly cost, one per results version
+BEST_DEALS = BestDealCache(brand_for, is_manual=lambda dealer: dealer not in DEALER_BRANDS)
+
+
+def current_best_deals():
+    with SCRAPE_LOCK:
+        version = results_version()
+    return BEST_DEALS.get(version, load_results)
+
+# ---------------- RUN HISTORY ----------------
+
+RUN_HISTORY = RunHistoryStore(os.path.join(DATA_DIR, "scrape_history.sqlite3"))
+
+
+PROFILES = ProfileStore(os.path.join(DATA_DIR, "profiles"))
+
+# Columnar history of every completed run (needs pyarrow)
+ARCHIVE = OfferArchive(os.path.join(DATA_DIR, "archive"))
+
+
+def record_history(method, *args, **kwargs):
+    """History is best-effort: a storage problem must never stop a scrape."""
+    try:
+        return method(*args, **kwargs)
+    except Exception as e:
+        print(f"[ERROR] Run history: {e}")
+        return None
+
+# ---------------- SHARED STATE (multi-worker) ----------------
+
+# SCRAPE_STATE_BACKEND=sqlite lets several worker processes serve one run:
+# the worker that scrapes writes through to SHARED, the others sync from it.
+SHARED = (
+    SharedScrapeState(os.path.join(DATA_DIR, "shared_state.sqlite3"))
+    if os.environ.get("SCRAPE_STATE_BACKEND", "").lower() == "sqlite"
+    else None
+)
+SHARED_SYNC_INTERVAL = float(os.environ.get("SCRAPE_STATE_SYNC_INTERVAL", "1.0"))
+
+_SHARED_SYNC = {
+    "writing": False,  # this process owns the current run
+    "monitor_version": None,
+    "pid": None,  # pid that started the sync thread (reset by fork)
 }
 
+
+def share(method, *args, **kwargs):
+    """Write-through to the shared backend; a no-op without one, best-effort with one."""
+    if SHARED is None:
+        return None
+    try:
+        return getattr(SHARED, method)(*args, **kwargs)
+    except Exception as e:
+        print(f"[ERROR] Shared state {method}: {e}")
+        return None
+
 # ---------------- SANITIZER ----------------
 
 def sanitize(obj):
@@ -55,111 +203,391 @@ def sanitize(obj):
         if math.isnan(obj) or math.isinf(obj):
             return None
         return obj
-    if obj is np.nan:
-        return None
     return obj
 
 
-def to_iso(obj):
-    """Recursively convert datetime values to ISO strings."""
-    if isinstance(obj, dict):
-        return {k: to_iso(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [to_iso(v) for v in obj]
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    return obj
+def df_to_records(df):
+    """DataFrame -> list of dicts with every NaN / NA turned into None."""
+    # 🔴 HARD NaN KILL: object columns hold None as-is (float columns would turn it back into NaN)
+    return df.astype(object).where(df.notna(), None).to_dict("records")
 
 
 # ---------------- MANUAL OFFERS ----------------
 
-def load_manual_offers():
-    rows = []
+def normalize_manual_rows(rows):
+    # pandas-backed modules (dedup, export, run_diff, ...) are imported where
+    # they are used, so `import app` doesn't pay for pandas / numpy / pyarrow
+    from scrapers.base.toyota_base import ToyotaBaseScraper
 
-    if not os.path.isdir(MANUAL_OFFERS_DIR):
-        return rows
+    # Manual offers are typed in as strings ("299"); coerce them like scraped rows
+    return df_to_records(ToyotaBaseScraper.normalize_records(rows))
 
-    for filename in os.listdir(MANUAL_OFFERS_DIR):
-        if not filename.lower().endswith(".json"):
-            continue
 
-        path = os.path.join(MANUAL_OFFERS_DIR, filename)
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                offers = json.load(f)
-        except Exception as e:
-            print(f"[ERROR] Manual offers load failed: {filename}: {e}")
-            continue
+# Parsed once per file version; re-read only when a file's mtime or size changes
+MANUAL_OFFERS = ManualOffersRepository(MANUAL_OFFERS_DIR, normalize_manual_rows)
+# Row-level upserts/deletes with per-file locking and atomic rewrites
+MANUAL_OFFERS_STORE = ManualOfferStore(MANUAL_OFFERS)
+MANUAL_OFFERS_WATCH_INTERVAL = float(os.environ.get("MANUAL_OFFERS_WATCH_INTERVAL", "2"))
+
+
+def load_manual_offers():
+    return MANUAL_OFFERS.rows()
+
+# ---------------- LAST RUN SNAPSHOT ----------------
 
-        if not isinstance(offers, list):
-            continue
+def persist_last_run(run_id, finished_at):
+    """Best-effort: save the completed run so the next start has data immediately."""
+    with SCRAPE_LOCK:
+        rows = SCRAPE_STATE["rows"][:]
+    try:
+        save_last_run(LAST_RUN_PATH, rows, export_monitor(), run_id=run_id, finished_at=finished_at)
+    except Exception as e:
+        print(f"[ERROR] Last run save failed: {e}")
 
-        for offer in offers:
-            if not isinstance(offer, dict):
-                continue
 
-            row = dict(offer)
-            row.setdefault("Dealership", os.path.splitext(filename)[0])
-            rows.append(row)
+def warm_load_last_run():
+    """Serve the last completed run (marked stale) until a fresh run lands."""
+    document = load_last_run(LAST_RUN_PATH)
+    if document is None:
+        return
 
-    return rows
+    with SCRAPE_LOCK:
+        SCRAPE_STATE["generation"] += 1
+        SCRAPE_STATE["rows"] = document["rows"]
+        SCRAPE_STATE["run_id"] = document.get("run_id")
+        SCRAPE_STATE["stale"] = True
+        SCRAPE_STATE["last_completed_at"] = document.get("finished_at")
+    restore_monitor(document.get("monitor") or {})
+    share("seed", document["rows"], document.get("run_id"), document.get("finished_at"), export_monitor())
+
+    print(f"[OK] Loaded {len(document['rows'])} rows from last run ({document.get('finished_at')})")
+
+def archive_run(run_id, finished_at):
+    """Best-effort: append the completed run to the columnar archive."""
+    if not ARCHIVE.available:
+        return
+    with SCRAPE_LOCK:
+        rows = SCRAPE_STATE["rows"]
+    try:
+        ARCHIVE.append_run(rows, run_id, finished_at, brand_for)
+    except Exception as e:
+        print(f"[ERROR] Archive append failed: {e}")
+
+def record_run_diff(run_id, previous_run_id, previous_rows, rows, failed_dealers):
+    """Best-effort: store what changed since the previously published run."""
+    if run_id is None:
+        return
+    from run_diff import diff_runs
+
+    try:
+        diffs = diff_runs(previous_rows, rows, skip_dealers=failed_dealers)
+    except Exception as e:
+        print(f"[ERROR] Run diff failed: {e}")
+        return
+    record_history(RUN_HISTORY.record_diff, run_id, previous_run_id, diffs)
 
 # ---------------- BACKGROUND SCRAPER ----------------
 
-def background_scrape():
+def background_scrape(profile_targets=None):
+    from dedup import RunDeduplicator, dedup_keys_for
+
     run_date = date.today()
+    run_started = time.perf_counter()
+    started_at = datetime.utcnow()
+    run_id = record_history(RUN_HISTORY.start_run, started_at)
+    profile_dir = PROFILES.run_dir(run_id, started_at)
+    # Manual offers go first, so a scraped row repeating one is the copy dropped
+    dedup = RunDeduplicator()
+    manual_rows, manual_duplicates = dedup.apply_records(load_manual_offers())
+    if manual_duplicates:
+        print(f"[OK] Manual offers: dropped {manual_duplicates} duplicate rows")
+    shared_generation = share("begin_run", len(SCRAPERS), run_id, manual_rows)
+
+    # The published rows keep being served; this run fills the staging buffer
     with SCRAPE_LOCK:
+        generation = shared_generation or SCRAPE_STATE["generation"] + 1
+        staging = manual_rows
         SCRAPE_STATE["running"] = True
+        SCRAPE_STATE["starting"] = False
         SCRAPE_STATE["progress"] = 0
-        SCRAPE_STATE["rows"].clear()
-        SCRAPE_STATE["rows"].extend(load_manual_offers())
+        SCRAPE_STATE["staging_generation"] = generation
+        SCRAPE_STATE["staging"] = staging
+        EVENTS.publish("run-started", {
+            "generation": generation,
+            "offset": 0,
+            "rows": sanitize(staging),
+            "progress": 0,
+            "total": SCRAPE_STATE["total"],
+        })
 
     start_monitoring()
-
+    share("put_monitor", export_monitor())
+    failed_dealers = set()
 
     for scraper in SCRAPERS:
         dealer = getattr(scraper, "dealer_name", None) or scraper.__class__.__name__
+        timer = StageTimer()
+        error = None
+        records, offset = [], None
+        duplicates = 0
         try:
-            df = scraper.fetch_df()
-
-            df.insert(0, "Dealership", dealer)
-
-            # 🔴 HARD NaN KILL (Pandas + NumPy)
-            records = (
-                df.where(pd.notnull(df), None)
-                .replace({np.nan: None})
-                .to_dict("records")
+            # Lazy registry entries import their scraper module here, outside the stage timings
+            if hasattr(scraper, "load"):
+                scraper.load()
+
+            with timer.activate():
+                started = time.perf_counter()
+                if wants_profile(profile_targets, dealer):
+                    df = PROFILES.profile_call(profile_dir, dealer, scraper.fetch_df)
+                else:
+                    df = scraper.fetch_df()
+                timer.attribute_parse(time.perf_counter() - started)
+
+            with timer.stage("normalize"):
+                df.insert(0, "Dealership", dealer)
+                df, duplicates = dedup.apply(df, dedup_keys_for(scraper))
+                records = df_to_records(df)
+
+            with timer.stage("publish"):
+                with SCRAPE_LOCK:
+                    offset = len(staging)
+                    staging.extend(records)
+
+            entry = record_dealer_result(
+                dealer, records, run_date=run_date, timer=timer, duplicates_removed=duplicates
             )
 
-            with SCRAPE_LOCK:
-                SCRAPE_STATE["rows"].extend(records)
+            print(f"[OK] {dealer}: {len(records)} rows in {entry['duration_s']:.2f}s")
 
-            record_dealer_result(dealer, records, run_date=run_date)
+        except Exception as e:
+            print(f"[ERROR] {getattr(scraper, 'class_name', scraper.__class__.__name__)}: {e}")
+            error = e
+            failed_dealers.add(dealer)
+            entry = record_dealer_exception(dealer, e, timer=timer)
 
-            print(f"[OK] {dealer}: {len(records)} rows")
+        record_dealer_metrics(dealer, entry, error)
 
-        except Exception as e:
-            print(f"[ERROR] {scraper.__class__.__name__}: {e}")
-            record_dealer_exception(dealer, e)
+        if run_id is not None:
+            record_history(RUN_HISTORY.record_dealer, run_id, dealer, entry, duration_s=entry["duration_s"])
 
+        event_rows = sanitize(records) if offset is not None else []
         with SCRAPE_LOCK:
             SCRAPE_STATE["progress"] += 1
-            
-
+            progress = SCRAPE_STATE["progress"]
+            row_count = len(staging)
+            EVENTS.publish("dealer", {
+                "dealer": dealer,
+                "generation": generation,
+                "offset": offset if offset is not None else row_count,
+                "rows": event_rows,
+                "progress": SCRAPE_STATE["progress"],
+                "total": SCRAPE_STATE["total"],
+                "monitor": entry,
+            })
+
+        if offset is not None:
+            share("append_rows", generation, offset, event_rows, progress)
+        else:
+            share("append_rows", generation, row_count, [], progress)
+        share("put_monitor", export_monitor())
+
+    finished_at = datetime.utcnow()
+    if run_id is not None:
+        record_history(RUN_HISTORY.finish_run, run_id, finished_at)
+
+    # Atomic swap: readers go from the previous complete run straight to this one
     with SCRAPE_LOCK:
+        previous_rows, previous_run_id = SCRAPE_STATE["rows"], SCRAPE_STATE["run_id"]
+        SCRAPE_STATE["rows"] = staging
+        SCRAPE_STATE["generation"] = generation
+        SCRAPE_STATE["run_id"] = run_id
+        SCRAPE_STATE["staging"] = None
+        SCRAPE_STATE["staging_generation"] = None
         SCRAPE_STATE["running"] = False
+        SCRAPE_STATE["stale"] = False
+        SCRAPE_STATE["last_completed_at"] = finished_at.replace(microsecond=0).isoformat()
+        RUN_ROWS.set(len(SCRAPE_STATE["rows"]))
+        EVENTS.publish("run-finished", {
+            "generation": SCRAPE_STATE["generation"],
+            "rows": len(SCRAPE_STATE["rows"]),
+            "progress": SCRAPE_STATE["progress"],
+            "total": SCRAPE_STATE["total"],
+        })
+    RUN_DURATION.observe(time.perf_counter() - run_started)
+
+    share("finish_run", finished_at.replace(microsecond=0).isoformat())
+    record_run_diff(run_id, previous_run_id, previous_rows, staging, failed_dealers)
+    persist_last_run(run_id, finished_at)
+    archive_run(run_id, finished_at)
+
+    # Build the query indexes now rather than on the first request
+    current_offer_index()
+    current_best_deals()
     # finish_monitoring()
 
+def claimed_run(target, profile_targets=None):
+    """Run ``target`` for start_scraping; drops the claim even if the run fails before it starts."""
+    try:
+        target(profile_targets)
+    finally:
+        with SCRAPE_LOCK:
+            SCRAPE_STATE["starting"] = False
+
+def run_shared_scrape(profile_targets=None):
+    """background_scrape holding the cross-process run lock (taken in start_scraping)."""
+    _SHARED_SYNC["writing"] = True
+    done = threading.Event()
+
+    def renew_lease():
+        # Workers on other hosts reclaim the run once its heartbeat is older than the lease
+        while not done.wait(SHARED.lease_seconds / 3):
+            share("heartbeat")
+
+    threading.Thread(target=renew_lease, daemon=True).start()
+    try:
+        background_scrape(profile_targets)
+    finally:
+        done.set()
+        _SHARED_SYNC["writing"] = False
+        share("release_run")
+
+
+def sync_shared_state():
+    """Mirror another worker's run into this process's SCRAPE_STATE and SCRAPER_MONITOR."""
+    if SHARED is None or _SHARED_SYNC["writing"]:
+        return
+    try:
+        state = SHARED.read_state()
+        if not state["generation"]:
+            return
+
+        with SCRAPE_LOCK:
+            published_generation = SCRAPE_STATE["generation"]
+            staging_generation = SCRAPE_STATE["staging_generation"]
+            staging_count = len(SCRAPE_STATE["staging"] or [])
+
+        published = None
+        if state["published_generation"] and state["published_generation"] != published_generation:
+            published = SHARED.read_rows(state["published_generation"])
+
+        live = state["running"] and state["generation"] != state["published_generation"]
+        restart = live and state["generation"] != staging_generation
+        staging, offset = None, 0
+        if restart:
+            staging = SHARED.read_rows(state["generation"])
+        elif live and state["row_count"] > staging_count:
+            staging, offset = SHARED.read_rows(state["generation"], staging_count), staging_count
+
+        monitor = None
+        if state["monitor_version"] != _SHARED_SYNC["monitor_version"]:
+            monitor = SHARED.read_monitor()
+    except Exception as e:
+        print(f"[ERROR] Shared state sync: {e}")
+        return
+
+    with SCRAPE_LOCK:
+        if (
+            _SHARED_SYNC["writing"]
+            or SCRAPE_STATE["generation"] != published_generation
+            or SCRAPE_STATE["staging_generation"] != staging_generation
+        ):
+            return
+
+        if restart:
+            SCRAPE_STATE["staging"] = staging
+            SCRAPE_STATE["staging_generation"] = state["generation"]
+            EVENTS.publish("run-started", {
+                "generation": state["generation"],
+                "offset": 0,
+                "rows": staging,
+                "progress": state["progress"],
+                "total": state["total"],
+            })
+        elif staging and len(SCRAPE_STATE["staging"]) == offset:
+            SCRAPE_STATE["staging"].extend(staging)
+            EVENTS.publish("dealer", {
+                "dealer": None,
+                "generation": state["generation"],
+                "offset": offset,
+                "rows": staging,
+                "progress": state["progress"],
+                "total": state["total"],
+                "monitor": None,
+            })
+        elif not live:
+            SCRAPE_STATE["staging"] = None
+            SCRAPE_STATE["staging_generation"] = None
+
+        SCRAPE_STATE["running"] = state["running"]
+        SCRAPE_STATE["progress"] = state["progress"]
+        SCRAPE_STATE["total"] = state["total"] or SCRAPE_STATE["total"]
+        SCRAPE_STATE["stale"] = state["stale"]
+        SCRAPE_STATE["last_completed_at"] = state["last_completed_at"]
+
+        if published is not None:
+            SCRAPE_STATE["rows"] = published
+            SCRAPE_STATE["generation"] = state["published_generation"]
+            SCRAPE_STATE["run_id"] = state["run_id"]
+            EVENTS.publish("run-finished", {
+                "generation": state["published_generation"],
+                "rows": len(published),
+                "progress": state["progress"],
+                "total": state["total"],
+            })
+
+    if monitor is not None:
+        replace_monitor({**monitor, "running": state["running"], "stale": state["stale"]})
+        _SHARED_SYNC["monitor_version"] = state["monitor_version"]
+
+
+def _shared_sync_loop():
+    while True:
+        sync_shared_state()
+        time.sleep(SHARED_SYNC_INTERVAL)
+
+
+@app.before_request
+def ensure_shared_sync():
+    # Started lazily (and again after a fork) so every worker gets its own poller
+    if SHARED is None or _SHARED_SYNC["pid"] == os.getpid():
+        return
+    _SHARED_SYNC["pid"] = os.getpid()
+    sync_shared_state()
+    threading.Thread(target=_shared_sync_loop, daemon=True).start()
+
+
+@app.before_request
+def ensure_manual_offers_watch():
+    # Threads don't survive a fork; until the watcher runs, reads stat the directory
+    if MANUAL_OFFERS_WATCH_INTERVAL > 0 and not MANUAL_OFFERS.watching:
+        MANUAL_OFFERS.watch(MANUAL_OFFERS_WATCH_INTERVAL)
+
+
+warm_load_last_run()
+
 # ---------------- API ----------------
 
 @app.route("/start-scraping")
 def start_scraping():
+    # Claim the run before releasing the lock: background_scrape only sets running
+    # once the run is recorded and manual offers are loaded
     with SCRAPE_LOCK:
-        if SCRAPE_STATE["running"]:
+        if SCRAPE_STATE["running"] or SCRAPE_STATE["starting"]:
             return jsonify({"status": "already_running"})
+        SCRAPE_STATE["starting"] = True
+
+    # Another worker may be scraping; the shared run lock decides. Taken outside
+    # SCRAPE_LOCK: it can wait on SQLite's busy timeout, which would stall every reader
+    if share("acquire_run") is False:
+        with SCRAPE_LOCK:
+            SCRAPE_STATE["starting"] = False
+        return jsonify({"status": "already_running"})
 
-        threading.Thread(target=background_scrape, daemon=True).start()
-        return jsonify({"status": "started"})
+    # ?profile=all or ?profile=Dealer A,Dealer B runs those dealers under cProfile
+    profile_targets = parse_targets(request.args.get("profile"))
+    target = background_scrape if SHARED is None else run_shared_scrape
+    threading.Thread(target=claimed_run, args=(target, profile_targets), daemon=True).start()
+    return jsonify({"status": "started", "profiling": sorted(profile_targets or [])})
 
 @app.route("/scrape-status")
 def scrape_status():
@@ -168,18 +596,314 @@ def scrape_status():
             "running": SCRAPE_STATE["running"],
             "progress": SCRAPE_STATE["progress"],
             "total": SCRAPE_STATE["total"],
+            "stale": SCRAPE_STATE["stale"],
+            "last_completed_at": SCRAPE_STATE["last_completed_at"],
         })
 
 @app.route("/scrape-results")
+@observe_request("scrape_results")
 def scrape_results():
+    # Unchanged rows cost a version check and a copy of cached bytes (or a 304)
+    live = is_live()
+    with SCRAPE_LOCK:
+        version = results_version(live)
+    cache = LIVE_RESULTS_CACHE if live else RESULTS_CACHE
+    snapshot = cache.get(version, lambda: load_results(live))
+
+    encoding = negotiate(request.accept_encodings)
+    response = app.response_class(snapshot.encoded(encoding), mimetype="application/json")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.set_etag(f"{snapshot.etag}-{encoding}" if encoding else snapshot.etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@app.route("/scrape-results/query")
+@observe_request("scrape_results_query")
+def scrape_results_query():
+    """
+    Filtered, sorted, paginated offers.
+
+    ?dealership=&brand= (repeatable or comma separated), ?model= (substring),
+    ?min_monthly=&max_monthly= (also due, msrp, term), ?sort=monthly,-msrp,
+    ?page=&limit=
+    """
+    try:
+        params = parse_query(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    total, rows = current_offer_index().query(**params)
+    body = encode_json({
+        "total": total,
+        "page": params["page"],
+        "limit": params["limit"],
+        "pages": math.ceil(total / params["limit"]),
+        "rows": rows,
+    })
+    return app.response_class(body, mimetype="application/json")
+
+
+def is_live():
+    """?live=1 reads the staging buffer of a run in progress instead of the last complete run."""
+    return request.args.get("live", "").lower() in ("1", "true", "yes")
+
+
+def parse_cursor(cursor):
+    """"<generation>.<offset>" -> (generation, offset); anything else starts over."""
+    try:
+        generation, offset = (int(part) for part in (cursor or "").split("."))
+    except ValueError:
+        return None, 0
+    return generation, max(offset, 0)
+
+
+@app.route("/best-deals")
+@observe_request("best_deals")
+def best_deals():
+    """
+    ?model= -> the top dealers for that model by effective monthly cost
+    ((Monthly x Term + Due at Signing) / Term), ?top= of them (default 5).
+    Without a model, the cheapest offer for every model.
+    """
+    top = min(max(request.args.get("top", DEFAULT_TOP, type=int), 1), MAX_TOP)
+    index = current_best_deals()
+
+    model = (request.args.get("model") or "").strip()
+    if not model:
+        return app.response_class(encode_json({"models": index.leaders()}), mimetype="application/json")
+
+    deals = index.top(model, top)
+    if deals is None:
+        return jsonify({"error": f"No costed offers for model: {model}"}), 404
+    return app.response_class(
+        encode_json({"model": index.names[index.key_for(model)], "deals": deals}),
+        mimetype="application/json",
+    )
+
+
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+@app.route("/scrape-results/export")
+@observe_request("scrape_results_export")
+def scrape_results_export():
+    """
+    The current results, or an archived run with ?run_id=, streamed as
+    ?format=csv (default) or xlsx, with row status and issue columns.
+    Takes the filters of /scrape-results/query; sort applies to current
+    results only, archived runs come out in storage order.
+    """
+    from export import archive_chunks, available_formats, chunked, export_rows, stream_csv, stream_xlsx
+
+    fmt = request.args.get("format", "csv")
+    if fmt not in available_formats():
+        return jsonify({"error": f"Unknown format: {fmt}; use {', '.join(available_formats())}"}), 400
+
+    try:
+        params = parse_query(request.args)
+        run_id = request.args.get("run_id", type=int)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    del params["page"], params["limit"]
+
+    if run_id is None:
+        # Filtered positions in one immutable rows list; rows are read lazily as chunks are written
+        index = current_offer_index()
+        matches = index.select(**params)
+        chunks = chunked(index.rows[i] for i in matches)
+        run_date = date.today()
+        filename = f"offers-{run_date.isoformat()}.{fmt}"
+    else:
+        if not ARCHIVE.available:
+            return jsonify({"error": "Exporting past runs needs the offer archive (pyarrow)"}), 503
+        # Validate against the day the run happened, not today
+        run_dates = ARCHIVE.read(columns=["run_date"], run_ids=[run_id]).column("run_date")
+        if not len(run_dates):
+            return jsonify({"error": f"Run {run_id} is not in the archive"}), 404
+        run_date = run_dates[0].as_py()
+        del params["sort"]
+        chunks = archive_chunks(ARCHIVE.iter_batches(run_ids=[run_id], **params))
+        filename = f"offers-run-{run_id}.{fmt}"
+
+    rows = export_rows(chunks, run_date)
+    body = stream_csv(rows) if fmt == "csv" else stream_xlsx(rows)
+    response = Response(stream_with_context(body), mimetype=EXPORT_MIMETYPES[fmt])
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
+
+
+@app.route("/scrape-results/delta")
+@observe_request("scrape_results_delta")
+def scrape_results_delta():
+    """
+    Rows appended since the client's cursor, plus progress, in one response.
+
+    Rows are append-only within a generation, so the cursor is just the
+    generation and an offset. A cursor from another generation (or none)
+    returns every row with "reset": true. By default this follows the
+    published rows, which only change when a run completes; with ?live=1
+    it follows the staging buffer as dealers finish.
+    """
+    generation, offset = parse_cursor(request.args.get("cursor"))
+    live = is_live()
+
     with SCRAPE_LOCK:
-        clean = sanitize(SCRAPE_STATE["rows"])
-        return jsonify(clean)
+        current, buffer = result_buffer(live)
+        reset = generation != current or offset > len(buffer)
+        if reset:
+            offset = 0
+        rows = buffer[offset:]
+        event_id = EVENTS.last_id
+        status = {
+            "running": SCRAPE_STATE["running"],
+            "progress": SCRAPE_STATE["progress"],
+            "total": SCRAPE_STATE["total"],
+            "stale": SCRAPE_STATE["stale"],
+            "last_completed_at": SCRAPE_STATE["last_completed_at"],
+        }
+
+    return jsonify({
+        "cursor": f"{current}.{offset + len(rows)}",
+        "generation": current,
+        "event_id": event_id,
+        "reset": reset,
+        "rows": sanitize(rows),
+        **status,
+    })
     
 @app.route("/scraper-monitor")
+@observe_request("scraper_monitor")
 def scraper_monitor_status():
-    monitor_snapshot = to_iso(SCRAPER_MONITOR)
-    return jsonify(sanitize(monitor_snapshot))
+    # Pre-serialized per monitor version; idle pollers get a 304
+    etag, body = monitor_snapshot()
+    response = app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@app.route("/metrics")
+def metrics():
+    return app.response_class(render_metrics(), content_type=METRICS_CONTENT_TYPE)
+
+
+@app.route("/events")
+def events():
+    """
+    Server-sent events: "run-started", one "dealer" event per finished
+    dealer (rows, progress and monitor entry) and "run-finished".
+
+    Resumes from the Last-Event-ID header (set by EventSource on reconnect)
+    or ?last_event_id= for the first connection after a /delta sync.
+    """
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    response = Response(EVENTS.stream(last_event_id), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+# ---------------- PROFILES ----------------
+
+@app.route("/profiles")
+def profiles():
+    if session.get("role") != "admin":
+        abort(403)
+    return jsonify(PROFILES.list_profiles())
+
+
+@app.route("/profiles/<run>/<filename>")
+def profile_artifact(run, filename):
+    if session.get("role") != "admin":
+        abort(403)
+    if not filename.endswith((".txt", ".prof")):
+        abort(404)
+    return send_from_directory(
+        PROFILES.root,
+        f"{run}/{filename}",
+        mimetype="text/plain" if filename.endswith(".txt") else "application/octet-stream",
+        as_attachment=filename.endswith(".prof"),
+    )
+
+
+# ---------------- OFFER ARCHIVE ----------------
+
+ARCHIVE_FORMATS = {
+    "parquet": ("application/vnd.apache.parquet", "parquet", write_parquet),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows", write_arrow),
+}
+
+
+@app.route("/archive/offers")
+def archive_offers():
+    """
+    Archived rows across runs. Filters: start / end (run dates), brand,
+    dealership, model, run_id; ?columns= projects. ?format=parquet or
+    arrow downloads the table, otherwise JSON rows.
+    """
+    if not ARCHIVE.available:
+        return jsonify({"error": "The offer archive needs pyarrow"}), 503
+
+    fmt = request.args.get("format", "json")
+    if fmt != "json" and fmt not in ARCHIVE_FORMATS:
+        return jsonify({"error": f"Unknown format: {fmt}; use json, {', '.join(ARCHIVE_FORMATS)}"}), 400
+    try:
+        table = ARCHIVE.read(**parse_archive_query(request.args))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if fmt == "json":
+        return app.response_class(encode_json(table.to_pylist()), mimetype="application/json")
+
+    mimetype, extension, write = ARCHIVE_FORMATS[fmt]
+    response = app.response_class(write(table), mimetype=mimetype)
+    response.headers["Content-Disposition"] = f"attachment; filename=offers.{extension}"
+    return response
+
+
+# ---------------- HISTORY API ----------------
+
+@app.route("/history/runs")
+def history_runs():
+    limit = max(1, min(request.args.get("limit", 50, type=int), 500))
+    return jsonify(RUN_HISTORY.recent_runs(limit=limit))
+
+
+@app.route("/history/runs/<int:run_id>")
+def history_run(run_id):
+    return jsonify({"run_id": run_id, "dealers": RUN_HISTORY.run_results(run_id)})
+
+
+@app.route("/history/runs/<int:run_id>/diff")
+def history_run_diff(run_id):
+    """Offers added, removed or repriced since the run published before this one; ?dealer= narrows it."""
+    diff = RUN_HISTORY.run_diff(run_id, dealer=request.args.get("dealer"))
+    if diff is None:
+        return jsonify({"error": f"No diff recorded for run {run_id}"}), 404
+    return app.response_class(encode_json(diff), mimetype="application/json")
+
+
+@app.route("/history/success-rate")
+def history_success_rate():
+    days = max(1, min(request.args.get("days", 30, type=int), 365))
+    return jsonify({"days": days, "dealers": RUN_HISTORY.success_rates(days=days)})
+
+
+@app.route("/history/dealers/<path:dealer>")
+def history_dealer(dealer):
+    days = max(1, min(request.args.get("days", 30, type=int), 365))
+    return jsonify({"dealer": dealer, "days": days, "daily": RUN_HISTORY.dealer_daily(dealer, days=days)})
 
 
 @app.route("/scrape-monitor")
@@ -270,14 +994,106 @@ def save_manual_offers():
     if not dealership or not isinstance(offers, list) or not offers:
         return jsonify({"error": "Invalid payload"}), 400
 
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in dealership)
-    os.makedirs(MANUAL_OFFERS_DIR, exist_ok=True)
+    ids = MANUAL_OFFERS_STORE.replace(dealership, offers)
+
+    return jsonify({"status": "saved", "ids": ids})
+
+
+@app.route("/manual-offers/data")
+def manual_offers_data():
+    """Current manual offers from the repository cache (?dealership=&model= to filter), with per-file health."""
+    if not session.get("role"):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    dealership = (request.args.get("dealership") or "").strip()
+    model = (request.args.get("model") or "").strip()
+    if dealership or model:
+        rows = MANUAL_OFFERS_STORE.index().find(dealership=dealership or None, model=model or None)
+    else:
+        rows = MANUAL_OFFERS.rows()
+
+    return app.response_class(
+        encode_json({"rows": rows, "files": MANUAL_OFFERS.files()}),
+        mimetype="application/json",
+    )
+
+
+@app.route("/manual-offers/import", methods=["POST"])
+def import_manual_offers():
+    """
+    Bulk-load offers from a CSV upload (multipart "file", or the raw body).
+
+    ?dealership= fills rows without a Dealership column, ?mode=replace swaps
+    each dealer's offers for the imported ones (default: upsert by Offer ID,
+    or by model, model year and term for rows without one),
+    ?dry_run=1 validates without saving. Rows failing a required check are
+    skipped; the report lists every row's errors and warnings by line.
+    """
+    if session.get("role") != "admin":
+        return jsonify({"error": "Unauthorized"}), 401
+    from manual_import import read_csv, summarize, validate_offers
+
+    mode = request.args.get("mode", "upsert")
+    if mode not in ("upsert", "replace"):
+        return jsonify({"error": "mode must be upsert or replace"}), 400
+    dry_run = request.args.get("dry_run", "").lower() in ("1", "true", "yes")
+    upload = request.files.get("file")
+    stream = upload.stream if upload is not None else request.stream
+
+    try:
+        records, ignored = read_csv(stream)
+        accepted, report = summarize(validate_offers(
+            records,
+            date.today(),
+            default_dealership=(request.args.get("dealership") or "").strip() or None,
+        ))
+    except UnicodeDecodeError:
+        return jsonify({"error": "CSV must be UTF-8"}), 400
+    except (ValueError, csv.Error) as e:
+        return jsonify({"error": str(e)}), 400
+
+    if not dry_run:
+        for dealership, offers in accepted.items():
+            if mode == "replace":
+                MANUAL_OFFERS_STORE.replace(dealership, offers)
+            else:
+                MANUAL_OFFERS_STORE.upsert_many(dealership, offers, match_natural_key=True)
+        print(f"[OK] Manual offers import: {report['imported']} rows, {report['rejected']} rejected")
+
+    report.update({"mode": mode, "dry_run": dry_run, "ignored_columns": ignored})
+    return app.response_class(encode_json(report), mimetype="application/json")
+
+
+@app.route("/manual-offers/offers", methods=["POST"])
+def upsert_manual_offer():
+    """Add one offer, or update the one whose "Offer ID" matches. Body: {dealership, offer}."""
+    if not session.get("role"):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    payload = request.get_json(silent=True) or {}
+    dealership = (payload.get("dealership") or "").strip()
+    offer = payload.get("offer")
+    if not dealership or not isinstance(offer, dict) or not offer:
+        return jsonify({"error": "Invalid payload"}), 400
+
+    offer_id, created = MANUAL_OFFERS_STORE.upsert(dealership, offer)
+    return jsonify({"status": "created" if created else "updated", "id": offer_id}), 201 if created else 200
+
+
+@app.route("/manual-offers/offers/<offer_id>", methods=["GET", "DELETE"])
+def manual_offer(offer_id):
+    if not session.get("role"):
+        return jsonify({"error": "Unauthorized"}), 401
 
-    path = os.path.join(MANUAL_OFFERS_DIR, f"{safe_name}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(offers, f, indent=2)
+    if request.method == "DELETE":
+        if not MANUAL_OFFERS_STORE.delete(offer_id):
+            return jsonify({"error": "Unknown offer"}), 404
+        return jsonify({"status": "deleted", "id": offer_id})
 
-    return jsonify({"status": "saved"})
+    offer = MANUAL_OFFERS_STORE.index().get(offer_id)
+    if offer is None:
+        return jsonify({"error": "Unknown offer"}), 404
+    return app.response_class(encode_json(offer), mimetype="application/json")
 
 # ---------------- RUN ----------------
 
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# pyarrow is optional, and importing it (with pandas) is most of the app's
+# startup time; it is loaded on the first archive read or write instead
+HAS_ARROW = importlib.util.find_spec("pyarrow") is not None
+pa = pc = ds = pq = None
+
+
+def _require_arrow() -> None:
+    global pa, pc, ds, pq
+    if pa is None:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+        import pyarrow.parquet
+
+        pc, ds, pq = pyarrow.compute, pyarrow.dataset, pyarrow.parquet
+        pa = pyarrow
+
+
+def _schema():
+    _require_arrow()
+    return pa.schema([
+        ("run_id", pa.int64()),
+        ("finished_at", pa.timestamp("s")),
+        ("dealership", pa.string()),
+        ("model", pa.string()),
+        ("monthly", pa.float64()),
+        ("due_at_signing", pa.float64()),
+        ("msrp", pa.float64()),
+        ("term_months", pa.int32()),
+        ("expires", pa.date32()),
+        ("row_status", pa.string()),
+        ("link", pa.string()),
+        # Partition keys: directories, not stored in the files
+        ("run_date", pa.date32()),
+        ("brand", pa.string()),
+    ])
+
+
+PARTITION_KEYS = ("run_date", "brand")
+# offer_index range keys -> archive columns
+RANGE_COLUMNS = {"monthly": "monthly", "due": "due_at_signing", "msrp": "msrp", "term": "term_months"}
+LINK_KEYS = ("Dealer Specials Link", "Offer Link", "Link")
+
+
+class OfferArchive:
+    """
+    Every completed run, appended to a Parquet dataset partitioned by run
+    date and brand (``run_date=2026-01-05/brand=Toyota/run-12-0.parquet``).
+
+    Rows are normalized through the same column parsers as validation, so
+    money, term and expiry land as typed columns. Reads go through
+    ``pyarrow.dataset``: partition filters skip whole directories, the
+    remaining filters are pushed into the Parquet scan, and only the
+    requested columns are decoded.
+
+    pyarrow is optional; without it ``available`` is False and appends
+    are skipped. It is imported on first use, not with this module.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return HAS_ARROW
+
+    @property
+    def schema(self):
+        return _schema()
+
+    # ---------------- write ----------------
+
+    def to_table(
+        self,
+        rows: List[Dict[str, Any]],
+        run_id: Optional[int],
+        finished_at: datetime,
+        brand_for: Callable[[str], str],
+    ):
+        """Typed Arrow table for one run's rows (partition columns included)."""
+        import pandas as pd
+
+        from validation import normalize_frame_fields, validate_frame
+
+        _require_arrow()
+        raw = pd.DataFrame.from_records(rows) if rows else pd.DataFrame()
+        validated = validate_frame(normalize_frame_fields(rows), finished_at.date())
+
+        def column(name: str) -> pd.Series:
+            if name in raw.columns:
+                return raw[name].where(raw[name].notna(), None)
+            return pd.Series(None, index=validated.index, dtype=object)
+
+        link = pd.Series(None, index=validated.index, dtype=object)
+        for key in reversed(LINK_KEYS):
+            if key in raw.columns:
+                link = raw[key].where(raw[key].notna(), link)
+
+        dealership = column("Dealership").astype(object)
+        frame = pd.DataFrame({
+            "run_id": run_id,
+            "finished_at": finished_at.replace(microsecond=0),
+            "dealership": dealership,
+            "model": validated["model"],
+            "monthly": validated["monthly"],
+            "due_at_signing": validated["due_at_signing"],
+            "msrp": validated["msrp"],
+            "term_months": validated["term_months"],
+            "expires": validated["expires"],
+            "row_status": validated["row_status"],
+            "link": link,
+            "run_date": finished_at.date(),
+            "brand": [brand_for(dealer) if dealer else "Unknown" for dealer in dealership],
+        })
+        return pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False)
+
+    def append_run(
+        self,
+        rows: List[Dict[str, Any]],
+        run_id: Optional[int],
+        finished_at: datetime,
+        brand_for: Callable[[str], str],
+    ) -> int:
+        """Write one run's rows; re-archiving the same run id replaces its files. Returns rows written."""
+        if not self.available or not rows:
+            return 0
+
+        table = self.to_table(rows, run_id, finished_at, brand_for)
+        tag = run_id if run_id is not None else finished_at.strftime("%Y%m%dT%H%M%S")
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            ds.write_dataset(
+                table,
+                self.root,
+                format="parquet",
+                partitioning=self._partitioning(),
+                basename_template=f"run-{tag}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+        return table.num_rows
+
+    # ---------------- read ----------------
+
+    def _partitioning(self):
+        _require_arrow()
+        return ds.partitioning(
+            pa.schema([(key, self.schema.field(key).type) for key in PARTITION_KEYS]),
+            flavor="hive",
+        )
+
+    def dataset(self):
+        return ds.dataset(self.root, format="parquet", schema=self.schema, partitioning=self._partitioning())
+
+    def _scan_args(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        brands: Sequence[str] = (),
+        dealerships: Sequence[str] = (),
+        model: Optional[str] = None,
+        run_ids: Sequence[int] = (),
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+    ) -> Tuple[List[str], Any]:
+        names = self.schema.names
+        columns = list(columns) if columns else names
+        unknown = [name for name in columns if name not in names]
+        if unknown:
+            raise ValueError(f"Unknown column(s): {', '.join(unknown)}; use {', '.join(names)}")
+
+        expression = None
+
+        def where(condition):
+            nonlocal expression
+            expression = condition if expression is None else expression & condition
+
+        if start is not None:
+            where(ds.field("run_date") >= pa.scalar(start, pa.date32()))
+        if end is not None:
+            where(ds.field("run_date") <= pa.scalar(end, pa.date32()))
+        # Case-insensitive, like offer_index's categorical filters
+        if brands:
+            where(pc.utf8_lower(ds.field("brand")).isin([brand.lower() for brand in brands]))
+        if dealerships:
+            where(pc.utf8_lower(ds.field("dealership")).isin([dealer.lower() for dealer in dealerships]))
+        if run_ids:
+            where(ds.field("run_id").isin([int(run_id) for run_id in run_ids]))
+        if model:
+            where(pc.match_substring(ds.field("model"), model, ignore_case=True))
+        for key, (low, high) in (ranges or {}).items():
+            field = ds.field(RANGE_COLUMNS[key])
+            if low is not None:
+                where(field >= low)
+            if high is not None:
+                where(field <= high)
+        return columns, expression
+
+    def read(self, **filters):
+        """
+        Arrow table of archived rows between ``start`` and ``end`` (run dates,
+        inclusive), projected to ``columns``. ``ranges`` takes the query keys
+        of offer_index (monthly, due, msrp, term). Unknown columns raise ValueError.
+        """
+        columns, expression = self._scan_args(**filters)
+        if not os.path.isdir(self.root):
+            return self.schema.empty_table().select(columns)
+        return self.dataset().to_table(columns=columns, filter=expression)
+
+    def iter_batches(self, batch_size: int = 1024, **filters) -> Iterator[Any]:
+        """``read`` as a stream of record batches, for exports that must not hold a whole table."""
+        columns, expression = self._scan_args(**filters)
+        if not os.path.isdir(self.root):
+            return iter(())
+        return self.dataset().to_batches(columns=columns, filter=expression, batch_size=batch_size)
+
+
+def write_parquet(table) -> bytes:
+    _require_arrow()
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="zstd")
+    return sink.getvalue().to_pybytes()
+
+
+def write_arrow(table) -> bytes:
+    """Arrow IPC stream, e.g. for ``pyarrow.ipc.open_stream`` or polars / DuckDB readers."""
+    _require_arrow()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def parse_archive_query(args) -> Dict[str, Any]:
+    """
+    Flask request.args -> keyword arguments for ``OfferArchive.read``.
+    Raises ValueError with a user-facing message on bad input.
+    """
+
+    def listed(name: str) -> List[str]:
+        values = []
+        for raw in args.getlist(name):
+            values.extend(part.strip() for part in raw.split(",") if part.strip())
+        return values
+
+    def day(name: str) -> Optional[date]:
+        raw = args.get(name)
+        if not raw:
+            return None
+        try:
+            return date.fromisoformat(raw)
+        except ValueError:
+            raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+
+    try:
+        run_ids = [int(value) for value in listed("run_id")]
+    except ValueError:
+        raise ValueError("run_id must be an integer")
+
+    return {
+        "columns": listed("columns") or None,
+        "start": day("start"),
+        "end": day("end"),
+        "brands": listed("brand"),
+        "dealerships": listed("dealership"),
+        "model": (args.get("model") or "").strip() or None,
+        "run_ids": run_ids,
+    }
@@ -0,0 +1,82 @@
+"""
+Cold import time of the scraper registry and the app, lazy vs. eager.
+
+    python -m benchmarks.bench_import --repeat 7
+
+Each measurement is a fresh interpreter. "lazy" is ``import registry`` /
+``import app`` as a worker does at startup (dealer metadata only); "eager"
+also loads every scraper, which is what importing registry used to cost
+(scraper modules, requests / cloudscraper / bs4 / playwright). Scrapers
+whose dependencies aren't installed are counted and skipped.
+
+"heavy" lists which of pandas / numpy / pyarrow the import pulled in; the
+app defers them to the first run, query or export that needs them.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+failed = []
+if {eager}:
+    import registry
+    for scraper in registry.SCRAPERS:
+        try:
+            scraper.load()
+        except ImportError as e:
+            failed.append(scraper.dealer_name)
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules),
+    "scraper_modules": sum(name.startswith("scrapers.dealers.") for name in sys.modules),
+    "heavy": [name for name in ("pandas", "numpy", "pyarrow") if name in sys.modules],
+    "failed": failed,
+}}))
+"""
+
+
+def probe(module: str, eager: bool) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, eager=eager)],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--modules", nargs="+", default=["registry", "app"])
+    args = parser.parse_args()
+
+    print(f"{'import':>10}  {'mode':>6}  {'median (ms)':>12}  {'modules':>8}  {'scrapers':>8}  heavy")
+    for module in args.modules:
+        for eager in (False, True):
+            runs = [probe(module, eager) for _ in range(args.repeat)]
+            last = runs[-1]
+            median_ms = statistics.median(run["seconds"] for run in runs) * 1000
+            mode = "eager" if eager else "lazy"
+            heavy = ", ".join(last["heavy"]) or "-"
+            print(
+                f"{module:>10}  {mode:>6}  {median_ms:>12.1f}  {last['modules']:>8}  {last['scraper_modules']:>8}  {heavy}"
+            )
+            if last["failed"]:
+                print(f"{'':>10}  {'':>6}  {len(last['failed'])} scrapers not loaded (missing dependencies)")
+
+
+if __name__ == "__main__":
+    main()
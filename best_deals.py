@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+from model_names import canonical_key
+from results_cache import VersionedCache
+
+
+DEFAULT_TOP = 5
+MAX_TOP = 50
+
+
+def effective_monthly(monthly: np.ndarray, term: np.ndarray, due: np.ndarray) -> np.ndarray:
+    """(Monthly x Term + Due at Signing) / Term; NaN where any input is missing or term <= 0."""
+    import numpy as np
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cost = (monthly * term + due) / term
+    return np.where(term > 0, cost, np.nan)
+
+
+class BestDealIndex:
+    """
+    Dealers ranked by effective monthly cost, per canonical model key
+    (make, model and trim; see model_names).
+
+    Built once per results version: the cost is computed column-wise, each
+    dealer keeps only its cheapest offer per model, and every model gets a
+    ready-to-serve ranking. ``top`` is then a dict lookup and a slice.
+
+    Rows missing Monthly, Term or Due at Signing can't be costed and are
+    left out.
+    """
+
+    def __init__(
+        self,
+        rows: List[Dict[str, Any]],
+        brand_for: Callable[[str], str],
+        is_manual: Callable[[str], bool] = lambda dealer: False,
+        key_for: Callable[[Any], Optional[str]] = canonical_key,
+    ):
+        self.rankings: Dict[str, List[Dict[str, Any]]] = {}
+        self.names: Dict[str, str] = {}
+        self.key_for = key_for
+        if not rows:
+            return
+
+        # Deferred with pandas: the app creates BEST_DEALS at import but builds it after a run
+        import numpy as np
+        import pandas as pd
+
+        frame = pd.DataFrame.from_records(rows)
+
+        def numbers(name: str) -> np.ndarray:
+            if name not in frame.columns:
+                return np.full(len(frame), np.nan)
+            return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+        def text(name: str) -> pd.Series:
+            if name not in frame.columns:
+                return pd.Series([None] * len(frame), dtype=object)
+            return frame[name].where(frame[name].notna(), None)
+
+        monthly, term, due = numbers("Monthly ($)"), numbers("Term (months)"), numbers("Due at Signing ($)")
+        models = text("Model")
+        codes, uniques = pd.factorize(models)
+        keys = np.array([key_for(model) for model in uniques] + [None], dtype=object)[codes]
+
+        deals = pd.DataFrame({
+            "key": keys,
+            "dealership": text("Dealership").fillna("Unknown Dealership"),
+            "model": models,
+            "effective_monthly": effective_monthly(monthly, term, due),
+            "monthly": monthly,
+            "term": term,
+            "due": due,
+            "msrp": numbers("MSRP ($)"),
+            "expires": text("Expires"),
+            "link": text("Dealer Specials Link"),
+        })
+        deals = deals[deals["key"].notna() & np.isfinite(deals["effective_monthly"])]
+        # Cheapest first; ties go to the lower payment due at signing
+        deals = deals.sort_values(["key", "effective_monthly", "due"], kind="stable")
+        deals = deals.drop_duplicates(["key", "dealership"], keep="first")
+
+        for key, group in deals.groupby("key", sort=False):
+            ranking = []
+            for rank, deal in enumerate(group.itertuples(index=False), start=1):
+                ranking.append({
+                    "rank": rank,
+                    "dealership": deal.dealership,
+                    "brand": brand_for(deal.dealership),
+                    "source": "manual" if is_manual(deal.dealership) else "scraped",
+                    "model": deal.model,
+                    "effective_monthly": round(float(deal.effective_monthly), 2),
+                    "monthly": float(deal.monthly),
+                    "term": int(deal.term),
+                    "due_at_signing": float(deal.due),
+                    "msrp": None if np.isnan(deal.msrp) else float(deal.msrp),
+                    "expires": deal.expires,
+                    "link": deal.link,
+                })
+            self.rankings[key] = ranking
+            self.names[key] = ranking[0]["model"]
+
+    def __len__(self) -> int:
+        return len(self.rankings)
+
+    def top(self, model: str, n: int = DEFAULT_TOP) -> Optional[List[Dict[str, Any]]]:
+        """The ``n`` best dealers for ``model``, or None if no costed offer matches it."""
+        ranking = self.rankings.get(self.key_for(model))
+        return None if ranking is None else ranking[:n]
+
+    def leaders(self) -> List[Dict[str, Any]]:
+        """The cheapest offer for every model key, cheapest models first."""
+        best = [{"key": key, **ranking[0]} for key, ranking in self.rankings.items()]
+        return sorted(best, key=lambda deal: deal["effective_monthly"])
+
+
+class BestDealCache(VersionedCache[BestDealIndex]):
+    """Latest ``BestDealIndex`` keyed by results version."""
+
+    def __init__(self, brand_for: Callable[[str], str], is_manual: Callable[[str], bool] = lambda dealer: False):
+        self.brand_for = brand_for
+        self.is_manual = is_manual
+        super().__init__(lambda version, rows: BestDealIndex(rows, brand_for, is_manual))
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from model_names import canonicalize_column
+
+
+# Row columns that identify an offer when a scraper doesn't say otherwise
+DEFAULT_KEYS = ("Dealership", "Model", "Monthly ($)", "Term (months)", "Due at Signing ($)", "Expires")
+# dedup_keys value meaning "every column the scraper returned"
+ALL_COLUMNS = "*"
+
+NUMERIC_COLUMNS = {"Monthly ($)", "Term (months)", "Due at Signing ($)", "MSRP ($)"}
+
+Keys = Union[Sequence[str], str, None]
+
+
+def _normalized(frame: pd.DataFrame, column: str) -> pd.Series:
+    """
+    One fingerprint input: numbers rounded to cents, dates parsed, models by
+    canonical key plus year and drivetrain, text case/space-folded.
+    """
+    if column not in frame.columns:
+        return pd.Series(None, index=frame.index, dtype=object)
+
+    values = frame[column]
+    if column in NUMERIC_COLUMNS:
+        return pd.to_numeric(values, errors="coerce").astype("float64").round(2)
+    if column == "Expires":
+        # "1/5/2026" and "01/05/2026" are the same date
+        return pd.to_datetime(values.astype(object).where(values.notna(), None), errors="coerce", format="mixed")
+    if column == "Model":
+        # The canonical key ignores year and drivetrain; a 2025 AWD and a 2026 FWD RAV4 LE are two offers
+        parsed = canonicalize_column(values)
+        identity = [
+            None if key is None else f"{key}|{'' if pd.isna(year) else int(year)}|{drivetrain or ''}"
+            for key, year, drivetrain in zip(parsed["key"], parsed["year"], parsed["drivetrain"])
+        ]
+        return pd.Series(identity, index=frame.index, dtype=object)
+
+    text = values.astype(object).where(values.notna(), None)
+    codes, uniques = pd.factorize(text, use_na_sentinel=True)
+    folded = [" ".join(str(value).replace("_", " ").split()).casefold() for value in uniques] + [None]
+    return pd.Series(np.array(folded, dtype=object)[codes], index=frame.index, dtype=object)
+
+
+def fingerprints(frame: pd.DataFrame, keys: Keys = DEFAULT_KEYS) -> np.ndarray:
+    """Stable uint64 per row over the normalized ``keys`` columns (all columns for ALL_COLUMNS)."""
+    if keys is None:
+        keys = DEFAULT_KEYS
+    columns = list(frame.columns) if keys == ALL_COLUMNS else list(keys)
+    if frame.empty:
+        return np.empty(0, dtype=np.uint64)
+
+    normalized = pd.DataFrame({column: _normalized(frame, column) for column in columns}, index=frame.index)
+    # Fixed hash key: fingerprints must match across runs and processes
+    return pd.util.hash_pandas_object(normalized, index=False, categorize=True).to_numpy()
+
+
+class RunDeduplicator:
+    """
+    Drops repeated offers as each dealer's rows are published in a run.
+
+    Two passes per frame: within the frame on the scraper's own keys
+    (``dedup_keys``), then against every row already published this run on
+    DEFAULT_KEYS, which is what catches a manual offer repeating a scraped
+    one. Rows already published are never removed; the later copy is.
+    """
+
+    def __init__(self, keys: Sequence[str] = DEFAULT_KEYS):
+        self.keys = tuple(keys)
+        self._seen: set = set()
+
+    def keep_mask(self, frame: pd.DataFrame, keys: Keys = None) -> np.ndarray:
+        """Boolean mask of rows to keep; kept rows count as seen from then on."""
+        if frame.empty:
+            return np.ones(0, dtype=bool)
+
+        keep = ~pd.Series(fingerprints(frame, keys or self.keys)).duplicated().to_numpy()
+        shared = fingerprints(frame, self.keys)
+        keep &= ~np.isin(shared, np.fromiter(self._seen, dtype=np.uint64, count=len(self._seen)))
+
+        self._seen.update(shared[keep].tolist())
+        return keep
+
+    def apply(self, frame: pd.DataFrame, keys: Keys = None) -> Tuple[pd.DataFrame, int]:
+        """(frame without duplicates, number of rows removed)."""
+        keep = self.keep_mask(frame, keys)
+        removed = int(len(keep) - keep.sum())
+        if not removed:
+            return frame, 0
+        return frame[keep].reset_index(drop=True), removed
+
+    def apply_records(self, rows: List[Dict[str, Any]], keys: Keys = None) -> Tuple[List[Dict[str, Any]], int]:
+        """``apply`` for a list of row dicts (e.g. manual offers); kept dicts are returned as-is."""
+        if not rows:
+            return rows, 0
+        keep = self.keep_mask(pd.DataFrame.from_records(rows), keys)
+        return [row for row, kept in zip(rows, keep) if kept], int(len(keep) - keep.sum())
+
+
+def dedup_keys_for(scraper: Any) -> Keys:
+    """The scraper's ``dedup_keys`` (None falls back to DEFAULT_KEYS)."""
+    return getattr(scraper, "dedup_keys", None)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from collections import deque
+from typing import Any, Deque, Iterator, List, Optional, Set, Tuple
+
+
+# Sentinel telling a subscriber it fell behind and must resync
+_OVERFLOW = object()
+
+
+def encode_event(event_id: int, event: str, data: Any) -> bytes:
+    """One text/event-stream frame; data is JSON on a single line."""
+    payload = json.dumps(data, separators=(",", ":"), allow_nan=False)
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class Subscription:
+    def __init__(self, maxsize: int):
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+
+class Broadcaster:
+    """
+    In-process fan-out for server-sent events.
+
+    Every event is encoded once and pushed to each subscriber's bounded
+    queue without blocking the publisher. A subscriber whose queue fills up
+    is cut off with a "resync" event instead of slowing everyone else down.
+    The last ``history`` events are kept so reconnecting clients can resume
+    from their Last-Event-ID.
+    """
+
+    def __init__(self, history: int = 512, client_buffer: int = 256):
+        self.client_buffer = client_buffer
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._history: Deque[Tuple[int, bytes]] = deque(maxlen=history)
+        self._subscribers: Set[Subscription] = set()
+
+    @property
+    def last_id(self) -> int:
+        with self._lock:
+            return self._last_id
+
+    def publish(self, event: str, data: Any) -> int:
+        with self._lock:
+            self._last_id += 1
+            frame = encode_event(self._last_id, event, data)
+            self._history.append((self._last_id, frame))
+            subscribers = list(self._subscribers)
+            event_id = self._last_id
+
+        for sub in subscribers:
+            if sub.overflowed:
+                continue
+            try:
+                sub.queue.put_nowait(frame)
+            except queue.Full:
+                sub.overflowed = True
+                # Make room so the subscriber sees why it is being dropped
+                try:
+                    sub.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                sub.queue.put_nowait(_OVERFLOW)
+        return event_id
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Tuple[Subscription, List[bytes]]:
+        """
+        Register a subscriber and return the frames it missed since
+        ``last_event_id``. If those are no longer in the history, a single
+        "resync" frame is returned instead.
+        """
+        sub = Subscription(self.client_buffer)
+        with self._lock:
+            self._subscribers.add(sub)
+            if last_event_id is None or last_event_id >= self._last_id:
+                return sub, []
+
+            oldest = self._history[0][0] if self._history else self._last_id + 1
+            if last_event_id + 1 < oldest:
+                return sub, [encode_event(self._last_id, "resync", {})]
+
+            return sub, [frame for event_id, frame in self._history if event_id > last_event_id]
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def stream(self, last_event_id: Optional[int] = None, keepalive: float = 15.0) -> Iterator[bytes]:
+        """Generator for a streaming response; unsubscribes when the client goes away."""
+        sub, backlog = self.subscribe(last_event_id)
+        try:
+            # Tell the browser how long to wait before reconnecting
+            yield b"retry: 3000\n\n"
+            for frame in backlog:
+                yield frame
+
+            while True:
+                try:
+                    frame = sub.queue.get(timeout=keepalive)
+                except queue.Empty:
+                    yield b": keepalive\n\n"
+                    continue
+
+                if frame is _OVERFLOW:
+                    yield encode_event(self.last_id, "resync", {})
+                    return
+                yield frame
+        finally:
+            self.unsubscribe(sub)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import csv
+import io
+import os
+import tempfile
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List
+
+from validation import ISSUE_COLUMNS, normalize_frame_fields, validate_frame
+
+try:
+    import xlsxwriter
+except ImportError:  # pragma: no cover - optional
+    xlsxwriter = None
+
+
+EXPORT_COLUMNS = [
+    "Dealership",
+    "Model",
+    "Monthly ($)",
+    "Due at Signing ($)",
+    "Term (months)",
+    "MSRP ($)",
+    "Expires",
+    "Dealer Specials Link",
+]
+HEADER = EXPORT_COLUMNS + ["Row Status", "Issues"]
+
+CHUNK_ROWS = 1000
+FILE_BLOCK = 64 * 1024
+
+# Archive column -> export column, for historical runs
+ARCHIVE_COLUMNS = {
+    "dealership": "Dealership",
+    "model": "Model",
+    "monthly": "Monthly ($)",
+    "due_at_signing": "Due at Signing ($)",
+    "term_months": "Term (months)",
+    "msrp": "MSRP ($)",
+    "expires": "Expires",
+    "link": "Dealer Specials Link",
+}
+
+
+def available_formats() -> List[str]:
+    return ["csv"] + (["xlsx"] if xlsxwriter is not None else [])
+
+
+def chunked(rows: Iterable[Dict[str, Any]], size: int = CHUNK_ROWS) -> Iterator[List[Dict[str, Any]]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def archive_chunks(batches: Iterable[Any]) -> Iterator[List[Dict[str, Any]]]:
+    """Archive record batches -> chunks of rows keyed like scraped rows."""
+    for batch in batches:
+        yield [
+            {ARCHIVE_COLUMNS[name]: value for name, value in row.items() if name in ARCHIVE_COLUMNS}
+            for row in batch.to_pylist()
+        ]
+
+
+def export_rows(chunks: Iterable[List[Dict[str, Any]]], run_date: date) -> Iterator[List[List[Any]]]:
+    """
+    Export rows (HEADER order) chunk by chunk, with the row status and
+    issues validate_row would report for ``run_date``. validate_frame runs
+    once per chunk, so memory stays bounded by the chunk size.
+    """
+    for chunk in chunks:
+        validated = validate_frame(normalize_frame_fields(chunk), run_date)
+        statuses = validated["row_status"].tolist()
+        flags = validated[ISSUE_COLUMNS].to_numpy()
+        out = []
+        for row, status, row_flags in zip(chunk, statuses, flags):
+            issues = "; ".join(issue for issue, flagged in zip(ISSUE_COLUMNS, row_flags) if flagged)
+            out.append([_cell(row.get(column)) for column in EXPORT_COLUMNS] + [status, issues])
+        yield out
+
+
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value != value:
+        return ""
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(rows: Iterable[List[List[Any]]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADER)
+    for chunk in rows:
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header only, for an empty export
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_xlsx(rows: Iterable[List[List[Any]]], sheet: str = "Offers") -> Iterator[bytes]:
+    """
+    An XLSX is a zip and can't be written front to back over the wire, so
+    xlsxwriter's constant_memory mode flushes each row to a temp file and
+    the finished workbook is streamed from disk in blocks.
+    """
+    fd, path = tempfile.mkstemp(prefix="offers-", suffix=".xlsx")
+    os.close(fd)
+    try:
+        workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+        worksheet = workbook.add_worksheet(sheet)
+        worksheet.write_row(0, 0, HEADER)
+        line = 1
+        for chunk in rows:
+            for row in chunk:
+                worksheet.write_row(line, 0, row)
+                line += 1
+        workbook.close()
+
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(FILE_BLOCK)
+                if not block:
+                    break
+                yield block
+    finally:
+        os.remove(path)
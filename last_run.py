@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from results_cache import encode_json
+
+
+FORMAT_VERSION = 1
+
+
+def save_last_run(
+    path: str,
+    rows: List[Dict[str, Any]],
+    monitor: Dict[str, Any],
+    run_id: Optional[int] = None,
+    finished_at: Optional[datetime] = None,
+) -> None:
+    """
+    Write a completed run as one gzip-compressed JSON document.
+
+    The file is written to a temp file in the same directory and renamed
+    into place, so a crash mid-write never leaves a truncated snapshot.
+    """
+    document = {
+        "format": FORMAT_VERSION,
+        "run_id": run_id,
+        "finished_at": (finished_at or datetime.utcnow()).replace(microsecond=0).isoformat(),
+        "rows": rows,
+        "monitor": monitor,
+    }
+    # Fast compression: this runs at the end of every scrape
+    data = gzip.compress(encode_json(document), compresslevel=3, mtime=0)
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".last_run-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_last_run(path: str) -> Optional[Dict[str, Any]]:
+    """The saved document, or None if there is none (or it is unreadable / from another format)."""
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            document = json.loads(gzip.decompress(f.read()))
+    except Exception as e:
+        print(f"[ERROR] Last run load failed: {path}: {e}")
+        return None
+
+    if not isinstance(document, dict) or document.get("format") != FORMAT_VERSION:
+        return None
+    if not isinstance(document.get("rows"), list):
+        return None
+    return document
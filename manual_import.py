@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import csv
+import io
+import re
+from datetime import date
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from manual_offers_repo import ID_KEY
+from validation import ISSUE_COLUMNS, REQUIRED_ISSUES, normalize_frame_fields, validate_frame
+
+
+BATCH_ROWS = 500
+
+# Folded CSV header -> manual offer key ("Monthly ($)" and "monthly" both fold to "monthly")
+HEADER_ALIASES = {
+    "dealership": "Dealership",
+    "dealer": "Dealership",
+    "dealer specials link": "Dealer Specials Link",
+    "specials link": "Dealer Specials Link",
+    "offer link": "Dealer Specials Link",
+    "link": "Dealer Specials Link",
+    "url": "Dealer Specials Link",
+    "model": "Model",
+    "monthly": "Monthly ($)",
+    "monthly payment": "Monthly ($)",
+    "term": "Term (months)",
+    "term months": "Term (months)",
+    "due at signing": "Due at Signing ($)",
+    "due": "Due at Signing ($)",
+    "msrp": "MSRP ($)",
+    "expires": "Expires",
+    "expiration": "Expires",
+    "offer id": ID_KEY,
+    "id": ID_KEY,
+}
+
+# Same empty markers ToyotaBaseScraper.normalize_df treats as missing
+_EMPTY_TEXT = {"", "—", "N/A", "None", "nan"}
+_HEADER_RE = re.compile(r"[^a-z0-9]+")
+
+_DEALERSHIP_MISSING = "dealership is required"
+
+
+def fold_header(header: str) -> str:
+    return _HEADER_RE.sub(" ", (header or "").casefold()).strip()
+
+
+def column_map(fieldnames: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+    """(CSV header -> offer key, headers that match nothing). The first header for a key wins."""
+    mapping: Dict[str, str] = {}
+    ignored = []
+    for header in fieldnames:
+        key = HEADER_ALIASES.get(fold_header(header))
+        if key is None or key in mapping.values():
+            ignored.append(header)
+        else:
+            mapping[header] = key
+    return mapping, ignored
+
+
+def read_csv(stream: BinaryIO, encoding: str = "utf-8-sig") -> Tuple[Iterator[Tuple[int, Dict[str, Any]]], List[str]]:
+    """
+    Offers from an uploaded CSV, one at a time: ((line number, offer) iterator,
+    ignored headers). The upload is decoded as it's read, never held whole.
+    Raises ValueError if there is no header row or no Model column.
+    """
+    text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+    reader = csv.DictReader(text)
+    if not reader.fieldnames:
+        raise ValueError("CSV has no header row")
+
+    mapping, ignored = column_map(reader.fieldnames)
+    if "Model" not in mapping.values():
+        raise ValueError("CSV needs at least a Model column")
+
+    def offers() -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for record in reader:
+            offer = {}
+            for header, key in mapping.items():
+                value = (record.get(header) or "").strip()
+                offer[key] = None if value in _EMPTY_TEXT else value
+            yield reader.line_num, offer
+
+    return offers(), ignored
+
+
+def _number(value: Any) -> Optional[float]:
+    return None if pd.isna(value) else float(value)
+
+
+def _expires(parsed: Optional[date], raw: Any) -> Any:
+    # Same M/D/YYYY the scrapers publish; unparseable text is kept so validation keeps flagging it
+    return f"{parsed.month}/{parsed.day}/{parsed.year}" if parsed is not None else raw
+
+
+def validate_offers(
+    records: Iterable[Tuple[int, Dict[str, Any]]],
+    run_date: date,
+    default_dealership: Optional[str] = None,
+    batch_size: int = BATCH_ROWS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    One result per offer: line, typed offer, row_status, errors and warnings
+    (validate_row's messages). Offers are validated ``batch_size`` at a time
+    with validate_frame, whose normalized columns double as the coerced
+    values: money as floats, term as an int, expiry as M/D/YYYY.
+    """
+    batch: List[Tuple[int, Dict[str, Any]]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield from _validate_batch(batch, run_date, default_dealership)
+            batch = []
+    if batch:
+        yield from _validate_batch(batch, run_date, default_dealership)
+
+
+def _validate_batch(
+    batch: List[Tuple[int, Dict[str, Any]]],
+    run_date: date,
+    default_dealership: Optional[str],
+) -> Iterator[Dict[str, Any]]:
+    raw = [offer for _, offer in batch]
+    validated = validate_frame(normalize_frame_fields(raw), run_date)
+    flags = validated[ISSUE_COLUMNS].to_numpy()
+    statuses = validated["row_status"].tolist()
+    columns = {
+        name: validated[name].to_numpy(dtype=object)
+        for name in ("model", "monthly", "due_at_signing", "msrp", "term_months", "expires")
+    }
+
+    for i, (line, offer) in enumerate(batch):
+        issues = [issue for issue, flagged in zip(ISSUE_COLUMNS, flags[i]) if flagged]
+        term = columns["term_months"][i]
+        typed = {
+            "Dealership": offer.get("Dealership") or default_dealership,
+            "Dealer Specials Link": offer.get("Dealer Specials Link"),
+            "Model": columns["model"][i],
+            "Monthly ($)": _number(columns["monthly"][i]),
+            "Term (months)": None if pd.isna(term) else int(term),
+            "Due at Signing ($)": _number(columns["due_at_signing"][i]),
+            "MSRP ($)": _number(columns["msrp"][i]),
+            "Expires": _expires(columns["expires"][i], offer.get("Expires")),
+        }
+        if offer.get(ID_KEY):
+            typed[ID_KEY] = offer[ID_KEY]
+
+        errors = [issue for issue in issues if issue in REQUIRED_ISSUES]
+        status = statuses[i]
+        if not typed["Dealership"]:
+            errors.append(_DEALERSHIP_MISSING)
+            status = "INVALID_REQUIRED"
+
+        yield {
+            "line": line,
+            "offer": typed,
+            "row_status": status,
+            "errors": errors,
+            "warnings": [issue for issue in issues if issue not in REQUIRED_ISSUES],
+        }
+
+
+def summarize(results: Iterable[Dict[str, Any]]) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    (accepted offers by dealership, report). Rows with errors are rejected;
+    rows with only warnings are imported and listed with them.
+    """
+    accepted: Dict[str, List[Dict[str, Any]]] = {}
+    report: Dict[str, Any] = {"rows": 0, "imported": 0, "rejected": 0, "issues": []}
+
+    for result in results:
+        report["rows"] += 1
+        if result["errors"]:
+            report["rejected"] += 1
+        else:
+            report["imported"] += 1
+            accepted.setdefault(result["offer"]["Dealership"], []).append(result["offer"])
+
+        if result["errors"] or result["warnings"]:
+            report["issues"].append({
+                "line": result["line"],
+                "model": result["offer"]["Model"],
+                "row_status": result["row_status"],
+                "errors": result["errors"],
+                "warnings": result["warnings"],
+            })
+
+    report["dealers"] = {dealer: len(offers) for dealer, offers in accepted.items()}
+    return accepted, report
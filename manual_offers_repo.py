@@ -0,0 +1,484 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from model_names import canonical_key, canonicalize
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - optional
+    fcntl = None
+
+
+Rows = List[Dict[str, Any]]
+
+# Per-offer identifier, stored in each offer of the dealership file
+ID_KEY = "Offer ID"
+
+
+def natural_key(offer: Dict[str, Any]) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+    """(canonical model, model year, term): what identifies an offer within one dealership when it has no ID."""
+    model = offer.get("Model")
+    key = canonical_key(model)
+    if key is None:
+        return None
+    try:
+        term = int(float(str(offer.get("Term (months)")).replace(",", "")))
+    except (ValueError, OverflowError):
+        term = None
+    return key, canonicalize(model).year, term
+
+
+def assign_ids(offers: Rows) -> Rows:
+    """
+    Give offers without an ID one derived from their content, so files
+    written before IDs existed get the same IDs on every read (the store
+    persists them on the file's next write).
+    """
+    seen: Dict[str, int] = {}
+    for offer in offers:
+        if offer.get(ID_KEY):
+            continue
+        digest = hashlib.sha1(json.dumps(offer, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
+        seen[digest] = seen.get(digest, 0) + 1
+        offer[ID_KEY] = digest if seen[digest] == 1 else f"{digest}-{seen[digest]}"
+    return offers
+
+
+class ManualOfferFile:
+    """One parsed ``<dealership>.json``: its stat signature, normalized rows, and load error if any."""
+
+    __slots__ = ("filename", "signature", "rows", "error", "_health")
+
+    def __init__(self, filename: str, signature: Tuple[int, int], rows: Rows, error: Optional[str] = None):
+        self.filename = filename
+        self.signature = signature
+        self.rows = rows
+        self.error = error
+        self._health: Optional[Tuple[date, Dict[str, Any]]] = None
+
+    def health(self, run_date: date) -> Dict[str, Any]:
+        """compute_frame_health for the file's rows; recomputed only when the day changes (expiry checks)."""
+        if self._health is None or self._health[0] != run_date:
+            from validation import compute_frame_health, normalize_frame_fields, validate_frame
+
+            validated = validate_frame(normalize_frame_fields(self.rows), run_date)
+            self._health = (run_date, compute_frame_health(validated))
+        return self._health[1]
+
+
+class ManualOffersRepository:
+    """
+    Manual offers from ``directory`` (one JSON list per dealership), parsed
+    once per file version.
+
+    A file is re-read only when its (mtime_ns, size) changes, so a refresh
+    is one ``scandir`` of stat calls. ``rows`` refreshes on read unless a
+    watcher is running (``watch``), in which case it is served straight
+    from memory; writers call ``invalidate`` so a save shows up at once.
+
+    ``normalize`` turns one file's raw rows into published rows (the
+    scrapers' type coercion); a file that fails to parse or normalize keeps
+    its error and contributes no rows.
+    """
+
+    def __init__(self, directory: str, normalize: Callable[[Rows], Rows] = lambda rows: rows):
+        self.directory = directory
+        self.normalize = normalize
+        self._lock = threading.Lock()
+        self._files: Dict[str, ManualOfferFile] = {}
+        self._rows: Rows = []
+        self._watcher: Optional[threading.Thread] = None
+        # Serializes watch / stop: every request thread may call watch() after a fork
+        self._watch_lock = threading.Lock()
+        self._stop = threading.Event()
+        # Bumped whenever the served rows change
+        self.version = 0
+        self.loads = 0
+
+    # ---------------- loading ----------------
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        if not os.path.isdir(self.directory):
+            return {}
+        signatures = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                signatures[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def _load(self, filename: str, signature: Tuple[int, int]) -> ManualOfferFile:
+        self.loads += 1
+        path = os.path.join(self.directory, filename)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                offers = json.load(f)
+        except Exception as e:
+            print(f"[ERROR] Manual offers load failed: {filename}: {e}")
+            return ManualOfferFile(filename, signature, [], str(e))
+
+        if not isinstance(offers, list):
+            return ManualOfferFile(filename, signature, [], "expected a list of offers")
+
+        dealership = os.path.splitext(filename)[0]
+        # IDs from the offers as stored, so they match what ManualOfferStore derives
+        rows = assign_ids([dict(offer) for offer in offers if isinstance(offer, dict)])
+        for row in rows:
+            row.setdefault("Dealership", dealership)
+
+        try:
+            rows = self.normalize(rows) if rows else rows
+        except Exception as e:
+            print(f"[ERROR] Manual offers normalize failed: {filename}: {e}")
+            return ManualOfferFile(filename, signature, [], str(e))
+        return ManualOfferFile(filename, signature, rows)
+
+    def refresh(self) -> bool:
+        """Reload changed files and drop deleted ones. Returns True if the served rows changed."""
+        with self._lock:
+            signatures = self._scan()
+            changed = set(self._files) - set(signatures)
+            files = {}
+            for filename, signature in sorted(signatures.items()):
+                cached = self._files.get(filename)
+                if cached is not None and cached.signature == signature:
+                    files[filename] = cached
+                else:
+                    files[filename] = self._load(filename, signature)
+                    changed.add(filename)
+
+            if not changed:
+                return False
+            self._files = files
+            self._rows = [row for entry in files.values() for row in entry.rows]
+            self.version += 1
+            return True
+
+    def invalidate(self, filename: Optional[str] = None) -> None:
+        """Forget ``filename`` (or everything) and reload from disk; call after writing a file."""
+        with self._lock:
+            # A signature no stat matches: reloaded if still there, dropped if deleted
+            for name, entry in self._files.items():
+                if filename is None or name == filename:
+                    entry.signature = (-1, -1)
+        self.refresh()
+
+    # ---------------- reading ----------------
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def rows(self) -> Rows:
+        """Every manual offer, as a new list (the row dicts are shared; don't mutate them)."""
+        if not self.watching:
+            self.refresh()
+        with self._lock:
+            return self._rows[:]
+
+    def snapshot(self) -> Tuple[int, Rows]:
+        """(version, rows), read together."""
+        if not self.watching:
+            self.refresh()
+        with self._lock:
+            return self.version, self._rows[:]
+
+    def entries(self) -> Tuple[int, List[ManualOfferFile]]:
+        """(version, parsed files)."""
+        if not self.watching:
+            self.refresh()
+        with self._lock:
+            return self.version, list(self._files.values())
+
+    def files(self, run_date: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Per-file summary: row count, load error and validation health."""
+        if not self.watching:
+            self.refresh()
+        run_date = run_date or date.today()
+        with self._lock:
+            entries = list(self._files.values())
+        return [
+            {
+                "filename": entry.filename,
+                "rows": len(entry.rows),
+                "error": entry.error,
+                "health": None if entry.error else entry.health(run_date),
+            }
+            for entry in entries
+        ]
+
+    # ---------------- watching ----------------
+
+    def watch(self, interval: float = 2.0) -> None:
+        """Poll the directory's stat signatures every ``interval`` seconds on a daemon thread."""
+        with self._watch_lock:
+            if self.watching:
+                return
+            self._stop.clear()
+            self.refresh()
+
+            def loop():
+                while not self._stop.wait(interval):
+                    try:
+                        self.refresh()
+                    except Exception as e:
+                        print(f"[ERROR] Manual offers watch failed: {e}")
+
+            self._watcher = threading.Thread(target=loop, name="manual-offers-watch", daemon=True)
+            self._watcher.start()
+
+    def stop(self) -> None:
+        with self._watch_lock:
+            self._stop.set()
+            if self._watcher is not None:
+                self._watcher.join(timeout=5)
+            self._watcher = None
+
+
+class ManualOfferIndex:
+    """Manual offers by ID, by dealership and by canonical model key (see model_names)."""
+
+    def __init__(self, entries: List[ManualOfferFile]):
+        self.by_id: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self.by_dealership: Dict[str, List[str]] = {}
+        self.by_model: Dict[str, List[str]] = {}
+
+        for entry in entries:
+            for row in entry.rows:
+                offer_id = row.get(ID_KEY)
+                if not offer_id:
+                    continue
+                self.by_id[offer_id] = (entry.filename, row)
+                dealership = str(row.get("Dealership") or "").casefold()
+                self.by_dealership.setdefault(dealership, []).append(offer_id)
+                key = canonical_key(row.get("Model"))
+                if key is not None:
+                    self.by_model.setdefault(key, []).append(offer_id)
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def get(self, offer_id: str) -> Optional[Dict[str, Any]]:
+        found = self.by_id.get(offer_id)
+        return None if found is None else found[1]
+
+    def filename(self, offer_id: str) -> Optional[str]:
+        found = self.by_id.get(offer_id)
+        return None if found is None else found[0]
+
+    def find(self, dealership: Optional[str] = None, model: Optional[str] = None) -> Rows:
+        """Offers for ``dealership`` (case-insensitive) and/or any title of the same canonical ``model``."""
+        ids: Optional[List[str]] = None
+        if dealership:
+            ids = self.by_dealership.get(dealership.strip().casefold(), [])
+        if model:
+            matching = self.by_model.get(canonical_key(model), [])
+            if ids is None:
+                ids = matching
+            else:
+                wanted = set(matching)
+                ids = [offer_id for offer_id in ids if offer_id in wanted]
+        if ids is None:
+            ids = list(self.by_id)
+        return [self.by_id[offer_id][1] for offer_id in ids]
+
+
+class ManualOfferStore:
+    """
+    Row-level writes to the manual offers directory behind a
+    ManualOffersRepository.
+
+    Each edit is a read-modify-write of the one dealership file it touches,
+    under a per-file lock (a thread lock, plus ``flock`` on a sidecar lock
+    file so several worker processes serialize too). The file is re-read
+    inside the lock, so concurrent edits to different offers don't drop
+    each other, and written to a temp file that is fsynced and renamed over
+    the original: readers see the old file or the new one, never a torn one.
+    """
+
+    def __init__(self, repository: ManualOffersRepository):
+        self.repository = repository
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._index: Optional[Tuple[int, ManualOfferIndex]] = None
+
+    @property
+    def directory(self) -> str:
+        return self.repository.directory
+
+    @staticmethod
+    def filename_for(dealership: str) -> str:
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in dealership.strip())
+        return f"{safe_name}.json"
+
+    def index(self) -> ManualOfferIndex:
+        """Index over the repository's current rows, rebuilt when its version changes."""
+        version, entries = self.repository.entries()
+        cached = self._index
+        if cached is None or cached[0] != version:
+            cached = (version, ManualOfferIndex(entries))
+            self._index = cached
+        return cached[1]
+
+    # ---------------- writing ----------------
+
+    @contextmanager
+    def _locked(self, filename: str) -> Iterator[None]:
+        with self._locks_guard:
+            lock = self._locks.setdefault(filename, threading.Lock())
+        with lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, f".{filename}.lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, filename: str) -> Rows:
+        path = os.path.join(self.directory, filename)
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            offers = json.load(f)
+        if not isinstance(offers, list):
+            raise ValueError(f"{filename} is not a list of offers")
+        return assign_ids([dict(offer) for offer in offers if isinstance(offer, dict)])
+
+    def _write(self, filename: str, offers: Rows) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, filename)
+        # Dot-prefixed, non-.json name: the repository scan never picks up a half-written temp file
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{filename}-", suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(offers, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _edit(self, filename: str, change: Callable[[Rows], Rows]) -> Rows:
+        with self._locked(filename):
+            offers = change(self._read(filename))
+            if offers:
+                self._write(filename, offers)
+            elif os.path.exists(os.path.join(self.directory, filename)):
+                os.remove(os.path.join(self.directory, filename))
+        self.repository.invalidate(filename)
+        return offers
+
+    def upsert(self, dealership: str, offer: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Update the offer with ``offer``'s ID (fields given replace the stored
+        ones), or add it under a new ID. Returns (offer ID, created).
+        """
+        return self.upsert_many(dealership, [offer])[0]
+
+    def upsert_many(self, dealership: str, offers: Rows, match_natural_key: bool = False) -> List[Tuple[str, bool]]:
+        """
+        ``upsert`` for several offers of one dealership, in a single write of
+        its file. With ``match_natural_key``, an offer without an ID updates
+        the stored offer with the same natural_key (if any) instead of being
+        added, so loading the same rows twice doesn't duplicate them.
+        """
+        offers = [{key: value for key, value in offer.items() if key != "Dealership"} for offer in offers]
+        unidentified = set()
+        for offer in offers:
+            if not offer.get(ID_KEY):
+                offer[ID_KEY] = uuid.uuid4().hex[:12]
+                unidentified.add(offer[ID_KEY])
+        filename = self.filename_for(dealership)
+        created = {offer[ID_KEY]: True for offer in offers}
+
+        index = self.index()
+        moved: Dict[str, set] = {}
+        for offer_id in created:
+            previous = index.filename(offer_id)
+            if previous is not None and previous != filename:
+                moved.setdefault(previous, set()).add(offer_id)
+
+        # Dealership changed: start from the offer as stored in its old file, so
+        # a partial body only replaces the fields it names
+        carried: Dict[str, Dict[str, Any]] = {}
+        for previous, ids in moved.items():
+            with self._locked(previous):
+                carried.update({o[ID_KEY]: o for o in self._read(previous) if o.get(ID_KEY) in ids})
+
+        def change(stored: Rows) -> Rows:
+            positions = {existing.get(ID_KEY): i for i, existing in enumerate(stored)}
+            natural = {}
+            if match_natural_key:
+                for i, existing in enumerate(stored):
+                    if natural_key(existing) is not None:
+                        natural.setdefault(natural_key(existing), i)
+            for offer in offers:
+                if offer[ID_KEY] in unidentified and natural_key(offer) in natural:
+                    # Reuse the stored offer's ID; the caller sees it in the result
+                    del created[offer[ID_KEY]]
+                    offer[ID_KEY] = stored[natural[natural_key(offer)]][ID_KEY]
+                    created[offer[ID_KEY]] = False
+                position = positions.get(offer[ID_KEY])
+                if position is None:
+                    positions[offer[ID_KEY]] = len(stored)
+                    if match_natural_key and natural_key(offer) is not None:
+                        natural.setdefault(natural_key(offer), len(stored))
+                    base = {key: value for key, value in carried.get(offer[ID_KEY], {}).items() if key != "Dealership"}
+                    stored.append({"Dealership": dealership, **base, **offer})
+                else:
+                    stored[position].update(offer)
+                    stored[position]["Dealership"] = dealership
+                    created[offer[ID_KEY]] = False
+            return stored
+
+        self._edit(filename, change)
+        for previous, ids in moved.items():
+            self._edit(previous, lambda stored, ids=ids: [o for o in stored if o.get(ID_KEY) not in ids])
+            for offer_id in ids:
+                created[offer_id] = False
+        return [(offer[ID_KEY], created[offer[ID_KEY]]) for offer in offers]
+
+    def delete(self, offer_id: str) -> bool:
+        """Remove one offer; False if no file has it. A dealership's last offer takes its file with it."""
+        filename = self.index().filename(offer_id)
+        if filename is None:
+            return False
+
+        removed = False
+
+        def change(offers: Rows) -> Rows:
+            nonlocal removed
+            kept = [offer for offer in offers if offer.get(ID_KEY) != offer_id]
+            removed = len(kept) != len(offers)
+            return kept
+
+        self._edit(filename, change)
+        return removed
+
+    def replace(self, dealership: str, offers: Rows) -> List[str]:
+        """Replace a dealership's offers wholesale (the manual offers page's save). Returns their IDs."""
+        written = self._edit(
+            self.filename_for(dealership),
+            lambda _: assign_ids([dict(offer) for offer in offers if isinstance(offer, dict)]),
+        )
+        return [offer[ID_KEY] for offer in written]
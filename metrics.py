@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from flask import make_response
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers sub-millisecond lock waits up to multi-minute Playwright runs
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 500_000, 1_000_000, 5_000_000, 20_000_000)
+ROW_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500)
+
+_METRICS: List["_Metric"] = []
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Each metric has its own lock, held only for the dict update
+        self._lock = threading.Lock()
+        _METRICS.append(self)
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        lines = self._header()
+        for key, value in sorted(values):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = [(key, list(counts), total) for key, (counts, total) in self._series.items()]
+
+        lines = self._header()
+        for key, counts, total in sorted(snapshot):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def render_metrics() -> str:
+    """Every registered metric in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for metric in list(_METRICS):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ---------------- SCRAPER METRICS ----------------
+
+DEALER_DURATION = Histogram(
+    "scrape_dealer_duration_seconds", "Wall-clock time to scrape one dealer.", ["dealer"]
+)
+DEALER_ROWS = Histogram(
+    "scrape_dealer_rows", "Rows returned by one dealer scrape.", ["dealer"], buckets=ROW_BUCKETS
+)
+DEALER_STAGE_DURATION = Histogram(
+    "scrape_stage_duration_seconds", "Time spent per scrape stage, across dealers.", ["stage"]
+)
+DEALER_BYTES = Counter(
+    "scrape_dealer_downloaded_bytes_total", "Bytes downloaded or rendered per dealer.", ["dealer"]
+)
+DEALER_RESULTS = Counter(
+    "scrape_dealer_results_total", "Dealer scrape outcomes by monitor status.", ["dealer", "status"]
+)
+DEALER_DUPLICATES = Counter(
+    "scrape_dealer_duplicates_removed_total", "Duplicate rows dropped before publishing, per dealer.", ["dealer"]
+)
+DEALER_EXCEPTIONS = Counter(
+    "scrape_dealer_exceptions_total", "Exceptions raised by dealer scrapers.", ["dealer", "exception"]
+)
+RUN_DURATION = Histogram("scrape_run_duration_seconds", "Wall-clock time of a full scrape run.")
+RUN_ROWS = Gauge("scrape_run_rows", "Rows published by the most recent scrape run.")
+
+# ---------------- API METRICS ----------------
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time spent building API responses.", ["endpoint", "status"]
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "Size of API response bodies.", ["endpoint"], buckets=SIZE_BUCKETS
+)
+LOCK_WAIT = Histogram(
+    "scrape_lock_wait_seconds",
+    "Time spent waiting to acquire SCRAPE_LOCK.",
+    ["lock"],
+    buckets=(0.00001, 0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+)
+
+
+def record_dealer_metrics(dealer: str, entry: Dict[str, Any], exc: Optional[BaseException] = None) -> None:
+    """Fold one scraper monitor entry into the dealer metrics."""
+    DEALER_RESULTS.inc(dealer=dealer, status=entry.get("status") or "FAIL")
+    if exc is not None:
+        DEALER_EXCEPTIONS.inc(dealer=dealer, exception=type(exc).__name__)
+    else:
+        DEALER_ROWS.observe(entry.get("total_rows") or 0, dealer=dealer)
+
+    if entry.get("duration_s") is not None:
+        DEALER_DURATION.observe(entry["duration_s"], dealer=dealer)
+    for stage, seconds in (entry.get("timings") or {}).items():
+        if seconds:
+            DEALER_STAGE_DURATION.observe(seconds, stage=stage)
+    if entry.get("bytes_downloaded"):
+        DEALER_BYTES.inc(entry["bytes_downloaded"], dealer=dealer)
+    if entry.get("duplicates_removed"):
+        DEALER_DUPLICATES.inc(entry["duplicates_removed"], dealer=dealer)
+
+
+def observe_request(endpoint: str):
+    """Decorator: record latency and body size for a Flask view."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            response = make_response(view(*args, **kwargs))
+            REQUEST_DURATION.observe(
+                time.perf_counter() - started, endpoint=endpoint, status=response.status_code
+            )
+            if not response.is_streamed:
+                RESPONSE_SIZE.observe(response.calculate_content_length() or 0, endpoint=endpoint)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+class TimedLock:
+    """threading.Lock that reports how long callers waited to acquire it."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        started = time.perf_counter()
+        acquired = self._lock.acquire(blocking, timeout)
+        LOCK_WAIT.observe(time.perf_counter() - started, lock=self.name)
+        return acquired
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
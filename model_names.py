@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+_CACHE_SIZE = 8192
+
+MAKES = {
+    "toyota": "Toyota",
+    "mercedes-benz": "Mercedes-Benz",
+    "mercedes benz": "Mercedes-Benz",
+    "mercedes": "Mercedes-Benz",
+    "mb": "Mercedes-Benz",
+}
+
+# Canonical model name -> spellings seen in scraped titles (compared without spaces / hyphens)
+MODELS = {
+    "Toyota": {
+        "4Runner": ["4runner"],
+        "bZ": ["bz"],
+        "bZ4X": ["bz4x"],
+        "C-HR": ["chr"],
+        "Camry": ["camry"],
+        "Corolla": ["corolla"],
+        "Corolla Cross": ["corolla cross"],
+        "Corolla Hatchback": ["corolla hatchback"],
+        "Crown": ["crown"],
+        "Crown Signia": ["crown signia"],
+        "GR Corolla": ["gr corolla"],
+        # Bare "86" only once the make is known (see _ModelIndex)
+        "GR86": ["gr86", "86"],
+        "Grand Highlander": ["grand highlander"],
+        "GR Supra": ["gr supra", "supra"],
+        "Highlander": ["highlander"],
+        "Land Cruiser": ["land cruiser"],
+        "Mirai": ["mirai"],
+        "Prius": ["prius"],
+        "Prius Prime": ["prius prime"],
+        "RAV4": ["rav4"],
+        "RAV4 Prime": ["rav4 prime"],
+        "Sequoia": ["sequoia"],
+        "Sienna": ["sienna"],
+        "Tacoma": ["tacoma"],
+        "Tundra": ["tundra"],
+        "Venza": ["venza"],
+    },
+    "Mercedes-Benz": {
+        "A-Class": ["a-class", "a"],
+        "AMG GT": ["amg gt"],
+        "C-Class": ["c-class", "c"],
+        "CLA": ["cla", "cla-class"],
+        "CLE": ["cle", "cle-class"],
+        "E-Class": ["e-class", "e"],
+        "EQB": ["eqb"],
+        "EQE": ["eqe"],
+        "EQE SUV": ["eqe suv"],
+        "EQS": ["eqs"],
+        "EQS SUV": ["eqs suv"],
+        "G-Class": ["g-class", "g"],
+        "GLA": ["gla"],
+        "GLB": ["glb"],
+        "GLC": ["glc"],
+        "GLC Coupe": ["glc coupe"],
+        "GLE": ["gle"],
+        "GLE Coupe": ["gle coupe"],
+        "GLS": ["gls"],
+        "S-Class": ["s-class", "s"],
+        "SL": ["sl"],
+        "Sprinter": ["sprinter"],
+    },
+}
+
+DRIVETRAINS = {
+    "awd": "AWD",
+    "fwd": "FWD",
+    "rwd": "RWD",
+    "2wd": "2WD",
+    "4x2": "2WD",
+    "4wd": "4WD",
+    "4x4": "4WD",
+    "4matic": "4MATIC",
+    "4matic+": "4MATIC",
+}
+
+# Marketing and filler words in titles that are not part of the trim
+NOISE = {
+    "new", "used", "certified", "lease", "special", "offer", "model", "the", "for",
+    "of", "with", "per", "month", "mo", "from", "starting",
+}
+# Also filler, unless a model number follows: "Lease a 2025 Corolla" vs "A 220"
+ARTICLES = {"a", "an"}
+
+# Trim words that keep an all-caps spelling
+ACRONYMS = {"le", "se", "xle", "xse", "sr", "trd", "gr", "xp", "l", "amg", "edv", "cvt", "at", "suv", "xtra", "usa"}
+
+# Decimals stay one token ("2.5l"); other punctuation splits
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:(?:[-+]|(?<=\d)\.(?=\d))[a-z0-9]+)*\+?")
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+# Mercedes model numbers: "300", "43", "450e"
+_MODEL_NUMBER_RE = re.compile(r"\d{2,3}[a-z]*")
+# Mercedes names written without a space: "c300", "glc300", "e350e" -> class + model number
+_MB_COMPACT_RE = re.compile(r"(a|b|c|e|g|s|cla|cle|gla|glb|glc|gle|gls|eqb|eqe|eqs|sl)(\d{2,3}[a-z]*)")
+_MAX_ALIAS_TOKENS = 3
+# Minimum trigram similarity for a misspelled model ("Tacomma", "Highlandr")
+_FUZZY_THRESHOLD = 0.5
+
+
+class CanonicalModel(NamedTuple):
+    year: Optional[int]
+    make: Optional[str]
+    model: Optional[str]
+    trim: Optional[str]
+    drivetrain: Optional[str]
+
+    @property
+    def key(self) -> Optional[str]:
+        """Grouping key across dealers: make, model and trim (year and drivetrain ignored)."""
+        if self.model is None:
+            return None
+        parts = [self.make, self.model, self.trim]
+        return " ".join(part for part in parts if part).casefold()
+
+    @property
+    def name(self) -> str:
+        parts = [str(self.year) if self.year else None, self.make, self.model, self.trim, self.drivetrain]
+        return " ".join(part for part in parts if part)
+
+
+def _compact(text: str) -> str:
+    return text.replace("-", "").replace(" ", "")
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _ModelIndex:
+    """
+    Alias lookups built once at import: compact token windows (``corollacross``,
+    ``rav4``) map straight to (make, model); a trigram index over the same
+    aliases catches misspellings without scanning every alias.
+    """
+
+    def __init__(self):
+        self.exact: Dict[Tuple[Optional[str], str], Tuple[str, str]] = {}
+        self.trigrams: Dict[str, Set[str]] = {}
+        self.aliases: Dict[str, Tuple[str, str]] = {}
+
+        for make, models in MODELS.items():
+            for model, spellings in models.items():
+                for spelling in spellings:
+                    alias = _compact(spelling)
+                    self.exact[(make, alias)] = (make, model)
+                    # Single-letter Mercedes classes ("C 300") and bare numbers ("86") only count
+                    # once the make is known
+                    if len(alias) > 1 and not alias.isdigit():
+                        self.exact.setdefault((None, alias), (make, model))
+                        self.aliases[alias] = (make, model)
+                        for gram in _trigrams(alias):
+                            self.trigrams.setdefault(gram, set()).add(alias)
+
+    def match(self, tokens: List[str], make: Optional[str]) -> Optional[Tuple[int, int, str, str]]:
+        """(start, stop, make, model) for the longest alias found in ``tokens``."""
+        for width in range(min(_MAX_ALIAS_TOKENS, len(tokens)), 0, -1):
+            for start in range(len(tokens) - width + 1):
+                alias = "".join(_compact(token) for token in tokens[start : start + width])
+                found = self.exact.get((make, alias)) or self.exact.get((None, alias))
+                # A single letter is a class only before a model number: "C 300", not "C" in a trim
+                if found and len(alias) == 1:
+                    following = tokens[start + width] if start + width < len(tokens) else ""
+                    if not _MODEL_NUMBER_RE.fullmatch(following):
+                        found = None
+                if found and (make is None or found[0] == make):
+                    return start, start + width, found[0], found[1]
+        return None
+
+    def fuzzy(self, tokens: List[str], make: Optional[str]) -> Optional[Tuple[int, int, str, str]]:
+        best = None
+        for position, token in enumerate(tokens):
+            if len(token) < 4 or token.isdigit():
+                continue
+            grams = _trigrams(token)
+            candidates: Dict[str, int] = {}
+            for gram in grams:
+                for alias in self.trigrams.get(gram, ()):
+                    candidates[alias] = candidates.get(alias, 0) + 1
+            for alias, shared in candidates.items():
+                score = shared / len(grams | _trigrams(alias))
+                found_make, model = self.aliases[alias]
+                if score >= _FUZZY_THRESHOLD and (make is None or found_make == make):
+                    if best is None or score > best[0]:
+                        best = (score, position, found_make, model)
+        if best is None:
+            return None
+        _, position, found_make, model = best
+        return position, position + 1, found_make, model
+
+
+_INDEX = _ModelIndex()
+
+
+def _trim_word(token: str) -> str:
+    if token in ACRONYMS or any(ch.isdigit() for ch in token):
+        return token.upper()
+    return token.capitalize()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def canonicalize(text: str) -> CanonicalModel:
+    """Split a scraped model title into year, make, model, trim and drivetrain."""
+    tokens = _TOKEN_RE.findall(text.casefold())
+
+    year = None
+    drivetrain = None
+    make = None
+    rest = []
+    for position, token in enumerate(tokens):
+        following = tokens[position + 1] if position + 1 < len(tokens) else ""
+        if year is None and _YEAR_RE.fullmatch(token):
+            year = int(token)
+        elif token in DRIVETRAINS:
+            drivetrain = drivetrain or DRIVETRAINS[token]
+        elif token in ARTICLES and not _MODEL_NUMBER_RE.fullmatch(following):
+            continue
+        elif token not in NOISE:
+            rest.append(token)
+
+    # "mercedes benz" is two tokens, "mercedes-benz" one
+    for width, start in ((width, start) for width in (2, 1) for start in range(len(rest) - width + 1)):
+        candidate = " ".join(rest[start : start + width])
+        if candidate in MAKES:
+            make = MAKES[candidate]
+            del rest[start : start + width]
+            break
+
+    if make in (None, "Mercedes-Benz"):
+        split = []
+        for token in rest:
+            compact = _MB_COMPACT_RE.fullmatch(token)
+            split.extend(compact.groups() if compact else (token,))
+        if len(split) != len(rest):
+            rest = split
+            make = "Mercedes-Benz"
+
+    found = _INDEX.match(rest, make) or _INDEX.fuzzy(rest, make)
+    model = None
+    if found is not None:
+        start, stop, make, model = found
+        del rest[start:stop]
+
+    trim = " ".join(_trim_word(token) for token in rest) or None
+    return CanonicalModel(year, make, model, trim, drivetrain)
+
+
+def canonical_key(text: Any) -> Optional[str]:
+    """``canonicalize(text).key``; falls back to the cleaned-up title when no model is recognized."""
+    if not isinstance(text, str) or not text.strip():
+        return None
+    return _canonical_key(text)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _canonical_key(text: str) -> Optional[str]:
+    canonical = canonicalize(text)
+    if canonical.key is not None:
+        return canonical.key
+    tokens = [token for token in _TOKEN_RE.findall(text.casefold()) if not _YEAR_RE.fullmatch(token)]
+    return " ".join(tokens) or None
+
+
+def canonicalize_column(values: Iterable[Any]) -> pd.DataFrame:
+    """
+    ``canonicalize`` over a column of titles: each distinct title is parsed
+    once (and memoized across calls), then broadcast back to the rows.
+    """
+    import numpy as np
+    import pandas as pd
+
+    values = pd.Series(values, dtype=object)
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    parsed = [canonicalize(value) if isinstance(value, str) else CanonicalModel(None, None, None, None, None) for value in uniques]
+    parsed.append(CanonicalModel(None, None, None, None, None))
+
+    keys = [canonical_key(value) for value in uniques] + [None]
+    index = values.index
+
+    def column(values: List[Any]) -> pd.Series:
+        return pd.Series(np.array(values, dtype=object)[codes], index=index, dtype=object)
+
+    frame = pd.DataFrame({field: column([getattr(p, field) for p in parsed]) for field in CanonicalModel._fields})
+    frame["key"] = column(keys)
+    return frame
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the title memo."""
+    info = canonicalize.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from results_cache import VersionedCache
+
+
+# Query name -> row column; numeric keys double as range filters (min_<key>, max_<key>)
+NUMERIC_KEYS = {
+    "monthly": "Monthly ($)",
+    "due": "Due at Signing ($)",
+    "msrp": "MSRP ($)",
+    "term": "Term (months)",
+}
+# Brand is not a row column; it is derived from the dealership
+TEXT_KEYS = ("brand", "dealership", "model")
+SORT_KEYS = sorted(NUMERIC_KEYS) + list(TEXT_KEYS)
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+class OfferIndex:
+    """
+    Column arrays over one immutable list of result rows.
+
+    Built once per results version: numeric columns become float arrays,
+    dealership / brand / model become factorized codes, and each sort key
+    gets a rank array. Queries are then numpy masks and a lexsort over the
+    matching rows only; nothing is re-parsed or sanitized per request.
+
+    numpy and pandas are imported by the methods that use them, so the app
+    can create its OfferIndexCache without loading either at startup.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], brand_for: Callable[[str], str]):
+        import numpy as np
+        import pandas as pd
+
+        self.rows = rows
+        frame = pd.DataFrame.from_records(rows) if rows else pd.DataFrame()
+
+        def column(name: str) -> pd.Series:
+            if name in frame.columns:
+                return frame[name]
+            return pd.Series([None] * len(rows), dtype=object)
+
+        self.numbers: Dict[str, np.ndarray] = {
+            key: pd.to_numeric(column(col), errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            for key, col in NUMERIC_KEYS.items()
+        }
+
+        dealer_codes, dealers = pd.factorize(column("Dealership").fillna("").astype(str))
+        model_codes, models = pd.factorize(column("Model").fillna("").astype(str))
+        brands_per_dealer = [brand_for(dealer) for dealer in dealers]
+        brand_of_dealer, brands = pd.factorize(pd.Series(brands_per_dealer, dtype=object))
+
+        self.codes: Dict[str, np.ndarray] = {
+            "dealership": dealer_codes,
+            "model": model_codes,
+            "brand": brand_of_dealer[dealer_codes],
+        }
+        self.uniques: Dict[str, List[str]] = {
+            "dealership": list(dealers),
+            "model": list(models),
+            "brand": list(brands),
+        }
+        self._model_folded = [model.casefold() for model in models]
+
+        self.ranks: Dict[str, np.ndarray] = dict(self.numbers)
+        for key, uniques in self.uniques.items():
+            order = np.argsort([value.casefold() for value in uniques], kind="stable")
+            rank_of_code = np.empty(len(uniques), dtype=float)
+            rank_of_code[order] = np.arange(len(uniques))
+            self.ranks[key] = rank_of_code[self.codes[key]]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _codes_matching(self, key: str, names: Iterable[str]) -> np.ndarray:
+        import numpy as np
+
+        wanted = {name.casefold() for name in names}
+        return np.array(
+            [code for code, value in enumerate(self.uniques[key]) if value.casefold() in wanted], dtype=np.intp
+        )
+
+    def query(
+        self,
+        dealerships: Sequence[str] = (),
+        brands: Sequence[str] = (),
+        model: Optional[str] = None,
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        sort: Sequence[str] = (),
+        page: int = 1,
+        limit: int = DEFAULT_LIMIT,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Return (total matches, rows of the requested page)."""
+        matches = self.select(dealerships, brands, model, ranges, sort)
+        start = (page - 1) * limit
+        return len(matches), [self.rows[i] for i in matches[start : start + limit]]
+
+    def select(
+        self,
+        dealerships: Sequence[str] = (),
+        brands: Sequence[str] = (),
+        model: Optional[str] = None,
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        sort: Sequence[str] = (),
+    ) -> np.ndarray:
+        """Positions in ``rows`` of every match, in sort order."""
+        import numpy as np
+
+        mask = np.ones(len(self.rows), dtype=bool)
+
+        if dealerships:
+            mask &= np.isin(self.codes["dealership"], self._codes_matching("dealership", dealerships))
+        if brands:
+            mask &= np.isin(self.codes["brand"], self._codes_matching("brand", brands))
+        if model:
+            needle = model.casefold()
+            matching = [code for code, name in enumerate(self._model_folded) if needle in name]
+            mask &= np.isin(self.codes["model"], np.array(matching, dtype=np.intp))
+
+        for key, (low, high) in (ranges or {}).items():
+            values = self.numbers[key]
+            # NaN fails both comparisons, so rows without a value drop out
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+
+        matches = np.flatnonzero(mask)
+
+        if sort and len(matches):
+            sort_keys = []
+            # lexsort treats the last key as primary
+            for spec in reversed(sort):
+                descending = spec.startswith("-")
+                ranks = self.ranks[spec.lstrip("-")][matches]
+                ranks = -ranks if descending else ranks
+                # Missing values sort last in either direction
+                sort_keys.append(np.where(np.isnan(ranks), np.inf, ranks))
+            matches = matches[np.lexsort(sort_keys)]
+
+        return matches
+
+
+class OfferIndexCache(VersionedCache[OfferIndex]):
+    """Latest ``OfferIndex`` keyed by results version."""
+
+    def __init__(self, brand_for: Callable[[str], str]):
+        self.brand_for = brand_for
+        super().__init__(lambda version, rows: OfferIndex(rows, brand_for))
+
+
+def parse_query(args) -> Dict[str, Any]:
+    """
+    Flask request.args -> keyword arguments for ``OfferIndex.query``.
+    Raises ValueError with a user-facing message on bad input.
+    """
+
+    def listed(name: str) -> List[str]:
+        values = []
+        for raw in args.getlist(name):
+            values.extend(part.strip() for part in raw.split(",") if part.strip())
+        return values
+
+    def number(name: str) -> Optional[float]:
+        raw = args.get(name)
+        if raw in (None, ""):
+            return None
+        try:
+            return float(raw)
+        except ValueError:
+            raise ValueError(f"{name} must be a number")
+
+    ranges = {}
+    for key in NUMERIC_KEYS:
+        low, high = number(f"min_{key}"), number(f"max_{key}")
+        if low is not None or high is not None:
+            ranges[key] = (low, high)
+
+    sort = listed("sort")
+    unknown = [spec for spec in sort if spec.lstrip("-") not in SORT_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown sort key(s): {', '.join(unknown)}; use {', '.join(SORT_KEYS)}")
+
+    try:
+        page = int(args.get("page", 1))
+        limit = int(args.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise ValueError("page and limit must be integers")
+    if page < 1 or limit < 1:
+        raise ValueError("page and limit must be positive")
+
+    return {
+        "dealerships": listed("dealership"),
+        "brands": listed("brand"),
+        "model": (args.get("model") or "").strip() or None,
+        "ranges": ranges,
+        "sort": sort,
+        "page": page,
+        "limit": min(limit, MAX_LIMIT),
+    }
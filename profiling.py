@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+# Text summaries list this many functions by cumulative time
+SUMMARY_LIMIT = 60
+
+
+def parse_targets(value: Optional[str]) -> Optional[set]:
+    """
+    "/start-scraping?profile=..." -> set of dealer names, {"*"} for all,
+    or None when profiling is off.
+    """
+    if not value:
+        return None
+    if value.strip().lower() in ("1", "all", "true", "*"):
+        return {"*"}
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    return names or None
+
+
+def wants_profile(targets: Optional[Iterable[str]], dealer: str) -> bool:
+    return bool(targets) and ("*" in targets or dealer in targets)
+
+
+def safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", value).strip("_") or "dealer"
+
+
+class ProfileStore:
+    """
+    cProfile artifacts on disk: ``<root>/<run>/<dealer>.prof`` (pstats dump,
+    for snakeviz / pstats) plus ``<dealer>.txt`` (top functions by
+    cumulative time, readable in the browser).
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def run_dir(self, run_id: Optional[int], started_at: datetime) -> str:
+        name = started_at.strftime("%Y%m%dT%H%M%S")
+        if run_id is not None:
+            name += f"-run{run_id}"
+        return name
+
+    def profile_call(self, run_dir: str, dealer: str, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` under cProfile and save its artifacts, even if it raises."""
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(fn)
+        finally:
+            try:
+                self._save(run_dir, dealer, profiler)
+            except Exception as e:
+                print(f"[ERROR] Profile save failed: {dealer}: {e}")
+
+    def _save(self, run_dir: str, dealer: str, profiler: cProfile.Profile) -> None:
+        directory = os.path.join(self.root, run_dir)
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, safe_name(dealer))
+
+        profiler.dump_stats(base + ".prof")
+
+        out = io.StringIO()
+        out.write(f"{dealer}\n\n")
+        stats = pstats.Stats(profiler, stream=out)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(SUMMARY_LIMIT)
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+
+    def list_profiles(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Newest runs first, each with its per-dealer artifacts."""
+        if not os.path.isdir(self.root):
+            return []
+
+        runs = []
+        for run_dir in sorted(os.listdir(self.root), reverse=True)[:limit]:
+            directory = os.path.join(self.root, run_dir)
+            if not os.path.isdir(directory):
+                continue
+
+            dealers = []
+            for filename in sorted(os.listdir(directory)):
+                if not filename.endswith(".txt"):
+                    continue
+                stem = filename[: -len(".txt")]
+                prof_path = os.path.join(directory, stem + ".prof")
+                dealers.append({
+                    "dealer": stem,
+                    "summary": f"{run_dir}/{filename}",
+                    "stats": f"{run_dir}/{stem}.prof",
+                    "size": os.path.getsize(prof_path) if os.path.exists(prof_path) else 0,
+                })
+            runs.append({"run": run_dir, "dealers": dealers})
+        return runs
@@ -1,46 +1,111 @@
-from scrapers.dealers.toyota.hollywood import ToyotaHollywoodScraper
-from scrapers.dealers.toyota.north_hollywood import NorthHollywoodToyotaScraper
-from scrapers.dealers.toyota.keyes import KeyesToyotaScraper
-from scrapers.dealers.toyota.glendale import ToyotaGlendaleScraper
-from scrapers.dealers.toyota.glendale import ToyotaGlendaleScraper
-from scrapers.dealers.toyota.hamer import HamerToyotaScraper
-from scrapers.dealers.toyota.nortridge import NorthridgeToyotaScraper
-from scrapers.dealers.toyota.downtownla import DowntownLaToyotaScraper
-from scrapers.dealers.toyota.bobsmith import BobSmithToyotaScraper
-from scrapers.dealers.toyota.pasadena import PasadenaToyotaScraper
-from scrapers.dealers.toyota.longo import LongoToyotaScraper
-from scrapers.dealers.toyota.culver_city import CulverCityToyotaScraper
-from scrapers.dealers.toyota.santa_monica import ToyotaSantaMonicaScraper
-from scrapers.dealers.toyota.marina_del_rey import MarinaDelReyToyotaScraper
-from scrapers.dealers.toyota.norwalk import NorwalkToyotaScraper
-from scrapers.dealers.toyota.south_bay import SouthBayToyotaScraper
-from scrapers.dealers.toyota.manhattan_beach import ManhattanBeachToyotaScraper
-from scrapers.dealers.toyota.torrance import ToyotaTorranceScraper
-from scrapers.dealers.toyota.cabe import CabeToyotaScraper
-from scrapers.dealers.mercedes.los_angeles import LosAngelesMercedesScraper
-from scrapers.dealers.mercedes.beverly_hills import BeverlyHillsMercedesScraper
-
-
-SCRAPERS = [
-    ToyotaHollywoodScraper(),
-    NorthHollywoodToyotaScraper(),
-    KeyesToyotaScraper(),
-    ToyotaGlendaleScraper(),
-    HamerToyotaScraper(),
-    NorthridgeToyotaScraper(),
-    DowntownLaToyotaScraper(),
-    BobSmithToyotaScraper(),
-    PasadenaToyotaScraper(),
-    LongoToyotaScraper(),
-    CulverCityToyotaScraper(),
-    ToyotaSantaMonicaScraper(),
-    MarinaDelReyToyotaScraper(),
-    NorwalkToyotaScraper(),
-    SouthBayToyotaScraper(),
-    ToyotaTorranceScraper(),
-    ManhattanBeachToyotaScraper(),
-    CabeToyotaScraper(),
-    LosAngelesMercedesScraper(),
-    BeverlyHillsMercedesScraper()
-    
+import importlib
+import threading
+from typing import Any, List, NamedTuple
+
+
+class ScraperSpec(NamedTuple):
+    """What the app needs to know about a dealer before (or without) importing its scraper."""
+
+    dealer_name: str
+    brand: str
+    specials_url: str
+    # How the scraper gets its page: "requests", "cloudscraper", "playwright", or "none" (no online specials)
+    fetch: str
+    # "package.module:ClassName"
+    target: str
+
+
+SPECS: List[ScraperSpec] = [
+    ScraperSpec("Toyota of Hollywood", "Toyota", "https://www.hollywoodtoyota.com/newspecials.htm",
+                "requests", "scrapers.dealers.toyota.hollywood:ToyotaHollywoodScraper"),
+    ScraperSpec("Toyota of North Hollywood", "Toyota", "https://www.northhollywoodtoyota.com/specials/vehicle-specials",
+                "requests", "scrapers.dealers.toyota.north_hollywood:NorthHollywoodToyotaScraper"),
+    ScraperSpec("Keyes Toyota", "Toyota", "https://www.keyestoyota.com/newspecials.html",
+                "requests", "scrapers.dealers.toyota.keyes:KeyesToyotaScraper"),
+    ScraperSpec("Toyota of Glendale", "Toyota", "https://www.toyotaofglendale.com/new-monthly-specials/",
+                "cloudscraper", "scrapers.dealers.toyota.glendale:ToyotaGlendaleScraper"),
+    ScraperSpec("Hamer Toyota", "Toyota", "https://www.hamertoyota.com/offers-incentives/",
+                "requests", "scrapers.dealers.toyota.hamer:HamerToyotaScraper"),
+    ScraperSpec("Northridge Toyota", "Toyota", "https://www.northridgetoyota.com/new-car-specials/",
+                "playwright", "scrapers.dealers.toyota.nortridge:NorthridgeToyotaScraper"),
+    ScraperSpec("Toyota of Downtown LA", "Toyota", "https://www.toyotaofdowntownla.com/specials/vehiclespecials",
+                "requests", "scrapers.dealers.toyota.downtownla:DowntownLaToyotaScraper"),
+    ScraperSpec("Bob Smith Toyota", "Toyota", "https://www.bobsmithtoyota.com/specials/vehicle-specials",
+                "requests", "scrapers.dealers.toyota.bobsmith:BobSmithToyotaScraper"),
+    ScraperSpec("Toyota Pasadena", "Toyota", "https://www.toyotapasadena.com/new-vehicles/new-vehicle-specials/",
+                "requests", "scrapers.dealers.toyota.pasadena:PasadenaToyotaScraper"),
+    ScraperSpec("Longo Toyota", "Toyota", "https://www.longotoyota.com/new-toyota-specials-los-angeles.html",
+                "playwright", "scrapers.dealers.toyota.longo:LongoToyotaScraper"),
+    ScraperSpec("Culver City Toyota", "Toyota", "https://www.culvercitytoyota.com/offers-incentives/",
+                "requests", "scrapers.dealers.toyota.culver_city:CulverCityToyotaScraper"),
+    ScraperSpec("Toyota Santa Monica", "Toyota", "https://www.toyotasantamonica.com/promotions/new/index.htm",
+                "requests", "scrapers.dealers.toyota.santa_monica:ToyotaSantaMonicaScraper"),
+    ScraperSpec("Marina del Rey Toyota", "Toyota", "https://www.marinadelreytoyota.com/specials/new-vehicle/",
+                "requests", "scrapers.dealers.toyota.marina_del_rey:MarinaDelReyToyotaScraper"),
+    ScraperSpec("Norwalk Toyota", "Toyota", "https://www.norwalktoyota.com/specials/",
+                "playwright", "scrapers.dealers.toyota.norwalk:NorwalkToyotaScraper"),
+    ScraperSpec("South Bay Toyota", "Toyota", "https://www.southbaytoyota.com/specials/",
+                "none", "scrapers.dealers.toyota.south_bay:SouthBayToyotaScraper"),
+    ScraperSpec("DCH Toyota of Torrance", "Toyota", "https://www.torrancetoyota.com/promotions/new/index.htm",
+                "requests", "scrapers.dealers.toyota.torrance:ToyotaTorranceScraper"),
+    ScraperSpec("Manhattan Beach Toyota", "Toyota", "https://www.manhattanbeachtoyota.com/specials/",
+                "playwright", "scrapers.dealers.toyota.manhattan_beach:ManhattanBeachToyotaScraper"),
+    ScraperSpec("Cabe Toyota", "Toyota", "https://www.cabetoyota.com/specials/vehicle-specials",
+                "requests", "scrapers.dealers.toyota.cabe:CabeToyotaScraper"),
+    ScraperSpec("Mercedes-Benz of Los Angeles", "Mercedes-Benz",
+                "https://www.mbzla.com/dtw-new-mercedes-benz-lease-incentives-finance-offers-los-angeles-ca/",
+                "playwright", "scrapers.dealers.mercedes.los_angeles:LosAngelesMercedesScraper"),
+    ScraperSpec("Mercedes-Benz of Beverly Hills", "Mercedes-Benz", "https://www.bhbenz.com/new-vehicles/new-vehicle-specials/",
+                "none", "scrapers.dealers.mercedes.beverly_hills:BeverlyHillsMercedesScraper"),
 ]
+
+
+class LazyScraper:
+    """
+    Registry entry for one dealer. Metadata comes from its ScraperSpec;
+    the scraper module (and requests / playwright / bs4 with it) is imported
+    and the scraper built on first use, i.e. the first ``fetch_df`` of a run.
+    Any other attribute (``dedup_keys``, ...) is read from the loaded scraper.
+    """
+
+    def __init__(self, spec: ScraperSpec):
+        self.spec = spec
+        self.dealer_name = spec.dealer_name
+        self.brand = spec.brand
+        self.specials_url = spec.specials_url
+        self.fetch = spec.fetch
+        self._scraper = None
+        self._lock = threading.Lock()
+
+    @property
+    def class_name(self) -> str:
+        return self.spec.target.rpartition(":")[2]
+
+    @property
+    def loaded(self) -> bool:
+        return self._scraper is not None
+
+    def load(self):
+        """The scraper instance, importing its module the first time."""
+        if self._scraper is None:
+            with self._lock:
+                if self._scraper is None:
+                    module_name, _, class_name = self.spec.target.partition(":")
+                    scraper_class = getattr(importlib.import_module(module_name), class_name)
+                    self._scraper = scraper_class()
+        return self._scraper
+
+    def fetch_df(self):
+        return self.load().fetch_df()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set above; avoid loading for private lookups (copy, pickle)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazyScraper {self.dealer_name!r} {'loaded' if self.loaded else 'not loaded'}>"
+
+
+SCRAPERS = [LazyScraper(spec) for spec in SPECS]
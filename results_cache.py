@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import gzip
+import json
+import math
+import threading
+import uuid
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast path
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+
+GZIP_LEVEL = 6
+# Snapshots are rebuilt once per finished dealer during a run; keep this cheap
+BROTLI_QUALITY = 5
+
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+T = TypeVar("T")
+
+
+def _clean(obj: Any) -> Any:
+    """Stdlib fallback only: NaN / inf -> None so json.dumps stays valid."""
+    if isinstance(obj, dict):
+        return {k: _clean(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clean(v) for v in obj]
+    if isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
+        return None
+    return obj
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    orjson when installed: it writes NaN / inf as null natively and handles
+    numpy scalars and datetimes, so rows need no sanitizing pass.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(_clean(obj), default=str, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def available_encodings() -> List[str]:
+    """Content encodings we can produce, best first."""
+    return (["br"] if brotli is not None else []) + ["gzip"]
+
+
+class EncodedSnapshot:
+    """Immutable encoded body for one results version; compressed variants are built on first use."""
+
+    def __init__(self, version: str, body: bytes):
+        self.version = version
+        self.etag = f"results-{_BOOT_ID}-{version}"
+        self.body = body
+        self._variants: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        if not encoding:
+            return self.body
+        with self._lock:
+            data = self._variants.get(encoding)
+            if data is None:
+                if encoding == "br":
+                    data = brotli.compress(self.body, quality=BROTLI_QUALITY)
+                elif encoding == "gzip":
+                    data = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+                else:
+                    raise ValueError(f"Unsupported encoding: {encoding}")
+                self._variants[encoding] = data
+        return data
+
+
+class VersionedCache(Generic[T]):
+    """
+    Latest value built from the results rows, keyed by results version.
+    ``get`` is called with the current version (cheap to compute under
+    SCRAPE_LOCK) and a loader that returns ``(version, rows)`` consistently;
+    the loader and ``build(version, rows)`` only run when the version has
+    moved. The version and its value are swapped as one tuple, so the
+    lock-free fast path never pairs a new version with an old value.
+    """
+
+    def __init__(self, build: Callable[[str, List[Dict[str, Any]]], T]):
+        self._build = build
+        self._lock = threading.Lock()
+        self._entry: Optional[Tuple[str, T]] = None
+        self.builds = 0
+
+    def get(self, version: str, load: Callable[[], Tuple[str, List[Dict[str, Any]]]]) -> T:
+        entry = self._entry
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entry
+            if entry is None or entry[0] != version:
+                loaded_version, rows = load()
+                entry = (loaded_version, self._build(loaded_version, rows))
+                self._entry = entry
+                self.builds += 1
+        return entry[1]
+
+
+class ResultsCache(VersionedCache[EncodedSnapshot]):
+    """Holds the latest ``EncodedSnapshot``; the encoder only runs when the version has moved."""
+
+    def __init__(self):
+        super().__init__(lambda version, rows: EncodedSnapshot(version, encode_json(rows)))
+
+
+def negotiate(accept_encodings) -> Optional[str]:
+    """Pick br / gzip from a werkzeug Accept-Encoding header, or None for identity."""
+    for encoding in available_encodings():
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from dedup import fingerprints
+from model_names import canonicalize_column
+
+
+# An offer's identity across runs (the model by canonical key and model year),
+# and the fields whose change makes it "repriced"
+IDENTITY_KEYS = ("Dealership", "Model", "Model Year", "Term (months)")
+PRICE_KEYS = ("Monthly ($)", "Due at Signing ($)", "MSRP ($)")
+
+CHANGES = ("added", "removed", "repriced")
+
+_PRICE_FIELDS = {"Monthly ($)": "monthly", "Due at Signing ($)": "due_at_signing", "MSRP ($)": "msrp"}
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if np.isnan(number) else number
+
+
+def _offers(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    One row per offer, with identity and price fingerprints. A dealer can
+    list several offers with the same identity (e.g. different amounts due
+    at signing); every one is kept.
+    """
+    columns = ["identity", "prices", "dealer", "model", "model_key", "term", *PRICE_KEYS, "Expires"]
+    if not rows:
+        return pd.DataFrame(columns=columns)
+
+    frame = pd.DataFrame.from_records(rows)
+    for column in ("Dealership", "Model", "Term (months)", *PRICE_KEYS, "Expires"):
+        if column not in frame.columns:
+            frame[column] = None
+    canonical = canonicalize_column(frame["Model"])
+    frame["Model Year"] = canonical["year"].to_numpy()
+
+    offers = pd.DataFrame({
+        # Nullable, so the outer merges below don't turn them into (lossy) floats
+        "identity": pd.array(fingerprints(frame, IDENTITY_KEYS), dtype="UInt64"),
+        "prices": pd.array(fingerprints(frame, PRICE_KEYS), dtype="UInt64"),
+        "dealer": frame["Dealership"].astype(object),
+        "model": frame["Model"].astype(object),
+        "model_key": canonical["key"].to_numpy(),
+        "term": pd.to_numeric(frame["Term (months)"], errors="coerce"),
+        **{column: pd.to_numeric(frame[column], errors="coerce") for column in PRICE_KEYS},
+        "Expires": frame["Expires"].astype(object),
+    })
+    return offers[offers["dealer"].notna() & offers["model_key"].notna()].reset_index(drop=True)
+
+
+def _unmatched(offers: pd.DataFrame, matched: pd.Series) -> pd.DataFrame:
+    """Offers left after exact matches, numbered cheapest first within their identity."""
+    rest = offers[~matched].sort_values(list(PRICE_KEYS), kind="stable")
+    return rest.assign(occurrence=rest.groupby("identity").cumcount())
+
+
+def _describe(offer: Any) -> Dict[str, Any]:
+    term = _number(offer["term"])
+    return {
+        "model": offer["model"],
+        "model_key": offer["model_key"],
+        "term": int(term) if term is not None else None,
+    }
+
+
+def _prices(offer: Any, suffix: str = "") -> Dict[str, Any]:
+    prices = {field: _number(offer[column + suffix]) for column, field in _PRICE_FIELDS.items()}
+    expires = offer["Expires" + suffix]
+    prices["expires"] = None if expires is None or expires != expires else expires
+    return prices
+
+
+def diff_runs(
+    previous: List[Dict[str, Any]],
+    current: List[Dict[str, Any]],
+    skip_dealers: Iterable[str] = (),
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Per-dealer changes between two runs' rows: offers added, removed, or
+    repriced (same dealer, canonical model, model year and term; different
+    monthly, due or MSRP). Identities and prices are compared as row
+    fingerprints: identical offers match first, as a multiset, and the rest
+    pair up per identity. Dealers in ``skip_dealers`` (e.g. failed this run)
+    are left out, so a scrape error doesn't read as every offer being
+    withdrawn.
+    """
+    before, after = _offers(previous), _offers(current)
+
+    # Identical offers (same identity and prices) match as a multiset: two
+    # copies before and one after is one removal
+    for offers in (before, after):
+        offers["occurrence"] = offers.groupby(["identity", "prices"]).cumcount()
+    exact = before.merge(after, on=["identity", "prices", "occurrence"], how="inner")[["identity", "prices", "occurrence"]]
+
+    def matched(offers: pd.DataFrame) -> pd.Series:
+        keys = offers[["identity", "prices", "occurrence"]].merge(exact, how="left", indicator=True)
+        return pd.Series((keys["_merge"] == "both").to_numpy(), index=offers.index)
+
+    # What's left pairs up by identity, cheapest with cheapest: a pair is a repricing
+    merged = _unmatched(before, matched(before)).merge(
+        _unmatched(after, matched(after)),
+        on=["identity", "occurrence"],
+        how="outer",
+        suffixes=("_before", ""),
+        indicator=True,
+    )
+
+    skip = set(skip_dealers)
+    diffs: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+    def add(dealer: str, change: str, entry: Dict[str, Any]) -> None:
+        if dealer in skip:
+            return
+        diffs.setdefault(dealer, {name: [] for name in CHANGES})[change].append(entry)
+
+    for offer in merged.to_dict(orient="records"):
+        side = offer["_merge"]
+        if side == "right_only":
+            add(offer["dealer"], "added", {**_describe(offer), **_prices(offer)})
+        elif side == "left_only":
+            described = {key: offer[f"{key}_before"] for key in ("dealer", "model", "model_key", "term")}
+            entry = _describe(described)
+            add(offer["dealer_before"], "removed", {**entry, **_prices(offer, "_before")})
+        else:
+            add(offer["dealer"], "repriced", {
+                **_describe(offer),
+                "before": _prices(offer, "_before"),
+                "after": _prices(offer),
+            })
+
+    for changes in diffs.values():
+        for entries in changes.values():
+            entries.sort(key=lambda entry: (entry["model_key"] or "", entry["term"] or 0))
+    return diffs
+
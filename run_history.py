@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    dealer_count INTEGER NOT NULL DEFAULT 0,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    duration_s REAL
+);
+
+CREATE TABLE IF NOT EXISTS dealer_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    dealer TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    day TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_rows INTEGER NOT NULL,
+    invalid_required_rows INTEGER NOT NULL,
+    attention_rows INTEGER NOT NULL,
+    top_issues TEXT NOT NULL,
+    duration_s REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_dealer_results_run ON dealer_results (run_id);
+CREATE INDEX IF NOT EXISTS idx_dealer_results_dealer_time ON dealer_results (dealer, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started_at);
+
+-- Offer changes against the previous published run (see run_diff.py)
+CREATE TABLE IF NOT EXISTS run_diff_runs (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(id),
+    previous_run_id INTEGER,
+    added INTEGER NOT NULL DEFAULT 0,
+    removed INTEGER NOT NULL DEFAULT 0,
+    repriced INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS run_diffs (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    dealer TEXT NOT NULL,
+    change TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_run_diffs_run ON run_diffs (run_id, dealer);
+
+-- Daily rollup, maintained on insert so trend queries never scan raw results
+CREATE TABLE IF NOT EXISTS dealer_daily (
+    day TEXT NOT NULL,
+    dealer TEXT NOT NULL,
+    results INTEGER NOT NULL DEFAULT 0,
+    ok_results INTEGER NOT NULL DEFAULT 0,
+    attention_results INTEGER NOT NULL DEFAULT 0,
+    fail_results INTEGER NOT NULL DEFAULT 0,
+    rows_total INTEGER NOT NULL DEFAULT 0,
+    duration_total REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, dealer)
+);
+"""
+
+_UPSERT_DAILY = """
+INSERT INTO dealer_daily (
+    day, dealer, results, ok_results, attention_results, fail_results, rows_total, duration_total
+)
+VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+ON CONFLICT (day, dealer) DO UPDATE SET
+    results = results + 1,
+    ok_results = ok_results + excluded.ok_results,
+    attention_results = attention_results + excluded.attention_results,
+    fail_results = fail_results + excluded.fail_results,
+    rows_total = rows_total + excluded.rows_total,
+    duration_total = duration_total + excluded.duration_total
+"""
+
+
+_CHANGES = ("added", "removed", "repriced")
+
+
+def _iso(ts: datetime) -> str:
+    return ts.replace(microsecond=0).isoformat()
+
+
+class RunHistoryStore:
+    """
+    Append-only SQLite history of scrape runs and per-dealer results.
+
+    Each run gets a row in ``runs``; every dealer outcome is appended to
+    ``dealer_results`` and folded into the ``dealer_daily`` rollup in the
+    same transaction.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    # ---------------- connection ----------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                    self._schema_ready = True
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # ---------------- writes ----------------
+
+    def start_run(self, started_at: datetime) -> int:
+        with closing(self._connect()) as conn, conn:
+            cur = conn.execute("INSERT INTO runs (started_at) VALUES (?)", (_iso(started_at),))
+            return int(cur.lastrowid)
+
+    def record_dealer(
+        self,
+        run_id: int,
+        dealer: str,
+        entry: Dict[str, Any],
+        duration_s: Optional[float] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Append one dealer outcome (a SCRAPER_MONITOR dealer entry)."""
+        recorded_at = now or datetime.utcnow()
+        day = recorded_at.date().isoformat()
+        status = entry.get("status") or "FAIL"
+        total_rows = int(entry.get("total_rows") or 0)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                INSERT INTO dealer_results (
+                    run_id, dealer, recorded_at, day, status, total_rows,
+                    invalid_required_rows, attention_rows, top_issues, duration_s
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    run_id,
+                    dealer,
+                    _iso(recorded_at),
+                    day,
+                    status,
+                    total_rows,
+                    int(entry.get("invalid_required_rows") or 0),
+                    int(entry.get("attention_rows") or 0),
+                    json.dumps(entry.get("top_issues") or []),
+                    duration_s,
+                ),
+            )
+            conn.execute(
+                _UPSERT_DAILY,
+                (
+                    day,
+                    dealer,
+                    int(status == "OK"),
+                    int(status == "NEEDS_ATTENTION"),
+                    int(status == "FAIL"),
+                    total_rows,
+                    duration_s or 0.0,
+                ),
+            )
+
+    def finish_run(self, run_id: int, finished_at: datetime) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                UPDATE runs SET
+                    finished_at = ?,
+                    dealer_count = (SELECT COUNT(*) FROM dealer_results WHERE run_id = runs.id),
+                    row_count = (SELECT COALESCE(SUM(total_rows), 0) FROM dealer_results WHERE run_id = runs.id),
+                    duration_s = (julianday(?) - julianday(started_at)) * 86400.0
+                WHERE id = ?
+                """,
+                (_iso(finished_at), _iso(finished_at), run_id),
+            )
+
+    def record_diff(
+        self,
+        run_id: int,
+        previous_run_id: Optional[int],
+        diffs: Dict[str, Dict[str, List[Dict[str, Any]]]],
+    ) -> None:
+        """Store a run_diff.diff_runs result; replaces any diff already stored for the run."""
+        entries = [
+            (run_id, dealer, change, json.dumps(entry))
+            for dealer, changes in diffs.items()
+            for change, items in changes.items()
+            for entry in items
+        ]
+        counts = {change: sum(len(changes.get(change, ())) for changes in diffs.values()) for change in _CHANGES}
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM run_diffs WHERE run_id = ?", (run_id,))
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO run_diff_runs (run_id, previous_run_id, added, removed, repriced)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (run_id, previous_run_id, counts["added"], counts["removed"], counts["repriced"]),
+            )
+            conn.executemany("INSERT INTO run_diffs (run_id, dealer, change, entry) VALUES (?, ?, ?, ?)", entries)
+
+    # ---------------- queries ----------------
+
+    def recent_runs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Newest runs first, with their row and dealer counts."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT id, started_at, finished_at, dealer_count, row_count, duration_s
+                FROM runs ORDER BY id DESC LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def run_results(self, run_id: int) -> List[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT dealer, recorded_at, status, total_rows, invalid_required_rows,
+                       attention_rows, top_issues, duration_s
+                FROM dealer_results WHERE run_id = ? ORDER BY dealer
+                """,
+                (run_id,),
+            ).fetchall()
+
+        results = []
+        for row in rows:
+            item = dict(row)
+            item["top_issues"] = json.loads(item["top_issues"])
+            results.append(item)
+        return results
+
+    def run_diff(self, run_id: int, dealer: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Stored changes for a run, grouped by dealer; None if no diff was recorded."""
+        query = "SELECT dealer, change, entry FROM run_diffs WHERE run_id = ?"
+        params: List[Any] = [run_id]
+        if dealer is not None:
+            query += " AND dealer = ?"
+            params.append(dealer)
+
+        with closing(self._connect()) as conn:
+            summary = conn.execute("SELECT * FROM run_diff_runs WHERE run_id = ?", (run_id,)).fetchone()
+            if summary is None:
+                return None
+            rows = conn.execute(query + " ORDER BY rowid", params).fetchall()
+
+        dealers: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for row in rows:
+            changes = dealers.setdefault(row["dealer"], {change: [] for change in _CHANGES})
+            changes[row["change"]].append(json.loads(row["entry"]))
+        return {
+            "run_id": run_id,
+            "previous_run_id": summary["previous_run_id"],
+            "summary": {change: summary[change] for change in _CHANGES},
+            "dealers": dealers,
+        }
+
+    def success_rates(self, days: int = 30, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Per-dealer share of non-FAIL results over the last ``days`` days (from the rollup)."""
+        since = ((now or datetime.utcnow()) - timedelta(days=days)).date().isoformat()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT dealer,
+                       SUM(results) AS results,
+                       SUM(ok_results) AS ok_results,
+                       SUM(attention_results) AS attention_results,
+                       SUM(fail_results) AS fail_results,
+                       SUM(rows_total) AS rows_total,
+                       SUM(duration_total) AS duration_total
+                FROM dealer_daily WHERE day >= ?
+                GROUP BY dealer ORDER BY dealer
+                """,
+                (since,),
+            ).fetchall()
+
+        return [
+            {
+                "dealer": row["dealer"],
+                "results": row["results"],
+                "ok_results": row["ok_results"],
+                "attention_results": row["attention_results"],
+                "fail_results": row["fail_results"],
+                "success_rate": (row["results"] - row["fail_results"]) / row["results"],
+                "avg_rows": row["rows_total"] / row["results"],
+                "avg_duration_s": row["duration_total"] / row["results"],
+            }
+            for row in rows
+        ]
+
+    def dealer_daily(self, dealer: str, days: int = 30, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """One point per day for a single dealer (from the rollup)."""
+        since = ((now or datetime.utcnow()) - timedelta(days=days)).date().isoformat()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT day, results, ok_results, attention_results, fail_results, rows_total, duration_total
+                FROM dealer_daily WHERE dealer = ? AND day >= ? ORDER BY day
+                """,
+                (dealer, since),
+            ).fetchall()
+
+        return [
+            {
+                "day": row["day"],
+                "results": row["results"],
+                "success_rate": (row["results"] - row["fail_results"]) / row["results"],
+                "avg_rows": row["rows_total"] / row["results"],
+                "avg_duration_s": row["duration_total"] / row["results"],
+                "fail_results": row["fail_results"],
+            }
+            for row in rows
+        ]
@@ -1,88 +1,174 @@
 from __future__ import annotations
 
+import json
+import math
+import threading
+import uuid
+from contextlib import nullcontext
 from datetime import date, datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-from validation import compute_dealer_health, validate_row
+from scrapers.base.stage_timer import StageTimer
 
 
-_FIELD_ALIASES = {
-    "due_at_signing": ["due_at_signing", "Due at Signing ($)", "Due at Signing"],
-    "monthly": ["monthly", "Monthly ($)", "Monthly"],
-    "model": ["model", "Model"],
-    "expires": ["expires", "Expires"],
-    "term_months": ["term_months", "Term (months)", "Term"],
-    "msrp": ["msrp", "MSRP ($)", "MSRP"],
-}
-
 SCRAPER_MONITOR: Dict[str, Any] = {
     "running": False,
     "started_at": None,
     "updated_at": None,
     "dealers": {},
+    # True while showing a run restored from disk at startup
+    "stale": False,
 }
 
+# Every mutation of SCRAPER_MONITOR goes through this lock and bumps the
+# version; the JSON body is serialized at most once per version.
+_MONITOR_LOCK = threading.Lock()
+_BOOT_ID = uuid.uuid4().hex[:8]
+_SNAPSHOT: Dict[str, Any] = {
+    "version": 0,
+    "cached_version": -1,
+    "body": b"",
+}
 
-def _first_present(row: Dict[str, Any], keys: List[str]) -> Any:
-    for key in keys:
-        if key in row:
-            return row[key]
-    return None
 
+def _timestamp(now: datetime | None = None) -> datetime:
+    return now or datetime.utcnow()
 
-def _normalize_row_fields(row: Dict[str, Any]) -> Dict[str, Any]:
-    return {normalized: _first_present(row, aliases) for normalized, aliases in _FIELD_ALIASES.items()}
 
+def _jsonable(obj: Any) -> Any:
+    """Recursively turn datetimes into ISO strings and NaN / inf into None."""
+    if isinstance(obj, dict):
+        return {k: _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
+        return None
+    return obj
 
-def _timestamp(now: datetime | None = None) -> datetime:
-    return now or datetime.utcnow()
+
+def _bump_version() -> None:
+    """Caller must hold _MONITOR_LOCK."""
+    _SNAPSHOT["version"] += 1
+
+
+def monitor_version() -> int:
+    return _SNAPSHOT["version"]
+
+
+def monitor_snapshot() -> Tuple[str, bytes]:
+    """Return (etag, JSON body) for the current monitor state, serializing only on change."""
+    with _MONITOR_LOCK:
+        version = _SNAPSHOT["version"]
+        if _SNAPSHOT["cached_version"] != version:
+            _SNAPSHOT["body"] = json.dumps(_jsonable(SCRAPER_MONITOR)).encode("utf-8")
+            _SNAPSHOT["cached_version"] = version
+        return f"monitor-{_BOOT_ID}-{version}", _SNAPSHOT["body"]
 
 
 def reset_monitor_state(now: datetime | None = None) -> None:
     """Reset monitor to initial state. Primarily used for tests."""
 
-    SCRAPER_MONITOR["running"] = False
-    SCRAPER_MONITOR["started_at"] = None
-    SCRAPER_MONITOR["updated_at"] = _timestamp(now)
-    SCRAPER_MONITOR["dealers"] = {}
+    with _MONITOR_LOCK:
+        SCRAPER_MONITOR["running"] = False
+        SCRAPER_MONITOR["started_at"] = None
+        SCRAPER_MONITOR["updated_at"] = _timestamp(now)
+        SCRAPER_MONITOR["dealers"] = {}
+        SCRAPER_MONITOR["stale"] = False
+        _bump_version()
+
+
+def export_monitor() -> Dict[str, Any]:
+    """JSON-ready copy of SCRAPER_MONITOR, for persisting a finished run."""
+    with _MONITOR_LOCK:
+        return _jsonable(SCRAPER_MONITOR)
+
+
+def replace_monitor(data: Dict[str, Any]) -> None:
+    """Overwrite the monitor with an exported state (e.g. from another worker)."""
+    with _MONITOR_LOCK:
+        SCRAPER_MONITOR["running"] = bool(data.get("running"))
+        SCRAPER_MONITOR["started_at"] = data.get("started_at")
+        SCRAPER_MONITOR["updated_at"] = data.get("updated_at")
+        SCRAPER_MONITOR["dealers"] = dict(data.get("dealers") or {})
+        SCRAPER_MONITOR["stale"] = bool(data.get("stale"))
+        _bump_version()
+
+
+def restore_monitor(data: Dict[str, Any]) -> None:
+    """Load a persisted monitor state (see export_monitor) and mark it stale."""
+    replace_monitor({**data, "running": False, "stale": True})
 
 
 def start_monitoring(now: datetime | None = None) -> None:
     timestamp = _timestamp(now)
 
-    SCRAPER_MONITOR["running"] = True
-    SCRAPER_MONITOR["started_at"] = timestamp
-    SCRAPER_MONITOR["updated_at"] = timestamp
-    SCRAPER_MONITOR["dealers"] = {}
+    with _MONITOR_LOCK:
+        SCRAPER_MONITOR["running"] = True
+        SCRAPER_MONITOR["started_at"] = timestamp
+        SCRAPER_MONITOR["updated_at"] = timestamp
+        SCRAPER_MONITOR["dealers"] = {}
+        SCRAPER_MONITOR["stale"] = False
+        _bump_version()
 
 
 def record_dealer_result(
-    dealer_name: str, rows: List[Dict[str, Any]], run_date: date | None = None, now: datetime | None = None
-) -> None:
+    dealer_name: str,
+    rows: List[Dict[str, Any]],
+    run_date: date | None = None,
+    now: datetime | None = None,
+    timer: StageTimer | None = None,
+    duplicates_removed: int = 0,
+) -> Dict[str, Any]:
+    # validation pulls in pandas; deferred so importing the monitor (and app) stays cheap
+    from validation import compute_frame_health, normalize_frame_fields, validate_frame
+
     run_date = run_date or date.today()
     timestamp = _timestamp(now)
 
-    validated_rows = [validate_row(_normalize_row_fields(row), run_date) for row in rows]
-    health = compute_dealer_health(validated_rows)
+    with timer.stage("validate") if timer else nullcontext():
+        validated = validate_frame(normalize_frame_fields(rows), run_date)
+        health = compute_frame_health(validated)
 
-    SCRAPER_MONITOR["dealers"][dealer_name] = {
+    entry = {
         "status": health["status"],
         "total_rows": health["total_rows"],
         "invalid_required_rows": health["invalid_required_rows"],
         "attention_rows": health["attention_rows"],
         "top_issues": health["top_issues"],
+        "duplicates_removed": duplicates_removed,
     }
-    SCRAPER_MONITOR["updated_at"] = timestamp
+    if timer:
+        entry.update(timer.summary())
+
+    with _MONITOR_LOCK:
+        SCRAPER_MONITOR["dealers"][dealer_name] = entry
+        SCRAPER_MONITOR["updated_at"] = timestamp
+        _bump_version()
+
+    return dict(entry)
 
 
-def record_dealer_exception(dealer_name: str, exc: Exception, now: datetime | None = None) -> None:
+def record_dealer_exception(
+    dealer_name: str, exc: Exception, now: datetime | None = None, timer: StageTimer | None = None
+) -> Dict[str, Any]:
     timestamp = _timestamp(now)
 
-    SCRAPER_MONITOR["dealers"][dealer_name] = {
+    entry = {
         "status": "FAIL",
         "total_rows": 0,
         "invalid_required_rows": 0,
         "attention_rows": 0,
         "top_issues": [f"exception: {exc}"],
+        "duplicates_removed": 0,
     }
-    SCRAPER_MONITOR["updated_at"] = timestamp
\ No newline at end of file
+    if timer:
+        entry.update(timer.summary())
+
+    with _MONITOR_LOCK:
+        SCRAPER_MONITOR["dealers"][dealer_name] = entry
+        SCRAPER_MONITOR["updated_at"] = timestamp
+        _bump_version()
+
+    return dict(entry)
@@ -6,6 +6,9 @@ class BaseScraper(ABC):
     dealer_name: str
     brand: str
     specials_url: str
+    # Columns that identify a duplicate offer in the publish-time dedup stage
+    # (see dedup.py); None uses dedup.DEFAULT_KEYS, "*" compares every column
+    dedup_keys = None
 
     @abstractmethod
     def fetch_df(self) -> pd.DataFrame:
@@ -2,6 +2,7 @@ from abc import ABC
 from typing import List
 import pandas as pd
 from scrapers.base.base_scraper import BaseScraper
+from scrapers.base.stage_timer import stage
 
 
 class MercedesBaseScraper(BaseScraper, ABC):
@@ -17,6 +18,7 @@ class MercedesBaseScraper(BaseScraper, ABC):
         "Term (months)",
     ]
 
+    @stage("normalize")
     def _normalize_df(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Enforce Mercedes lease table schema.
@@ -0,0 +1,73 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+# Order used for display; every dealer entry reports all of them
+STAGES = ("fetch", "render", "parse", "normalize", "validate", "publish")
+
+_CURRENT: ContextVar[Optional["StageTimer"]] = ContextVar("scrape_stage_timer", default=None)
+
+
+class StageTimer:
+    """
+    Wall-clock time per scrape stage plus bytes downloaded, for one dealer.
+
+    Scrapers never hold a reference to this; they call the module-level
+    ``stage()`` / ``add_bytes()`` helpers, which are no-ops unless a timer
+    has been activated around ``fetch_df``.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {name: 0.0 for name in STAGES}
+        self.bytes_downloaded = 0
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimer"]:
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+
+    def add_bytes(self, count: int) -> None:
+        self.bytes_downloaded += count
+
+    def attribute_parse(self, fetch_df_seconds: float) -> None:
+        """Whatever fetch_df spent outside its timed stages (an explicit parse stage included) was parsing."""
+        accounted = self.stages["fetch"] + self.stages["render"] + self.stages["parse"] + self.stages["normalize"]
+        self.stages["parse"] += max(fetch_df_seconds - accounted, 0.0)
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "timings": {name: round(self.stages.get(name, 0.0), 4) for name in STAGES},
+            "bytes_downloaded": self.bytes_downloaded,
+            "duration_s": round(time.perf_counter() - self._started, 4),
+        }
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block against the active dealer timer (no-op outside a scrape)."""
+    timer = _CURRENT.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+def add_bytes(count: int) -> None:
+    timer = _CURRENT.get()
+    if timer is not None:
+        timer.add_bytes(count)
@@ -1,5 +1,10 @@
 import re
+from typing import List
+
+import pandas as pd
+
 from scrapers.base.base_scraper import BaseScraper
+from scrapers.base.stage_timer import stage
 
 
 class ToyotaBaseScraper(BaseScraper):
@@ -9,6 +14,26 @@ class ToyotaBaseScraper(BaseScraper):
     NO dealer-specific logic.
     """
 
+    # Shared lease table for every Toyota dealer (and manual offers)
+    TABLE_COLUMNS: List[str] = [
+        "Model",
+        "Monthly ($)",
+        "Term (months)",
+        "Due at Signing ($)",
+        "MSRP ($)",
+        "Expires",
+        "Dealer Specials Link",
+    ]
+
+    MONEY_COLUMNS: List[str] = [
+        "Monthly ($)",
+        "Due at Signing ($)",
+        "MSRP ($)",
+    ]
+
+    # Tried in order; whatever is left falls back to pandas' mixed parser
+    EXPIRES_FORMATS: List[str] = ["%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d"]
+
     @staticmethod
     def extract(pattern: str, text: str | None):
         if not text:
@@ -30,3 +55,83 @@ class ToyotaBaseScraper(BaseScraper):
         m = re.search(r"(\d+)", text)
         return int(m.group(1)) if m else None
 
+    # ---------------- SCHEMA NORMALIZATION ----------------
+
+    @classmethod
+    @stage("normalize")
+    def normalize_df(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Bring a Toyota lease table onto the shared schema in one vectorized pass.
+
+        - missing standard columns are added as empty
+        - standard columns come first, in TABLE_COLUMNS order
+        - money columns become nullable Float64 ("$1,299" -> 1299.0)
+        - term becomes nullable Int64
+        - parseable expiry dates are rewritten as M/D/YYYY
+
+        Unlike the Mercedes schema this never raises: values that cannot be
+        coerced become NA (or keep their original text for Expires) so
+        validation can still report them.
+        """
+        df = df.copy()
+
+        for col in cls.TABLE_COLUMNS:
+            if col not in df.columns:
+                df[col] = None
+
+        extra = [c for c in df.columns if c not in cls.TABLE_COLUMNS]
+        df = df[cls.TABLE_COLUMNS + extra]
+
+        for col in cls.MONEY_COLUMNS:
+            df[col] = cls._coerce_money(df[col])
+
+        term = cls._coerce_money(df["Term (months)"])
+        df["Term (months)"] = term.where(term == term.round()).astype("Int64")
+
+        df["Expires"] = cls._coerce_expires(df["Expires"])
+
+        return df.reset_index(drop=True)
+
+    @classmethod
+    def normalize_records(cls, rows: List[dict]) -> pd.DataFrame:
+        """normalize_df for a list of row dicts (e.g. manual offers)."""
+        return cls.normalize_df(pd.DataFrame(rows))
+
+    @staticmethod
+    def _as_text(values: pd.Series) -> pd.Series:
+        text = values.astype("string").str.strip()
+        return text.mask(text.isin(["", "—", "N/A", "None", "nan"]))
+
+    @classmethod
+    def _coerce_money(cls, values: pd.Series) -> pd.Series:
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            return values.astype("Float64")
+
+        cleaned = cls._as_text(values).str.replace(r"[$,\s]", "", regex=True)
+        return pd.to_numeric(cleaned, errors="coerce").astype("Float64")
+
+    @classmethod
+    def _coerce_expires(cls, values: pd.Series) -> pd.Series:
+        text = cls._as_text(values)
+
+        # ISO timestamps ("2026-01-05T23:59:59-08:00") keep their calendar date
+        iso_date = text.str.extract(r"^(\d{4}-\d{2}-\d{2})(?:[T ].*)?$", expand=False)
+        text = iso_date.fillna(text)
+
+        parsed = pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+        for fmt in cls.EXPIRES_FORMATS:
+            pending = parsed.isna() & text.notna()
+            if not pending.any():
+                break
+            parsed[pending] = pd.to_datetime(text[pending], format=fmt, errors="coerce")
+
+        pending = parsed.isna() & text.notna()
+        if pending.any():
+            try:
+                parsed[pending] = pd.to_datetime(text[pending], format="mixed", errors="coerce")
+            except (ValueError, TypeError):
+                # e.g. mixed timezones; leave the original text for validation
+                pass
+
+        formatted = parsed.dt.strftime("%-m/%-d/%Y").astype("string")
+        return formatted.fillna(text).astype(object).where(text.notna(), None)
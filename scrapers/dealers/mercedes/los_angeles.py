@@ -6,6 +6,7 @@ from typing import Optional, Dict, Any, List
 import pandas as pd
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
+from scrapers.base.stage_timer import stage
 from scrapers.base.mercedes_base import MercedesBaseScraper
 
 
@@ -16,6 +17,8 @@ class LosAngelesMercedesScraper(MercedesBaseScraper):
     )
 
     CARD_SEL = "div.ncs-container"
+    # Only rows that match in every column are duplicates here
+    dedup_keys = "*"
 
     _money_re = re.compile(r"\$?\s*([\d,]+(?:\.\d+)?)")
     _expire_re = re.compile(r"Offers expire\s+(\d{1,2}/\d{1,2}/\d{2,4})", re.IGNORECASE)
@@ -24,45 +27,45 @@ class LosAngelesMercedesScraper(MercedesBaseScraper):
         rows: List[Dict[str, Any]] = []
 
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={"width": 1280, "height": 900},
-                locale="en-US",
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/123.0.0.0 Safari/537.36"
-                ),
-            )
-            page = context.new_page()
-            page.goto(self.specials_url, wait_until="domcontentloaded")
-            page.wait_for_timeout(1500)
-
-            self._dismiss_overlays(page)
-
-            try:
-                page.wait_for_selector(self.CARD_SEL, timeout=30000)
-            except PlaywrightTimeoutError:
-                browser.close()
-                # Return empty normalized DF (will raise if missing cols; so create empty with cols)
-                empty = pd.DataFrame(columns=self.TABLE_COLUMNS)
-                return self._normalize_df(empty)
+            with stage("render"):
+                browser = p.chromium.launch(headless=True)
+                context = browser.new_context(
+                    viewport={"width": 1280, "height": 900},
+                    locale="en-US",
+                    user_agent=(
+                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                        "AppleWebKit/537.36 (KHTML, like Gecko) "
+                        "Chrome/123.0.0.0 Safari/537.36"
+                    ),
+                )
+                page = context.new_page()
+                page.goto(self.specials_url, wait_until="domcontentloaded")
+                page.wait_for_timeout(1500)
+
+                self._dismiss_overlays(page)
 
-            self._scroll_to_load_all_cards(page)
-
-            cards = page.query_selector_all(self.CARD_SEL)
-            for card in cards:
-                row = self._extract_lease_row(card)
-                if row is not None:
-                    rows.append(row)
+                try:
+                    page.wait_for_selector(self.CARD_SEL, timeout=30000)
+                except PlaywrightTimeoutError:
+                    browser.close()
+                    # Return empty normalized DF (will raise if missing cols; so create empty with cols)
+                    empty = pd.DataFrame(columns=self.TABLE_COLUMNS)
+                    return self._normalize_df(empty)
+
+                self._scroll_to_load_all_cards(page)
+                cards = page.query_selector_all(self.CARD_SEL)
+
+            # Cards are read straight from the live DOM, so the browser stays open while parsing
+            with stage("parse"):
+                for card in cards:
+                    row = self._extract_lease_row(card)
+                    if row is not None:
+                        rows.append(row)
 
             browser.close()
 
         df = pd.DataFrame(rows, columns=self.TABLE_COLUMNS)
 
-        # Remove duplicate rows where all values match
-        df = df.drop_duplicates().reset_index(drop=True)
-
         # Enforce Mercedes schema + types/date format via base class
         return self._normalize_df(df)
 
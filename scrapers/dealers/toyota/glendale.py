@@ -4,6 +4,7 @@ import cloudscraper
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -13,11 +14,13 @@ class ToyotaGlendaleScraper(ToyotaBaseScraper):
     specials_url = "https://www.toyotaofglendale.com/new-monthly-specials/"
 
     def fetch_df(self) -> pd.DataFrame:
-        scraper = cloudscraper.create_scraper(
-            browser={"browser": "chrome", "platform": "darwin", "mobile": False}
-        )
-        resp = scraper.get(self.specials_url, timeout=30)
-        resp.raise_for_status()
+        with stage("fetch"):
+            scraper = cloudscraper.create_scraper(
+                browser={"browser": "chrome", "platform": "darwin", "mobile": False}
+            )
+            resp = scraper.get(self.specials_url, timeout=30)
+            resp.raise_for_status()
+        add_bytes(len(resp.content))
 
         soup = BeautifulSoup(resp.text, "html.parser")
 
@@ -95,6 +98,4 @@ class ToyotaGlendaleScraper(ToyotaBaseScraper):
             ],
         )
 
-        # keep real Python None instead of NaN in output objects
-        df = df.astype("object").where(pd.notna(df), None)
-        return df
+        return self.normalize_df(df)
@@ -2,6 +2,7 @@ import re
 import requests
 import pandas as pd
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -34,8 +35,10 @@ class HamerToyotaScraper(ToyotaBaseScraper):
             "s_vi": "fff71fc59fe206bf%5Ecd30c0f25fd6aa70",
         }
 
-        r = requests.get(self.API_URL, headers=headers, cookies=cookies, timeout=30)
-        r.raise_for_status()
+        with stage("fetch"):
+            r = requests.get(self.API_URL, headers=headers, cookies=cookies, timeout=30)
+            r.raise_for_status()
+        add_bytes(len(r.content))
 
         ct = (r.headers.get("content-type") or "").lower()
         if "application/json" not in ct and not r.text.lstrip().startswith(("{", "[")):
@@ -47,7 +50,7 @@ class HamerToyotaScraper(ToyotaBaseScraper):
         cards = self._walk_cards(data)
         df = self._extract_leases_df(cards)
 
-        return df
+        return self.normalize_df(df)
 
     # ----------------------------
     # Internal helpers (same logic)
@@ -1,6 +1,7 @@
 import re
 import requests
 import pandas as pd
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -46,9 +47,11 @@ class ToyotaHollywoodScraper(ToyotaBaseScraper):
     specials_url = "https://www.hollywoodtoyota.com/newspecials.htm"
 
     def fetch_df(self) -> pd.DataFrame:
-        resp = requests.post(URL, json=PAYLOAD, headers=HEADERS, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
+        with stage("fetch"):
+            resp = requests.post(URL, json=PAYLOAD, headers=HEADERS, timeout=15)
+            resp.raise_for_status()
+            data = resp.json()
+        add_bytes(len(resp.content))
 
         rows = []
 
@@ -73,5 +76,5 @@ class ToyotaHollywoodScraper(ToyotaBaseScraper):
                 "Dealer Specials Link": self.specials_url,
             })
 
-        return pd.DataFrame(rows)
+        return self.normalize_df(pd.DataFrame(rows))
 
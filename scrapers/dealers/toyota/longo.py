@@ -5,6 +5,7 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -58,19 +59,21 @@ class LongoToyotaScraper(ToyotaBaseScraper):
         return m.group(1) if m else None
 
     def fetch_df(self) -> pd.DataFrame:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            page = browser.new_page()
+        with stage("render"):
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=self.headless)
+                page = browser.new_page()
 
-            self._log(f"[DEBUG] goto {self.specials_url}")
-            page.goto(self.specials_url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+                self._log(f"[DEBUG] goto {self.specials_url}")
+                page.goto(self.specials_url, wait_until="domcontentloaded", timeout=self.timeout_ms)
 
-            # Wait for Octane specials to be injected
-            self._log("[DEBUG] waiting for octane cards...")
-            page.wait_for_selector("div.octane-specials-css-special-block", timeout=self.timeout_ms)
+                # Wait for Octane specials to be injected
+                self._log("[DEBUG] waiting for octane cards...")
+                page.wait_for_selector("div.octane-specials-css-special-block", timeout=self.timeout_ms)
 
-            html = page.content()
-            browser.close()
+                html = page.content()
+                browser.close()
+        add_bytes(len(html.encode("utf-8")))
 
         self._log(f"[DEBUG] rendered_html_len={len(html):,}")
         self._log(f"[DEBUG] has octane block? {'octane-specials-css-special-block' in html}")
@@ -152,4 +155,4 @@ class LongoToyotaScraper(ToyotaBaseScraper):
 
         df = pd.DataFrame(rows, columns=self.COLUMNS)
         self._log(f"[DEBUG] lease_rows={len(df)}")
-        return df
+        return self.normalize_df(df)
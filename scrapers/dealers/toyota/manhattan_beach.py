@@ -7,6 +7,7 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -29,25 +30,27 @@ class ManhattanBeachToyotaScraper(ToyotaBaseScraper):
 
     # -------- network --------
     def _fetch_rendered_html(self) -> str:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.set_default_navigation_timeout(60000)
-            page.set_default_timeout(60000)
-
-            print(f"[GOTO] {self.specials_url}")
-            try:
-                page.goto(self.specials_url, wait_until="domcontentloaded", timeout=60000)
-            except PWTimeout:
-                print("[WARN] goto timeout — continuing")
-
-            # disclaimers exist but are collapsed; wait for DOM attachment, not visibility
-            page.wait_for_selector("div.FJVwI", state="attached", timeout=60000)
-            page.wait_for_timeout(300)
-
-            html = page.content()
-            browser.close()
-            return html
+        with stage("render"):
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                page = browser.new_page()
+                page.set_default_navigation_timeout(60000)
+                page.set_default_timeout(60000)
+
+                print(f"[GOTO] {self.specials_url}")
+                try:
+                    page.goto(self.specials_url, wait_until="domcontentloaded", timeout=60000)
+                except PWTimeout:
+                    print("[WARN] goto timeout — continuing")
+
+                # disclaimers exist but are collapsed; wait for DOM attachment, not visibility
+                page.wait_for_selector("div.FJVwI", state="attached", timeout=60000)
+                page.wait_for_timeout(300)
+
+                html = page.content()
+                browser.close()
+                add_bytes(len(html.encode("utf-8")))
+                return html
 
     # -------- lease filter --------
     def _is_lease_offer(self, href: str | None, disclaimer: str | None) -> bool:
@@ -110,7 +113,7 @@ class ManhattanBeachToyotaScraper(ToyotaBaseScraper):
         ]
 
         if not offers:
-            return pd.DataFrame(columns=cols)
+            return self.normalize_df(pd.DataFrame(columns=cols))
 
         rows = []
         for o in offers:
@@ -132,4 +135,4 @@ class ManhattanBeachToyotaScraper(ToyotaBaseScraper):
                 "Term (months)": self.first_int(grab(self.RE_TERM_VAL)),
             })
 
-        return pd.DataFrame(rows, columns=cols)
+        return self.normalize_df(pd.DataFrame(rows, columns=cols))
@@ -4,6 +4,7 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -21,8 +22,10 @@ class MarinaDelReyToyotaScraper(ToyotaBaseScraper):
     }
 
     def fetch_df(self) -> pd.DataFrame:
-        resp = requests.get(self.specials_url, headers=self.HEADERS, timeout=30)
-        resp.raise_for_status()
+        with stage("fetch"):
+            resp = requests.get(self.specials_url, headers=self.HEADERS, timeout=30)
+            resp.raise_for_status()
+        add_bytes(len(resp.content))
 
         soup = BeautifulSoup(resp.text, "html.parser")
         cards = soup.select("div.dv-offers-specials-item")
@@ -82,4 +85,4 @@ class MarinaDelReyToyotaScraper(ToyotaBaseScraper):
                 }
             )
 
-        return pd.DataFrame(rows)
+        return self.normalize_df(pd.DataFrame(rows))
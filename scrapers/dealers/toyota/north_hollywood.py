@@ -3,6 +3,7 @@ import requests
 import pandas as pd
 from bs4 import BeautifulSoup
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -11,12 +12,14 @@ class NorthHollywoodToyotaScraper(ToyotaBaseScraper):
     specials_url = "https://www.northhollywoodtoyota.com/specials/vehicle-specials"
 
     def fetch_df(self) -> pd.DataFrame:
-        resp = requests.get(
-            self.specials_url,
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=30,
-        )
-        resp.raise_for_status()
+        with stage("fetch"):
+            resp = requests.get(
+                self.specials_url,
+                headers={"User-Agent": "Mozilla/5.0"},
+                timeout=30,
+            )
+            resp.raise_for_status()
+        add_bytes(len(resp.content))
 
         soup = BeautifulSoup(resp.text, "html.parser")
         cards = soup.select("div.special-offers.offer-box")
@@ -75,7 +78,7 @@ class NorthHollywoodToyotaScraper(ToyotaBaseScraper):
                 "Dealer Specials Link": self.specials_url,
             })
 
-        return pd.DataFrame(rows)
+        return self.normalize_df(pd.DataFrame(rows))
 
     # ---------------- HELPERS ---------------- #
 
@@ -2,6 +2,7 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -66,21 +67,23 @@ class NorthridgeToyotaScraper(ToyotaBaseScraper):
         for c in self.COLS:
             if c not in df.columns:
                 df[c] = pd.NA
-        return df[self.COLS]
+        return self.normalize_df(df[self.COLS])
 
     def _get_html(self) -> str:
         ua = (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123 Safari/537.36"
         )
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(user_agent=ua)
-            page.goto(self.specials_url, wait_until="networkidle", timeout=60000)
-            page.wait_for_timeout(1500)
-            html = page.content()
-            browser.close()
-            return html
+        with stage("render"):
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                page = browser.new_page(user_agent=ua)
+                page.goto(self.specials_url, wait_until="networkidle", timeout=60000)
+                page.wait_for_timeout(1500)
+                html = page.content()
+                browser.close()
+                add_bytes(len(html.encode("utf-8")))
+                return html
 
     # ---------------- FIXED PARSERS ----------------
 
@@ -8,6 +8,7 @@ from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
 from scrapers.base.base_scraper import BaseScraper
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -31,21 +32,23 @@ class NorwalkToyotaScraper(ToyotaBaseScraper):
 
     # ---------------- NETWORK (UNCHANGED LOGIC) ----------------
     def _fetch_rendered_html(self) -> str:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/123.0.0.0 Safari/537.36"
+        with stage("render"):
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                page = browser.new_page(
+                    user_agent=(
+                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                        "AppleWebKit/537.36 (KHTML, like Gecko) "
+                        "Chrome/123.0.0.0 Safari/537.36"
+                    )
                 )
-            )
-            page.goto(self.specials_url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_selector("button:has-text('Disclaimer')", timeout=60000)
-            page.wait_for_timeout(1000)
-            html = page.content()
-            browser.close()
-            return html
+                page.goto(self.specials_url, wait_until="domcontentloaded", timeout=60000)
+                page.wait_for_selector("button:has-text('Disclaimer')", timeout=60000)
+                page.wait_for_timeout(1000)
+                html = page.content()
+                browser.close()
+                add_bytes(len(html.encode("utf-8")))
+                return html
 
     # ---------------- LEASE FILTER (UNCHANGED) ----------------
     def _is_lease_offer(self, href: str | None, disclaimer: str | None) -> bool:
@@ -126,4 +129,4 @@ class NorwalkToyotaScraper(ToyotaBaseScraper):
                 "Term (months)": self.first_int(grab(self.RE_TERM_VAL)),
             })
 
-        return pd.DataFrame(rows)
+        return self.normalize_df(pd.DataFrame(rows))
@@ -6,12 +6,15 @@ import pandas as pd
 from bs4 import BeautifulSoup
 import requests
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
 class PasadenaToyotaScraper(ToyotaBaseScraper):
     dealer_name = "Toyota Pasadena"
     specials_url = "https://www.toyotapasadena.com/new-vehicles/new-vehicle-specials/"
+    # A model / payment / term combination is one offer on this site
+    dedup_keys = ("Dealership", "Model", "Monthly ($)", "Term (months)")
 
     # -------------------------- helpers --------------------------
 
@@ -111,36 +114,40 @@ class PasadenaToyotaScraper(ToyotaBaseScraper):
             "Referer": "https://www.toyotapasadena.com/",
         }
 
-        r1 = sess.get("https://www.toyotapasadena.com/", headers=headers, timeout=30)
-        if r1.status_code >= 400:
-            return None
+        with stage("fetch"):
+            r1 = sess.get("https://www.toyotapasadena.com/", headers=headers, timeout=30)
+            if r1.status_code >= 400:
+                return None
 
-        r2 = sess.get(self.specials_url, headers=headers, timeout=30)
-        if r2.status_code >= 400:
-            return None
+            r2 = sess.get(self.specials_url, headers=headers, timeout=30)
+            add_bytes(len(r1.content) + len(r2.content))
+            if r2.status_code >= 400:
+                return None
 
-        return r2.text
+            return r2.text
 
     def _fetch_html_playwright(self) -> str:
         from playwright.sync_api import sync_playwright
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/123.0.0.0 Safari/537.36"
-                ),
-                locale="en-US",
-            )
-            page = context.new_page()
-            page.goto(self.specials_url, wait_until="domcontentloaded", timeout=60_000)
-            page.wait_for_selector("div.cc-main-container", timeout=60_000)
-            html = page.content()
-            context.close()
-            browser.close()
-            return html
+        with stage("render"):
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                context = browser.new_context(
+                    user_agent=(
+                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                        "AppleWebKit/537.36 (KHTML, like Gecko) "
+                        "Chrome/123.0.0.0 Safari/537.36"
+                    ),
+                    locale="en-US",
+                )
+                page = context.new_page()
+                page.goto(self.specials_url, wait_until="domcontentloaded", timeout=60_000)
+                page.wait_for_selector("div.cc-main-container", timeout=60_000)
+                html = page.content()
+                context.close()
+                browser.close()
+                add_bytes(len(html.encode("utf-8")))
+                return html
 
     def _get_soup(self) -> BeautifulSoup:
         html = self._fetch_html_requests()
@@ -222,17 +229,7 @@ class PasadenaToyotaScraper(ToyotaBaseScraper):
 
         # Return schema-consistent empty df
         if df.empty:
-            return pd.DataFrame(
-                columns=[
-                    "Model",
-                    "Monthly ($)",
-                    "Term (months)",
-                    "Due at Signing ($)",
-                    "MSRP ($)",
-                    "Expires",
-                    "Dealer Specials Link",
-                ]
-            )
+            return self.normalize_df(pd.DataFrame(columns=self.TABLE_COLUMNS))
 
         # ONLY change column names / final schema (parser unchanged)
         df = df.rename(
@@ -259,11 +256,8 @@ class PasadenaToyotaScraper(ToyotaBaseScraper):
                 "Expires",
                 "Dealer Specials Link",
             ]
-        ].drop_duplicates(
-            subset=["Model", "Monthly ($)", "Term (months)"],
-            keep="first"
-        ).reset_index(drop=True)
+        ].reset_index(drop=True)
 
-        return df
+        return self.normalize_df(df)
 
 
@@ -3,6 +3,7 @@ import time
 import requests
 import pandas as pd
 
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -53,30 +54,32 @@ class ToyotaSantaMonicaScraper(ToyotaBaseScraper):
     def fetch_df(self) -> pd.DataFrame:
         session = requests.Session()
 
-        # warmup for cookies / akamai
-        session.get(
-            self.specials_url,
-            headers={"User-Agent": self.HEADERS["user-agent"]},
-            timeout=30,
-        )
-
-        data = None
-        last_err = None
-
-        for _ in range(3):
-            try:
-                resp = session.post(
-                    self.api_url,
-                    json=self.PAYLOAD,
-                    headers=self.HEADERS,
-                    timeout=30,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                break
-            except Exception as e:
-                last_err = e
-                time.sleep(0.6)
+        with stage("fetch"):
+            # warmup for cookies / akamai
+            session.get(
+                self.specials_url,
+                headers={"User-Agent": self.HEADERS["user-agent"]},
+                timeout=30,
+            )
+
+            data = None
+            last_err = None
+
+            for _ in range(3):
+                try:
+                    resp = session.post(
+                        self.api_url,
+                        json=self.PAYLOAD,
+                        headers=self.HEADERS,
+                        timeout=30,
+                    )
+                    resp.raise_for_status()
+                    data = resp.json()
+                    add_bytes(len(resp.content))
+                    break
+                except Exception as e:
+                    last_err = e
+                    time.sleep(0.6)
 
         if data is None:
             raise RuntimeError(f"Santa Monica promos API failed: {last_err!r}")
@@ -120,5 +123,5 @@ class ToyotaSantaMonicaScraper(ToyotaBaseScraper):
                 "Dealer Specials Link": self.specials_url,
             })
 
-        return pd.DataFrame(rows)
+        return self.normalize_df(pd.DataFrame(rows))
 
@@ -27,6 +27,6 @@ class SouthBayToyotaScraper(ToyotaBaseScraper):
             "Term (months)",
         ]
 
-        df = pd.DataFrame(columns=columns)
+        df = self.normalize_df(pd.DataFrame(columns=columns))
 
         return df
@@ -1,6 +1,7 @@
 import re
 import requests
 import pandas as pd
+from scrapers.base.stage_timer import add_bytes, stage
 from scrapers.base.toyota_base import ToyotaBaseScraper
 
 
@@ -76,9 +77,11 @@ class ToyotaTorranceScraper(ToyotaBaseScraper):
         return "qualified lessees can lease" in lease
 
     def fetch_df(self) -> pd.DataFrame:
-        resp = requests.post(URL, json=PAYLOAD, headers=HEADERS, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
+        with stage("fetch"):
+            resp = requests.post(URL, json=PAYLOAD, headers=HEADERS, timeout=15)
+            resp.raise_for_status()
+            data = resp.json()
+        add_bytes(len(resp.content))
 
         rows = []
 
@@ -107,4 +110,4 @@ class ToyotaTorranceScraper(ToyotaBaseScraper):
                 "Dealer Specials Link": self.specials_url,
             })
 
-        return pd.DataFrame(rows)
+        return self.normalize_df(pd.DataFrame(rows))
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+from results_cache import encode_json
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrape_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL DEFAULT 0,
+    published_generation INTEGER NOT NULL DEFAULT 0,
+    running INTEGER NOT NULL DEFAULT 0,
+    owner_host TEXT,
+    owner_pid INTEGER,
+    heartbeat_at REAL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    run_id INTEGER,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    stale INTEGER NOT NULL DEFAULT 0,
+    last_completed_at TEXT,
+    monitor_version INTEGER NOT NULL DEFAULT 0,
+    monitor TEXT
+);
+
+INSERT OR IGNORE INTO scrape_state (id) VALUES (1);
+
+CREATE TABLE IF NOT EXISTS scrape_rows (
+    generation INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (generation, seq)
+);
+"""
+
+_HOST = socket.gethostname()
+# A run owned by another host is considered abandoned once its heartbeat is this old
+LEASE_SECONDS = 120.0
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedScrapeState:
+    """
+    Scrape state shared by every worker process through one SQLite (WAL) file.
+
+    The worker that wins ``acquire_run`` writes through to it while it
+    scrapes; every other worker reads the single ``scrape_state`` row to see
+    whether anything moved and pulls only the new rows. WAL mode keeps those
+    readers from blocking the writer.
+
+    Rows are double-buffered like the in-process state: ``published_generation``
+    is the last complete run and ``generation`` the one being filled. Only
+    those two generations are kept; ``finish_run`` flips the published one.
+
+    The run lock is the ``running`` flag plus the owner's host and pid, taken
+    in an IMMEDIATE transaction; a lock held by a dead process on this host
+    is treated as released. Another host's process can't be probed, so the
+    owner renews ``heartbeat_at`` while it runs and a lock whose heartbeat
+    is older than ``lease_seconds`` is reclaimed.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    # ---------------- connection ----------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                    self._schema_ready = True
+
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _holder_alive(self, row: sqlite3.Row) -> bool:
+        if not row["running"]:
+            return False
+        if row["owner_host"] != _HOST:
+            # Can't probe another machine; trust the flag while its lease is fresh
+            heartbeat = row["heartbeat_at"]
+            return heartbeat is not None and time.time() - heartbeat < self.lease_seconds
+        return _pid_alive(row["owner_pid"])
+
+    # ---------------- run lock ----------------
+
+    def acquire_run(self) -> bool:
+        """Take the cross-process run lock; False if a live worker already holds it."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT * FROM scrape_state WHERE id = 1").fetchone()
+                if self._holder_alive(row):
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.execute(
+                    "UPDATE scrape_state SET running = 1, owner_host = ?, owner_pid = ?, heartbeat_at = ? WHERE id = 1",
+                    (_HOST, os.getpid(), time.time()),
+                )
+                conn.execute("COMMIT")
+                return True
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def heartbeat(self) -> bool:
+        """Renew this process's run lease; False if it no longer holds the run."""
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE scrape_state SET heartbeat_at = ? WHERE id = 1 AND running = 1 AND owner_host = ? AND owner_pid = ?",
+                (time.time(), _HOST, os.getpid()),
+            )
+            return cursor.rowcount == 1
+
+    def release_run(self) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE scrape_state SET running = 0 WHERE id = 1 AND owner_host = ? AND owner_pid = ?",
+                (_HOST, os.getpid()),
+            )
+
+    # ---------------- writes (run owner) ----------------
+
+    def begin_run(self, total: int, run_id: Optional[int], rows: List[Dict[str, Any]]) -> int:
+        """Start a staging generation holding ``rows``; all but the published generation are dropped."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT generation, published_generation FROM scrape_state WHERE id = 1").fetchone()
+                generation = row["generation"] + 1
+                conn.execute(
+                    "DELETE FROM scrape_rows WHERE generation <> ?", (row["published_generation"],)
+                )
+                self._insert_rows(conn, generation, 0, rows)
+                conn.execute(
+                    """
+                    UPDATE scrape_state SET
+                        generation = ?, progress = 0, total = ?, run_id = ?,
+                        row_count = ?
+                    WHERE id = 1
+                    """,
+                    (generation, total, run_id, len(rows)),
+                )
+                conn.execute("COMMIT")
+                return generation
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def append_rows(self, generation: int, offset: int, rows: List[Dict[str, Any]], progress: int) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._insert_rows(conn, generation, offset, rows)
+                conn.execute(
+                    "UPDATE scrape_state SET row_count = ?, progress = ? WHERE id = 1 AND generation = ?",
+                    (offset + len(rows), progress, generation),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def finish_run(self, last_completed_at: str) -> None:
+        """Publish the staging generation and release the run."""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                """
+                UPDATE scrape_state SET
+                    running = 0, published_generation = generation, stale = 0, last_completed_at = ?
+                WHERE id = 1
+                """,
+                (last_completed_at,),
+            )
+
+    def put_monitor(self, monitor: Dict[str, Any]) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE scrape_state SET monitor = ?, monitor_version = monitor_version + 1 WHERE id = 1",
+                (encode_json(monitor).decode("utf-8"),),
+            )
+
+    def seed(
+        self,
+        rows: List[Dict[str, Any]],
+        run_id: Optional[int],
+        last_completed_at: Optional[str],
+        monitor: Dict[str, Any],
+    ) -> bool:
+        """
+        Called by each worker at startup with its warm-loaded run. The first
+        worker publishes it as generation 1; later ones only mark whatever is
+        shared as stale (it predates this deployment too, unless a run is live).
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT * FROM scrape_state WHERE id = 1").fetchone()
+                if row["generation"]:
+                    if not self._holder_alive(row):
+                        conn.execute("UPDATE scrape_state SET stale = 1 WHERE id = 1")
+                    conn.execute("COMMIT")
+                    return False
+                self._insert_rows(conn, 1, 0, rows)
+                conn.execute(
+                    """
+                    UPDATE scrape_state SET
+                        generation = 1, published_generation = 1, progress = 0, total = 0, run_id = ?, row_count = ?,
+                        stale = 1, last_completed_at = ?, monitor = ?, monitor_version = monitor_version + 1
+                    WHERE id = 1
+                    """,
+                    (run_id, len(rows), last_completed_at, encode_json(monitor).decode("utf-8")),
+                )
+                conn.execute("COMMIT")
+                return True
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _insert_rows(conn: sqlite3.Connection, generation: int, offset: int, rows: List[Dict[str, Any]]) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO scrape_rows (generation, seq, data) VALUES (?, ?, ?)",
+            ((generation, offset + i, encode_json(row).decode("utf-8")) for i, row in enumerate(rows)),
+        )
+
+    # ---------------- reads (every worker) ----------------
+
+    def read_state(self) -> Dict[str, Any]:
+        """The shared state row; ``running`` is False if its owner has died."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM scrape_state WHERE id = 1").fetchone()
+        state = {key: row[key] for key in row.keys() if key != "monitor"}
+        state["running"] = self._holder_alive(row)
+        state["stale"] = bool(row["stale"])
+        return state
+
+    def read_rows(self, generation: int, offset: int = 0) -> List[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT data FROM scrape_rows WHERE generation = ? AND seq >= ? ORDER BY seq",
+                (generation, offset),
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def read_monitor(self) -> Optional[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT monitor FROM scrape_state WHERE id = 1").fetchone()
+        return json.loads(row["monitor"]) if row["monitor"] else None
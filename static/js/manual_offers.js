@@ -16,6 +16,8 @@
     const removeButton = document.getElementById("manual-remove-rows");
     const saveButton = document.getElementById("manual-save");
     const cancelButton = document.getElementById("manual-cancel");
+    const importInput = document.getElementById("manual-import-file");
+    const importButton = document.getElementById("manual-import");
     const dealershipInput = document.getElementById("manual-dealership");
     const linkInput = document.getElementById("manual-link");
     const dataframeBody = document.querySelector("#manual-dataframe tbody");
@@ -33,7 +35,8 @@
         const row = {};
         columns.forEach(({ id }) => {
             const value = document.getElementById(id)?.value.trim();
-            row[id] = value === "" ? "None" : value;
+            // Empty fields are saved as null, not the text "None"
+            row[id] = value ? value : null;
         });
         return row;
     };
@@ -66,7 +69,7 @@
             // data cells
             columns.forEach(({ id }) => {
                 const td = document.createElement("td");
-                td.textContent = row[id];
+                td.textContent = row[id] ?? "";
                 tr.appendChild(td);
             });
 
@@ -143,6 +146,45 @@
         }
     });
 
+    importButton?.addEventListener("click", async () => {
+        const file = importInput?.files?.[0];
+
+        if (!file) {
+            alert("Choose a CSV file to import.");
+            return;
+        }
+
+        const form = new FormData();
+        form.append("file", file);
+        const params = new URLSearchParams();
+        const dealership = dealershipInput?.value.trim();
+        if (dealership) params.set("dealership", dealership);
+
+        try {
+            const response = await fetch(`/manual-offers/import?${params}`, {
+                method: "POST",
+                body: form
+            });
+
+            const body = await response.json().catch(() => ({}));
+
+            if (!response.ok) {
+                throw new Error(body.error || "Failed to import manual offers.");
+            }
+
+            const problems = (body.issues || [])
+                .filter(issue => issue.errors.length)
+                .slice(0, 10)
+                .map(issue => `Line ${issue.line}: ${issue.errors.join(", ")}`);
+
+            alert(
+                [`Imported ${body.imported} offers, rejected ${body.rejected}.`, ...problems].join("\n")
+            );
+        } catch (error) {
+            alert(error.message);
+        }
+    });
+
     cancelButton?.addEventListener("click", () => {
         window.close();
     });
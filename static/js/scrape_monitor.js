@@ -16,9 +16,18 @@
 
     const pollIntervalMs = 3000;
 
+    // The server answers unchanged snapshots with 304; the browser hands us
+    // the cached body, so only re-render when the ETag moves.
+    let lastEtag = null;
+
     async function loadMonitor() {
         try {
-            const payload = await fetch("/scraper-monitor").then((res) => res.json());
+            const res = await fetch("/scraper-monitor");
+            const etag = res.headers.get("ETag");
+            if (etag && etag === lastEtag) return;
+
+            const payload = await res.json();
+            lastEtag = etag;
             renderSummary(payload);
             renderDealers(payload);
         } catch (err) {
@@ -27,7 +36,7 @@
     }
 
     function renderSummary(payload) {
-        runningEl.textContent = payload.running ? "Yes" : "No";
+        runningEl.textContent = payload.running ? "Yes" : payload.stale ? "No (restored last run)" : "No";
         startedEl.textContent = formatDate(payload.started_at);
         updatedEl.textContent = formatDate(payload.updated_at);
     }
@@ -37,7 +46,7 @@
         const dealerNames = Object.keys(dealers).sort((a, b) => a.localeCompare(b));
 
         if (!dealerNames.length) {
-            tableBody.innerHTML = `<tr class="empty-row"><td colspan="6">Waiting for scrape data…</td></tr>`;
+            tableBody.innerHTML = `<tr class="empty-row"><td colspan="9">Waiting for scrape data…</td></tr>`;
             return;
         }
 
@@ -49,10 +58,13 @@
 
             row.appendChild(textCell(dealerName));
             row.appendChild(statusCell(dealer.status));
-            row.appendChild(textCell(dealer.total_rows));
+            row.appendChild(textCell(formatRows(dealer)));
             row.appendChild(textCell(dealer.invalid_required_rows));
             row.appendChild(textCell(dealer.attention_rows));
             row.appendChild(textCell(formatIssues(dealer.top_issues)));
+            row.appendChild(textCell(formatSeconds(dealer.duration_s)));
+            row.appendChild(textCell(formatBytes(dealer.bytes_downloaded)));
+            row.appendChild(textCell(formatTimings(dealer.timings)));
 
             tableBody.appendChild(row);
         });
@@ -78,6 +90,32 @@
         return issues.slice(0, 3).join(", ");
     }
 
+    function formatSeconds(seconds) {
+        if (typeof seconds !== "number") return "—";
+        return `${seconds.toFixed(2)}s`;
+    }
+
+    function formatRows(dealer) {
+        if (!dealer.duplicates_removed) return dealer.total_rows;
+        return `${dealer.total_rows} (${dealer.duplicates_removed} duplicates removed)`;
+    }
+
+    function formatBytes(count) {
+        if (typeof count !== "number" || count <= 0) return "—";
+        if (count < 1024) return `${count} B`;
+        if (count < 1024 * 1024) return `${(count / 1024).toFixed(1)} KB`;
+        return `${(count / (1024 * 1024)).toFixed(1)} MB`;
+    }
+
+    // Only stages that took measurable time, e.g. "fetch 1.20s · parse 0.08s"
+    function formatTimings(timings) {
+        if (!timings) return "—";
+        const parts = Object.entries(timings)
+            .filter(([, seconds]) => seconds >= 0.01)
+            .map(([name, seconds]) => `${name} ${seconds.toFixed(2)}s`);
+        return parts.length ? parts.join(" · ") : "—";
+    }
+
     function formatDate(isoString) {
         if (!isoString) return "—";
         const date = new Date(isoString);
@@ -85,6 +123,84 @@
         return date.toLocaleString();
     }
 
+    // ---------------- PROFILES ----------------
+    const profilesBody = document.getElementById("profiles-table-body");
+    const profileInput = document.getElementById("profile-dealers");
+    const profileButton = document.getElementById("start-profiled-scrape");
+
+    async function loadProfiles() {
+        if (!profilesBody) return;
+        try {
+            const res = await fetch("/profiles");
+            if (!res.ok) return;
+            renderProfiles(await res.json());
+        } catch (err) {
+            console.error("Failed to load profiles", err);
+        }
+    }
+
+    function renderProfiles(runs) {
+        const rows = [];
+        runs.forEach((run) => {
+            run.dealers.forEach((dealer) => rows.push([run.run, dealer]));
+        });
+
+        if (!rows.length) {
+            profilesBody.innerHTML = `<tr class="empty-row"><td colspan="4">No profiles captured yet.</td></tr>`;
+            return;
+        }
+
+        profilesBody.innerHTML = "";
+        rows.forEach(([runName, dealer]) => {
+            const row = document.createElement("tr");
+            row.appendChild(textCell(runName));
+            row.appendChild(textCell(dealer.dealer));
+            row.appendChild(linkCell(`/profiles/${dealer.summary}`, "View"));
+            row.appendChild(linkCell(`/profiles/${dealer.stats}`, `Download (${formatBytes(dealer.size)})`));
+            profilesBody.appendChild(row);
+        });
+    }
+
+    function linkCell(href, label) {
+        const td = document.createElement("td");
+        const link = document.createElement("a");
+        link.href = href;
+        link.target = "_blank";
+        link.rel = "noopener";
+        link.textContent = label;
+        td.appendChild(link);
+        return td;
+    }
+
+    if (profileButton) {
+        profileButton.addEventListener("click", async () => {
+            const targets = profileInput?.value.trim() || "all";
+            const url = new URL("/start-scraping", window.location.origin);
+            url.searchParams.set("profile", targets);
+
+            const res = await fetch(url).then((r) => r.json());
+            if (res.status === "already_running") {
+                alert("A scrape is already running; profiling applies to the next run.");
+            }
+        });
+    }
+
+    // Refresh as soon as a dealer finishes; the slow poll only covers missed events
+    function listen() {
+        const source = new EventSource("/events");
+        ["run-started", "dealer", "run-finished", "resync"].forEach((name) => {
+            source.addEventListener(name, loadMonitor);
+        });
+        source.addEventListener("run-finished", loadProfiles);
+    }
+
     loadMonitor();
-    setInterval(loadMonitor, pollIntervalMs);
+    loadProfiles();
+    if (window.EventSource) {
+        listen();
+        setInterval(loadMonitor, pollIntervalMs * 10);
+    } else {
+        setInterval(loadMonitor, pollIntervalMs);
+        setInterval(loadProfiles, pollIntervalMs * 10);
+    }
 })();
\ No newline at end of file
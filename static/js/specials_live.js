@@ -1,30 +1,128 @@
 (async function () {
     // ---------------- START BACKGROUND SCRAPING ----------------
-    fetch("/start-scraping");
+    const started = fetch("/start-scraping");
 
     const progressEl = document.getElementById("progress");
     const listEl = document.getElementById("specials-list");
 
-    let lastRowCount = 0;
+    // ?live=1 shows rows as dealers finish; otherwise the last complete run
+    // stays on screen until the next one has fully landed
+    const live = new URLSearchParams(window.location.search).get("live") === "1";
+
+    let cursor = "";
+    let generation = null;
+    let rows = [];
+
+    // Full sync through the delta feed; also returns the event id to resume from
+    async function syncRows() {
+        const url = new URL("/scrape-results/delta", window.location.origin);
+        if (live) url.searchParams.set("live", "1");
+        const delta = await fetch(url).then(r => r.json());
+        rows = delta.rows;
+        cursor = delta.cursor;
+        generation = delta.generation;
+        renderGrouped(rows);
+        showProgress(delta);
+        return delta;
+    }
 
-    const poll = setInterval(async () => {
-        const status = await fetch("/scrape-status").then(r => r.json());
-        const rows = await fetch("/scrape-results").then(r => r.json());
+    function showProgress(data) {
+        if (data.stale && !data.running) {
+            progressEl.textContent = `Showing ${rows.length} rows from the last run (${formatDate(data.last_completed_at)})`;
+            return;
+        }
+        if (data.running === false) {
+            progressEl.textContent = `Loaded ${rows.length} rows`;
+        } else if (live) {
+            progressEl.textContent = `${data.progress} / ${data.total}`;
+        } else {
+            progressEl.textContent = `${data.progress} / ${data.total} (showing ${rows.length} rows from the last complete run)`;
+        }
+    }
 
-        progressEl.textContent = `${status.progress} / ${status.total}`;
+    // Events carry the offset of their first row, so rows already seen
+    // through the delta sync are skipped and gaps trigger a resync
+    function applyRows(data) {
+        if (data.generation !== generation) {
+            if (data.offset !== 0) return syncRows();
+            rows = [];
+            generation = data.generation;
+        }
 
-        // renderGrouped(rows);
+        const skip = rows.length - data.offset;
+        if (skip < 0) return syncRows();
 
-        if (rows.length > lastRowCount) {
+        const fresh = data.rows.slice(skip);
+        if (fresh.length || data.offset === 0) {
+            rows = rows.concat(fresh);
             renderGrouped(rows);
-            lastRowCount = rows.length;
         }
+    }
 
-        if (!status.running) {
-            clearInterval(poll);
-            progressEl.textContent = `Loaded ${rows.length} rows`;
+    function listen(lastEventId) {
+        const url = new URL("/events", window.location.origin);
+        url.searchParams.set("last_event_id", lastEventId);
+        const source = new EventSource(url);
+
+        source.addEventListener("run-started", (e) => {
+            const data = JSON.parse(e.data);
+            if (live) applyRows(data);
+            showProgress(data);
+        });
+        source.addEventListener("dealer", (e) => {
+            const data = JSON.parse(e.data);
+            if (live) applyRows(data);
+            showProgress(data);
+        });
+        source.addEventListener("run-finished", (e) => {
+            const data = JSON.parse(e.data);
+            // The finished run has just been published; pick it up unless already shown
+            if (data.generation !== generation || rows.length !== data.rows) {
+                syncRows();
+            } else {
+                showProgress({ ...data, running: false });
+            }
+        });
+        source.addEventListener("resync", () => syncRows());
+    }
+
+    // Fallback for browsers without EventSource: one delta request per tick
+    function poll() {
+        const timer = setInterval(async () => {
+            const url = new URL("/scrape-results/delta", window.location.origin);
+            if (cursor) url.searchParams.set("cursor", cursor);
+            if (live) url.searchParams.set("live", "1");
+            const delta = await fetch(url).then(r => r.json());
+
+            if (delta.reset) {
+                rows = [];
+            }
+            if (delta.reset || delta.rows.length) {
+                rows = rows.concat(delta.rows);
+                renderGrouped(rows);
+            }
+            cursor = delta.cursor;
+            generation = delta.generation;
+            showProgress(delta);
+
+            if (!delta.running) {
+                clearInterval(timer);
+            }
+        }, 1000);
+    }
+
+    // Not awaited, so the modal wiring below does not wait on the network
+    startLive();
+
+    async function startLive() {
+        await started;
+        const initial = await syncRows();
+        if (window.EventSource) {
+            listen(initial.event_id);
+        } else {
+            poll();
         }
-    }, 1000);
+    }
 
     function renderGrouped(rows) {
         if (!listEl) return;
@@ -121,6 +219,12 @@
         });
     }
 
+    function formatDate(isoString) {
+        if (!isoString) return "earlier";
+        const date = new Date(`${isoString}Z`);
+        return Number.isNaN(date.getTime()) ? isoString : date.toLocaleString();
+    }
+
     function findDealershipLink(offers) {
         for (const offer of offers) {
             const linkEntry = Object.entries(offer).find(([key, value]) => {
@@ -0,0 +1,82 @@
+import io
+import sys
+import types
+from datetime import date, datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from archive import OfferArchive  # noqa: E402
+
+ROWS = [
+    {"Dealership": "Keyes Toyota", "Model": "2025 Toyota RAV4 LE", "Monthly ($)": 299.0, "Term (months)": 36, "Expires": "1/5/2027"},
+    {"Dealership": "Mercedes-Benz of Los Angeles", "Model": "GLC 300", "Monthly ($)": "$569", "MSRP ($)": "51,000", "Term (months)": "36"},
+]
+
+
+def _brand(dealer):
+    return "Mercedes-Benz" if dealer.startswith("Mercedes") else "Toyota"
+
+
+def test_runs_are_partitioned_and_typed(tmp_path):
+    archive = OfferArchive(str(tmp_path))
+    archive.append_run(ROWS, 1, datetime(2026, 1, 5, 8), _brand)
+    archive.append_run(ROWS, 2, datetime(2026, 2, 5, 8), _brand)
+
+    assert (tmp_path / "run_date=2026-01-05" / "brand=Toyota" / "run-1-0.parquet").exists()
+
+    table = archive.read(columns=["run_id", "monthly", "msrp", "term_months", "expires"], brands=["Mercedes-Benz"])
+    assert table.schema.field("term_months").type == pa.int32()
+    assert table.sort_by("run_id").to_pylist() == [
+        {"run_id": 1, "monthly": 569.0, "msrp": 51000.0, "term_months": 36, "expires": None},
+        {"run_id": 2, "monthly": 569.0, "msrp": 51000.0, "term_months": 36, "expires": None},
+    ]
+
+
+def test_read_filters_by_run_date_and_model(tmp_path):
+    archive = OfferArchive(str(tmp_path))
+    archive.append_run(ROWS, 1, datetime(2026, 1, 5, 8), _brand)
+    archive.append_run(ROWS, 2, datetime(2026, 2, 5, 8), _brand)
+    # Re-archiving a run replaces its files rather than duplicating rows
+    archive.append_run(ROWS, 2, datetime(2026, 2, 5, 8), _brand)
+
+    table = archive.read(columns=["run_date", "model", "expires"], start=date(2026, 2, 1), model="rav4")
+    assert table.to_pylist() == [
+        {"run_date": date(2026, 2, 5), "model": "2025 Toyota RAV4 LE", "expires": date(2027, 1, 5)},
+    ]
+
+    with pytest.raises(ValueError):
+        archive.read(columns=["price"])
+
+
+def test_brand_and_dealership_filters_ignore_case(tmp_path):
+    archive = OfferArchive(str(tmp_path))
+    archive.append_run(ROWS, 1, datetime(2026, 1, 5, 8), _brand)
+
+    assert archive.read(columns=["model"], brands=["mercedes-benz"]).to_pylist() == [{"model": "GLC 300"}]
+    assert archive.read(columns=["model"], dealerships=["KEYES TOYOTA"]).to_pylist() == [{"model": "2025 Toyota RAV4 LE"}]
+    assert archive.read(columns=["model"], brands=["toyota"], dealerships=["mercedes-benz of los angeles"]).num_rows == 0
+
+
+def test_archive_endpoint_exports_parquet(tmp_path, monkeypatch):
+    archive = OfferArchive(str(tmp_path))
+    archive.append_run(ROWS, 1, datetime(2026, 1, 5, 8), _brand)
+    monkeypatch.setattr(app_module, "ARCHIVE", archive)
+    client = app_module.app.test_client()
+
+    response = client.get("/archive/offers?format=parquet&brand=toyota&columns=dealership,monthly")
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.data))
+    assert table.to_pylist() == [{"dealership": "Keyes Toyota", "monthly": 299.0}]
+
+    rows = client.get("/archive/offers?columns=model").get_json()
+    assert sorted(row["model"] for row in rows) == ["2025 Toyota RAV4 LE", "GLC 300"]
+    assert client.get("/archive/offers?start=yesterday").status_code == 400
+    assert client.get("/archive/offers?format=xml").status_code == 400
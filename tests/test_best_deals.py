@@ -0,0 +1,47 @@
+import sys
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from best_deals import BestDealIndex  # noqa: E402
+
+ROWS = [
+    {"Dealership": "Keyes Toyota", "Model": "2025 Toyota RAV4 LE", "Monthly ($)": 299.0, "Term (months)": 36, "Due at Signing ($)": 3600.0},
+    {"Dealership": "Keyes Toyota", "Model": "2025 Toyota RAV4 LE", "Monthly ($)": 329.0, "Term (months)": 36, "Due at Signing ($)": 0.0},
+    {"Dealership": "Cabe Toyota", "Model": "2026  toyota rav4 le", "Monthly ($)": 349.0, "Term (months)": 36, "Due at Signing ($)": 999.0},
+    {"Dealership": "Penske_Toyota", "Model": "2025 Toyota RAV4 LE", "Monthly ($)": "319", "Term (months)": "39", "Due at Signing ($)": "1,999"},
+    {"Dealership": "Cabe Toyota", "Model": "2025 Toyota Camry", "Monthly ($)": 259.0, "Term (months)": 36, "Due at Signing ($)": None},
+]
+
+
+def test_dealers_ranked_by_effective_monthly_with_one_offer_each():
+    index = BestDealIndex(ROWS, lambda dealer: "Toyota", is_manual=lambda dealer: dealer == "Penske_Toyota")
+
+    deals = index.top("Toyota RAV4 LE")
+    # 329 + 0 beats 299 + 3600 / 36 = 399 for Keyes; "1,999" can't be parsed, so Penske is left out
+    assert [(d["dealership"], d["effective_monthly"]) for d in deals] == [
+        ("Keyes Toyota", 329.0),
+        ("Cabe Toyota", 376.75),
+    ]
+    assert index.top("toyota rav4 le", 1)[0]["rank"] == 1
+    # Camry has no due at signing, so it can't be costed
+    assert index.top("2025 Toyota Camry") is None
+
+
+def test_best_deals_endpoint(monkeypatch):
+    monkeypatch.setitem(app_module.DEALER_BRANDS, "Keyes Toyota", "Toyota")
+    client = app_module.app.test_client()
+    with app_module.SCRAPE_LOCK:
+        app_module.SCRAPE_STATE["generation"] += 1
+        app_module.SCRAPE_STATE["rows"] = list(ROWS)
+
+    body = client.get("/best-deals?model=2025 Toyota RAV4 LE&top=1").get_json()
+    assert body["model"] == "2025 Toyota RAV4 LE"
+    assert [d["dealership"] for d in body["deals"]] == ["Keyes Toyota"]
+    assert body["deals"][0]["source"] == "scraped"
+
+    assert [d["key"] for d in client.get("/best-deals").get_json()["models"]] == ["toyota rav4 le"]
+    assert client.get("/best-deals?model=Tundra").status_code == 404
@@ -0,0 +1,60 @@
+import pandas as pd
+
+from dedup import ALL_COLUMNS, RunDeduplicator, fingerprints
+
+RAV4 = {
+    "Dealership": "Penske Toyota",
+    "Model": "New 2025 Toyota RAV4 LE",
+    "Monthly ($)": 299,
+    "Term (months)": 36,
+    "Due at Signing ($)": 2999.0,
+    "Expires": "1/5/2026",
+}
+
+
+def test_fingerprints_compare_normalized_fields():
+    frame = pd.DataFrame([
+        RAV4,
+        {**RAV4, "Dealership": "penske_toyota", "Model": "2025 toyota  RAV4 le", "Monthly ($)": 299.0, "Expires": "01/05/2026"},
+        {**RAV4, "Monthly ($)": 309.0},
+    ])
+    prints = fingerprints(frame)
+    assert prints[0] == prints[1]
+    assert prints[0] != prints[2]
+    # Stable across calls (and processes): no per-run salt
+    assert (fingerprints(frame) == prints).all()
+
+
+def test_scraper_keys_and_cross_source_duplicates():
+    dedup = RunDeduplicator()
+    manual, removed = dedup.apply_records([{**RAV4, "Dealership": "Penske_Toyota"}] * 2)
+    assert (len(manual), removed) == (1, 1)
+
+    scraped = pd.DataFrame([
+        RAV4,
+        {**RAV4, "Model": "2025 Toyota Camry SE", "Expires": "2/1/2026"},
+        {**RAV4, "Model": "2025 Toyota Camry SE", "Expires": "3/1/2026"},
+    ])
+    kept, removed = dedup.apply(scraped, keys=("Dealership", "Model", "Monthly ($)", "Term (months)"))
+    # The RAV4 repeats the manual offer; the second Camry repeats the first on this scraper's keys
+    assert removed == 2
+    assert list(kept["Expires"]) == ["2/1/2026"]
+
+    exact = pd.DataFrame([{**RAV4, "Dealership": "Other"}, {**RAV4, "Dealership": "Other", "MSRP ($)": 1}])
+    assert dedup.apply(exact, keys=ALL_COLUMNS)[1] == 0
+
+
+def test_same_priced_offers_for_other_years_or_drivetrains_are_kept():
+    frame = pd.DataFrame([
+        {**RAV4, "Model": "2025 Toyota RAV4 LE AWD"},
+        {**RAV4, "Model": "2026 Toyota RAV4 LE FWD"},
+        {**RAV4, "Model": "2026 Toyota RAV4 LE AWD"},
+        {**RAV4, "Model": "2025 Toyota Tundra 4x4 SR5 CrewMax"},
+        {**RAV4, "Model": "2025 Toyota Tundra 4x2 SR5 CrewMax"},
+    ])
+
+    kept, removed = RunDeduplicator().apply(frame)
+    assert (len(kept), removed) == (5, 0)
+    # Pasadena's keys carry no expiry or due at signing; the model still tells them apart
+    kept, removed = RunDeduplicator().apply(frame, keys=("Dealership", "Model", "Monthly ($)", "Term (months)"))
+    assert (len(kept), removed) == (5, 0)
@@ -0,0 +1,66 @@
+import json
+import sys
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from events import Broadcaster  # noqa: E402
+
+
+def _parse(frame):
+    fields = dict(line.split(": ", 1) for line in frame.decode().strip().splitlines())
+    return int(fields["id"]), fields["event"], json.loads(fields["data"])
+
+
+def test_subscribers_receive_published_events():
+    hub = Broadcaster()
+    first, _ = hub.subscribe()
+    second, _ = hub.subscribe()
+
+    event_id = hub.publish("dealer", {"dealer": "Keyes Toyota"})
+
+    for sub in (first, second):
+        assert _parse(sub.queue.get_nowait()) == (event_id, "dealer", {"dealer": "Keyes Toyota"})
+
+
+def test_resume_from_last_event_id_replays_missed_events():
+    hub = Broadcaster(history=3)
+    ids = [hub.publish("dealer", {"n": n}) for n in range(5)]
+
+    _, backlog = hub.subscribe(last_event_id=ids[2])
+    assert [_parse(frame)[2]["n"] for frame in backlog] == [3, 4]
+
+    # Older than the retained history: the client has to resync
+    _, backlog = hub.subscribe(last_event_id=ids[0])
+    assert [_parse(frame)[1] for frame in backlog] == ["resync"]
+
+
+def test_slow_subscriber_is_cut_off_without_blocking_publisher():
+    hub = Broadcaster(client_buffer=2)
+    stream = hub.stream()
+    assert next(stream) == b"retry: 3000\n\n"
+
+    for n in range(10):
+        hub.publish("dealer", {"n": n})
+
+    frames = list(stream)
+    assert len(frames) == 2
+    assert _parse(frames[-1])[1] == "resync"
+    assert hub.subscriber_count == 0
+
+
+def test_events_endpoint_streams_backlog_after_last_event_id():
+    client = app_module.app.test_client()
+    last_id = app_module.EVENTS.publish("run-started", {"generation": 1})
+    app_module.EVENTS.publish("dealer", {"dealer": "Cabe Toyota"})
+
+    response = client.get("/events", headers={"Last-Event-ID": str(last_id)})
+    assert response.mimetype == "text/event-stream"
+
+    chunks = iter(response.response)
+    assert next(chunks) == b"retry: 3000\n\n"
+    assert _parse(next(chunks))[1:] == ("dealer", {"dealer": "Cabe Toyota"})
+    response.close()
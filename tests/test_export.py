@@ -0,0 +1,79 @@
+import csv
+import io
+import sys
+import types
+from datetime import date, datetime
+
+import pytest
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from export import HEADER, export_rows, stream_csv  # noqa: E402
+
+ROWS = [
+    {"Dealership": "Keyes Toyota", "Model": "2025 Toyota RAV4 LE", "Monthly ($)": 299.0, "Due at Signing ($)": 2999.0,
+     "Term (months)": 36, "MSRP ($)": 32009.0, "Expires": "1/5/2099"},
+    {"Dealership": "Cabe Toyota", "Model": "2025 Toyota Camry", "Monthly ($)": None, "Due at Signing ($)": 1999.0,
+     "Term (months)": 36, "Expires": "1/5/2099"},
+]
+
+
+def _set_rows(rows):
+    with app_module.SCRAPE_LOCK:
+        app_module.SCRAPE_STATE["generation"] += 1
+        app_module.SCRAPE_STATE["rows"] = list(rows)
+
+
+def test_csv_stream_is_chunked_and_carries_validation():
+    chunks = list(stream_csv(export_rows([ROWS[:1], ROWS[1:]], date(2026, 1, 5))))
+    assert len(chunks) == 2
+
+    lines = list(csv.reader(io.StringIO("".join(chunks))))
+    assert lines[0] == HEADER
+    assert lines[1][-2:] == ["VALID", ""]
+    assert lines[2][2] == ""
+    assert lines[2][-2:] == ["INVALID_REQUIRED", "monthly is required and must be a number"]
+
+    assert list(stream_csv(export_rows([], date(2026, 1, 5)))) == [",".join(HEADER) + "\r\n"]
+
+
+def test_export_endpoint_applies_results_filters():
+    _set_rows(ROWS)
+    client = app_module.app.test_client()
+
+    response = client.get("/scrape-results/export?dealership=keyes toyota")
+    assert response.status_code == 200
+    assert response.headers["Content-Disposition"].startswith("attachment; filename=offers-")
+    lines = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert [line[0] for line in lines[1:]] == ["Keyes Toyota"]
+
+    assert client.get("/scrape-results/export?format=pdf").status_code == 400
+
+
+def test_xlsx_export():
+    pytest.importorskip("xlsxwriter")
+    _set_rows(ROWS)
+    response = app_module.app.test_client().get("/scrape-results/export?format=xlsx&sort=-monthly")
+    assert response.status_code == 200
+    # A zip container
+    assert response.data[:2] == b"PK"
+
+
+def test_export_archived_run(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    from archive import OfferArchive
+
+    archive = OfferArchive(str(tmp_path))
+    archive.append_run(ROWS, 4, datetime(2026, 1, 5, 8), lambda dealer: "Toyota")
+    monkeypatch.setattr(app_module, "ARCHIVE", archive)
+    client = app_module.app.test_client()
+
+    response = client.get("/scrape-results/export?run_id=4&max_monthly=300")
+    lines = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert [line[1] for line in lines[1:]] == ["2025 Toyota RAV4 LE"]
+    assert lines[1][6] == "2099-01-05"
+
+    assert client.get("/scrape-results/export?run_id=5").status_code == 404
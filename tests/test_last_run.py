@@ -0,0 +1,53 @@
+import gzip
+import sys
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+import scraper_monitor  # noqa: E402
+from last_run import load_last_run, save_last_run  # noqa: E402
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "last_run.json.gz")
+    rows = [{"Dealership": "Keyes Toyota", "Monthly ($)": float("nan"), "Model": "RAV4"}]
+
+    save_last_run(path, rows, {"dealers": {"Keyes Toyota": {"status": "OK"}}}, run_id=4)
+    document = load_last_run(path)
+
+    assert document["run_id"] == 4
+    assert document["rows"] == [{"Dealership": "Keyes Toyota", "Monthly ($)": None, "Model": "RAV4"}]
+    assert document["monitor"]["dealers"]["Keyes Toyota"]["status"] == "OK"
+    assert [p.name for p in tmp_path.iterdir()] == ["last_run.json.gz"]
+
+
+def test_load_ignores_missing_and_corrupt_files(tmp_path):
+    path = tmp_path / "last_run.json.gz"
+    assert load_last_run(str(path)) is None
+
+    path.write_bytes(gzip.compress(b"{not json"))
+    assert load_last_run(str(path)) is None
+
+
+def test_warm_load_serves_rows_marked_stale(tmp_path, monkeypatch):
+    path = str(tmp_path / "last_run.json.gz")
+    save_last_run(
+        path,
+        [{"Dealership": "Cabe Toyota", "Model": "Camry"}],
+        {"started_at": "2026-01-05T08:00:00", "dealers": {"Cabe Toyota": {"status": "OK"}}},
+    )
+    monkeypatch.setattr(app_module, "LAST_RUN_PATH", path)
+
+    app_module.warm_load_last_run()
+    client = app_module.app.test_client()
+
+    status = client.get("/scrape-status").get_json()
+    assert status["stale"] is True
+    assert status["last_completed_at"]
+    assert client.get("/scrape-results").get_json() == [{"Dealership": "Cabe Toyota", "Model": "Camry"}]
+    assert scraper_monitor.SCRAPER_MONITOR["stale"] is True
+    assert "Cabe Toyota" in scraper_monitor.SCRAPER_MONITOR["dealers"]
+    scraper_monitor.reset_monitor_state()
@@ -0,0 +1,101 @@
+import io
+import json
+import sys
+import types
+from datetime import date
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from manual_import import read_csv, summarize, validate_offers  # noqa: E402
+from manual_offers_repo import ID_KEY, ManualOfferStore, ManualOffersRepository  # noqa: E402
+
+
+CSV = (
+    "﻿Dealership,Model,Monthly ($),Term (months),Due at Signing ($),MSRP ($),Expires,Notes\n"
+    "Penske Toyota,2025 Toyota RAV4 2WD LE,$299,39,\"3,999\",32009,01/05/2099,x\n"
+    "Penske Toyota,2025 Toyota Camry SE,,36,2999,None,1/5/2099,\n"
+    "Wondries Toyota,2025 Toyota Prius,279,37,2999,,not a date,\n"
+)
+
+
+def test_rows_are_coerced_and_validated_in_batches():
+    records, ignored = read_csv(io.BytesIO(CSV.encode("utf-8")))
+    results = list(validate_offers(records, date(2026, 1, 1), batch_size=2))
+
+    assert ignored == ["Notes"]
+    assert [result["line"] for result in results] == [2, 3, 4]
+
+    rav4 = results[0]
+    assert rav4["offer"] == {
+        "Dealership": "Penske Toyota",
+        "Dealer Specials Link": None,
+        "Model": "2025 Toyota RAV4 2WD LE",
+        "Monthly ($)": 299.0,
+        "Term (months)": 39,
+        "Due at Signing ($)": 3999.0,
+        "MSRP ($)": 32009.0,
+        "Expires": "1/5/2099",
+    }
+    assert (rav4["row_status"], rav4["errors"], rav4["warnings"]) == ("VALID", [], [])
+
+    camry = results[1]
+    assert camry["row_status"] == "INVALID_REQUIRED"
+    assert camry["errors"] == ["monthly is required and must be a number"]
+    assert camry["offer"]["MSRP ($)"] is None
+
+    prius = results[2]
+    assert prius["row_status"] == "ATTENTION_MODERATE"
+    assert set(prius["warnings"]) == {"expires date is missing or invalid", "term_months is not in the expected set"}
+    assert prius["offer"]["Expires"] == "not a date"
+
+
+def test_summary_rejects_rows_with_errors_and_groups_by_dealer():
+    records, _ = read_csv(io.BytesIO(b"Model,Monthly,Term,Due\n2025 Toyota RAV4 LE,299,36,2999\n,199,36,2999\n"))
+    accepted, report = summarize(validate_offers(records, date(2026, 1, 1), default_dealership="Keyes Toyota"))
+
+    assert list(accepted) == ["Keyes Toyota"]
+    assert (report["rows"], report["imported"], report["rejected"]) == (2, 1, 1)
+    # Line 2 only warns (no expiry); line 3 has no model
+    assert [(issue["line"], bool(issue["errors"])) for issue in report["issues"]] == [(2, False), (3, True)]
+    assert "model is required and must be a meaningful string" in report["issues"][1]["errors"]
+
+
+def test_import_endpoint_writes_through_the_store(tmp_path, monkeypatch):
+    repo = ManualOffersRepository(str(tmp_path), app_module.normalize_manual_rows)
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS", repo)
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS_STORE", ManualOfferStore(repo))
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS_WATCH_INTERVAL", 0)
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session["role"] = "admin"
+
+    def upload(query=""):
+        return client.post(
+            f"/manual-offers/import{query}",
+            data={"file": (io.BytesIO(CSV.encode("utf-8")), "offers.csv")},
+            content_type="multipart/form-data",
+        )
+
+    dry = upload("?dry_run=1").get_json()
+    assert (dry["imported"], dry["rejected"], dry["dry_run"]) == (2, 1, True)
+    assert list(tmp_path.glob("*.json")) == []
+
+    report = upload().get_json()
+    assert report["dealers"] == {"Penske Toyota": 1, "Wondries Toyota": 1}
+    stored = json.loads((tmp_path / "Penske_Toyota.json").read_text(encoding="utf-8"))
+    assert stored[0]["Monthly ($)"] == 299.0 and stored[0][ID_KEY]
+    assert len(repo.rows()) == 2
+
+    # Re-importing the same file updates the same offers
+    upload()
+    assert json.loads((tmp_path / "Penske_Toyota.json").read_text(encoding="utf-8")) == stored
+    assert len(repo.rows()) == 2
+
+    raw = client.post("/manual-offers/import?dealership=Keyes Toyota", data=b"Model,Monthly\n", content_type="text/csv")
+    assert raw.get_json()["rows"] == 0
+    assert client.post("/manual-offers/import", data=b"Dealer,Price\nA,1\n", content_type="text/csv").status_code == 400
+    assert client.post("/manual-offers/import?mode=merge", data=b"").status_code == 400
@@ -0,0 +1,202 @@
+import json
+import os
+import sys
+import threading
+import time
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from manual_offers_repo import ID_KEY, ManualOfferStore, ManualOffersRepository  # noqa: E402
+
+
+def _offer(model, monthly="299"):
+    return {
+        "Model": model,
+        "Monthly ($)": monthly,
+        "Term (months)": "36",
+        "Due at Signing ($)": "2999",
+        "Expires": "1/5/2099",
+    }
+
+
+def _write(path, offers, mtime=None):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(offers, f)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_files_are_parsed_once_per_mtime_and_size(tmp_path):
+    _write(tmp_path / "Keyes_Toyota.json", [_offer("2025 Toyota RAV4 LE")], mtime=1_000)
+    _write(tmp_path / "Cabe_Toyota.json", [_offer("2025 Toyota Camry SE")], mtime=1_000)
+    repo = ManualOffersRepository(str(tmp_path))
+
+    rows = repo.rows()
+    assert sorted(row["Dealership"] for row in rows) == ["Cabe_Toyota", "Keyes_Toyota"]
+    assert repo.loads == 2
+
+    repo.rows()
+    assert repo.loads == 2
+    version = repo.version
+
+    _write(tmp_path / "Keyes_Toyota.json", [_offer("2025 Toyota RAV4 LE"), _offer("2025 Toyota Prius")], mtime=2_000)
+    assert len(repo.rows()) == 3
+    assert repo.loads == 3
+    assert repo.version == version + 1
+
+    os.remove(tmp_path / "Cabe_Toyota.json")
+    assert [row["Model"] for row in repo.rows()] == ["2025 Toyota RAV4 LE", "2025 Toyota Prius"]
+
+
+def test_bad_file_keeps_its_error_and_the_rest_are_served(tmp_path):
+    (tmp_path / "Broken.json").write_text("[{", encoding="utf-8")
+    _write(tmp_path / "Keyes_Toyota.json", [_offer("2025 Toyota RAV4 LE"), _offer("2025 Toyota Camry SE", "0")])
+    repo = ManualOffersRepository(str(tmp_path))
+
+    assert len(repo.rows()) == 2
+    files = {entry["filename"]: entry for entry in repo.files()}
+    assert files["Broken.json"]["error"] and files["Broken.json"]["health"] is None
+    health = files["Keyes_Toyota.json"]["health"]
+    assert (health["valid_rows"], health["invalid_required_rows"]) == (1, 1)
+
+
+def test_watcher_picks_up_changes_without_reads_touching_disk(tmp_path):
+    path = tmp_path / "Keyes_Toyota.json"
+    _write(path, [_offer("2025 Toyota RAV4 LE")], mtime=1_000)
+    repo = ManualOffersRepository(str(tmp_path))
+    repo.watch(interval=0.01)
+    try:
+        assert len(repo.rows()) == 1
+        _write(path, [_offer("2025 Toyota RAV4 LE"), _offer("2025 Toyota Prius")], mtime=2_000)
+        deadline = time.time() + 2
+        while len(repo.rows()) != 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(repo.rows()) == 2
+    finally:
+        repo.stop()
+
+
+def test_concurrent_watch_calls_start_one_watcher(tmp_path):
+    repo = ManualOffersRepository(str(tmp_path))
+    # The app's own repository may already be watching in this process
+    running = set(threading.enumerate())
+    barrier = threading.Barrier(8)
+
+    def start():
+        barrier.wait()
+        repo.watch(interval=0.01)
+
+    callers = [threading.Thread(target=start) for _ in range(8)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+    try:
+        started = [t for t in threading.enumerate() if t not in running and t.name == "manual-offers-watch"]
+        assert started == [repo._watcher]
+    finally:
+        repo.stop()
+
+
+def test_save_invalidates_and_data_endpoint_serves_cached_rows(tmp_path, monkeypatch):
+    repo = ManualOffersRepository(str(tmp_path), app_module.normalize_manual_rows)
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS_DIR", str(tmp_path))
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS", repo)
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS_STORE", ManualOfferStore(repo))
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS_WATCH_INTERVAL", 0)
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session["role"] = "admin"
+
+    offer = {"Dealership": "Keyes Toyota", **_offer("2025 Toyota RAV4 LE")}
+    assert client.post("/manual-offers/save", json={"dealership": "Keyes Toyota", "offers": [offer]}).status_code == 200
+    assert repo.loads == 1
+
+    body = client.get("/manual-offers/data?dealership=Keyes Toyota").get_json()
+    assert [row["Monthly ($)"] for row in body["rows"]] == [299.0]
+    assert body["files"][0]["filename"] == "Keyes_Toyota.json"
+    assert client.get("/manual-offers/data?dealership=Other").get_json()["rows"] == []
+    assert repo.loads == 1
+
+
+def test_store_upserts_and_deletes_single_offers_atomically(tmp_path):
+    _write(tmp_path / "Keyes_Toyota.json", [_offer("2025 Toyota RAV4 LE"), _offer("2025 Toyota Camry SE")])
+    repo = ManualOffersRepository(str(tmp_path))
+    store = ManualOfferStore(repo)
+
+    # Files written before IDs existed get stable content-derived ones
+    ids = [row[ID_KEY] for row in repo.rows()]
+    assert len(set(ids)) == 2
+    assert store.index().get(ids[0])["Model"] == "2025 Toyota RAV4 LE"
+
+    assert store.upsert("Keyes_Toyota", {ID_KEY: ids[1], "Monthly ($)": "249"}) == (ids[1], False)
+    new_id, created = store.upsert("Keyes_Toyota", _offer("2025 Toyota Prius"))
+    assert created
+
+    stored = json.loads((tmp_path / "Keyes_Toyota.json").read_text(encoding="utf-8"))
+    assert [(offer[ID_KEY], offer["Monthly ($)"]) for offer in stored] == [(ids[0], "299"), (ids[1], "249"), (new_id, "299")]
+    assert [path.name for path in tmp_path.iterdir() if not path.name.endswith(".lock")] == ["Keyes_Toyota.json"]
+
+    assert [row["Model"] for row in store.index().find(dealership="keyes_toyota", model="Toyota Prius")] == ["2025 Toyota Prius"]
+
+    assert store.delete(ids[0])
+    assert not store.delete(ids[0])
+    assert [row[ID_KEY] for row in repo.rows()] == [ids[1], new_id]
+
+
+def test_concurrent_upserts_to_one_file_are_all_kept(tmp_path):
+    import threading
+
+    store = ManualOfferStore(ManualOffersRepository(str(tmp_path)))
+    threads = [
+        threading.Thread(target=store.upsert, args=("Keyes Toyota", _offer(f"2025 Toyota Model {n}")))
+        for n in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stored = json.loads((tmp_path / "Keyes_Toyota.json").read_text(encoding="utf-8"))
+    assert len(stored) == 20
+    assert len(store.index().find(dealership="Keyes Toyota")) == 20
+
+
+def test_offer_routes_upsert_get_and_delete(tmp_path, monkeypatch):
+    repo = ManualOffersRepository(str(tmp_path), app_module.normalize_manual_rows)
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS", repo)
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS_STORE", ManualOfferStore(repo))
+    monkeypatch.setattr(app_module, "MANUAL_OFFERS_WATCH_INTERVAL", 0)
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session["role"] = "admin"
+
+    response = client.post("/manual-offers/offers", json={"dealership": "Keyes Toyota", "offer": _offer("2025 Toyota RAV4 LE")})
+    assert response.status_code == 201
+    offer_id = response.get_json()["id"]
+
+    response = client.post("/manual-offers/offers", json={"dealership": "Keyes Toyota", "offer": {ID_KEY: offer_id, "Monthly ($)": "279"}})
+    assert response.get_json()["status"] == "updated"
+    assert client.get(f"/manual-offers/offers/{offer_id}").get_json()["Monthly ($)"] == 279.0
+
+    assert client.delete(f"/manual-offers/offers/{offer_id}").status_code == 200
+    assert client.get(f"/manual-offers/offers/{offer_id}").status_code == 404
+    assert client.post("/manual-offers/offers", json={"dealership": "Keyes Toyota"}).status_code == 400
+
+
+def test_moving_an_offer_with_a_partial_body_keeps_its_other_fields(tmp_path):
+    repo = ManualOffersRepository(str(tmp_path))
+    store = ManualOfferStore(repo)
+    offer_id, _ = store.upsert("Keyes Toyota", _offer("2025 Toyota RAV4 LE"))
+
+    assert store.upsert("Cabe Toyota", {ID_KEY: offer_id, "Monthly ($)": "279"}) == (offer_id, False)
+
+    assert not (tmp_path / "Keyes_Toyota.json").exists()
+    [moved] = json.loads((tmp_path / "Cabe_Toyota.json").read_text(encoding="utf-8"))
+    assert moved == {**_offer("2025 Toyota RAV4 LE", "279"), "Dealership": "Cabe Toyota", ID_KEY: offer_id}
@@ -0,0 +1,52 @@
+import sys
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import metrics  # noqa: E402
+from app import app  # noqa: E402
+
+
+def test_histogram_renders_cumulative_buckets(monkeypatch):
+    # Keep the test histogram out of the process-wide registry (and /metrics in later tests)
+    monkeypatch.setattr(metrics, "_METRICS", [])
+    histogram = metrics.Histogram("test_latency_seconds", "Test latency.", ["endpoint"], buckets=(0.1, 1))
+    histogram.observe(0.05, endpoint="a")
+    histogram.observe(0.1, endpoint="a")
+    histogram.observe(3, endpoint="a")
+
+    lines = histogram.render()
+
+    assert "# TYPE test_latency_seconds histogram" in lines
+    assert 'test_latency_seconds_bucket{endpoint="a",le="0.1"} 2' in lines
+    assert 'test_latency_seconds_bucket{endpoint="a",le="1"} 2' in lines
+    assert 'test_latency_seconds_bucket{endpoint="a",le="+Inf"} 3' in lines
+    assert 'test_latency_seconds_count{endpoint="a"} 3' in lines
+    assert 'test_latency_seconds_sum{endpoint="a"} 3.15' in lines
+
+
+def test_record_dealer_metrics_counts_exceptions_and_durations():
+    entry = {"status": "FAIL", "total_rows": 0, "duration_s": 1.5, "timings": {"fetch": 1.2, "parse": 0.0}}
+
+    metrics.record_dealer_metrics("Test Dealer", entry, RuntimeError("boom"))
+
+    assert metrics.DEALER_EXCEPTIONS.value(dealer="Test Dealer", exception="RuntimeError") == 1
+    assert metrics.DEALER_DURATION.count(dealer="Test Dealer") == 1
+    assert metrics.DEALER_STAGE_DURATION.count(stage="fetch") >= 1
+
+
+def test_metrics_endpoint_exports_api_and_lock_metrics():
+    app.config["TESTING"] = True
+    client = app.test_client()
+
+    client.get("/scrape-results")
+    response = client.get("/metrics")
+    text = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    assert 'http_request_duration_seconds_count{endpoint="scrape_results",status="200"}' in text
+    assert 'http_response_size_bytes_count{endpoint="scrape_results"}' in text
+    assert 'scrape_lock_wait_seconds_count{lock="scrape_state"}' in text
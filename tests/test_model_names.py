@@ -0,0 +1,50 @@
+from model_names import CanonicalModel, cache_stats, canonical_key, canonicalize, canonicalize_column
+
+
+def test_titles_from_different_dealers_share_a_key():
+    titles = [
+        "New 2025 Toyota RAV4 LE",
+        "2025 Toyota RAV4 2WD LE",
+        "2026 toyota  rav-4 le",
+        "RAV4 LE AWD",
+    ]
+    assert {canonical_key(title) for title in titles} == {"toyota rav4 le"}
+
+    assert canonicalize("2025 Toyota RAV4 2WD LE") == CanonicalModel(2025, "Toyota", "RAV4", "LE", "2WD")
+
+
+def test_multi_word_models_makes_and_misspellings():
+    assert canonicalize("2026 Toyota Corolla Cross L").model == "Corolla Cross"
+    assert canonicalize("2025 Mercedes-Benz C 300 Sedan")[1:] == ("Mercedes-Benz", "C-Class", "300 Sedan", None)
+    assert canonicalize("2025 GLC 300 4MATIC SUV") == CanonicalModel(2025, "Mercedes-Benz", "GLC", "300 SUV", "4MATIC")
+    assert canonicalize("Toyota Tacomma TRD Pro").model == "Tacoma"
+
+
+def test_unknown_titles_fall_back_to_cleaned_text():
+    assert canonicalize("Demo Vehicle").model is None
+    assert canonical_key("2025 Demo  Vehicle") == "demo vehicle"
+    assert canonical_key(None) is None
+
+
+def test_column_parses_each_distinct_title_once():
+    before = cache_stats()["misses"]
+    frame = canonicalize_column(["2025 Toyota Camry SE Hybrid"] * 500 + [None])
+
+    assert cache_stats()["misses"] - before <= 1
+    assert frame["model"].iloc[0] == "Camry"
+    assert frame["key"].iloc[0] == "toyota camry se hybrid"
+    assert frame["key"].iloc[-1] is None
+
+
+def test_filler_words_decimals_and_compact_mercedes_names():
+    assert canonicalize("Lease a 2025 Toyota Corolla") == CanonicalModel(2025, "Toyota", "Corolla", None, None)
+    assert canonicalize("2025 Toyota Camry LE 2.5L").trim == "LE 2.5L"
+    assert canonicalize("2025 Mercedes-Benz C300 4MATIC") == CanonicalModel(2025, "Mercedes-Benz", "C-Class", "300", "4MATIC")
+    assert canonicalize("2025 GLC300 SUV")[1:3] == ("Mercedes-Benz", "GLC")
+    assert canonicalize("2025 Mercedes-Benz A 220 Sedan").model == "A-Class"
+
+
+def test_bare_numbers_and_letters_need_context():
+    assert canonicalize("2025 Toyota 86").model == "GR86"
+    assert canonicalize("86 Special").model is None
+    assert canonicalize("Mercedes-Benz C Sport Package").model is None
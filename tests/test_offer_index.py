@@ -0,0 +1,84 @@
+import sys
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from offer_index import OfferIndex, OfferIndexCache  # noqa: E402
+
+ROWS = [
+    {"Dealership": "Keyes Toyota", "Model": "2025 Toyota RAV4 LE", "Monthly ($)": 299.0, "MSRP ($)": 32009.0, "Term (months)": 36},
+    {"Dealership": "Keyes Toyota", "Model": "2025 Toyota Camry", "Monthly ($)": 259.0, "MSRP ($)": 29000.0, "Term (months)": 36},
+    {"Dealership": "Mercedes-Benz of Los Angeles", "Model": "GLC 300", "Monthly ($)": 569.0, "MSRP ($)": 51000.0, "Term (months)": 36},
+    {"Dealership": "Cabe Toyota", "Model": "2025 Toyota RAV4 XLE", "Monthly ($)": None, "MSRP ($)": 34000.0, "Term (months)": 39},
+]
+
+BRANDS = {"Mercedes-Benz of Los Angeles": "Mercedes-Benz"}
+
+
+def _index():
+    return OfferIndex(ROWS, lambda dealer: BRANDS.get(dealer, "Toyota"))
+
+
+def test_query_filters_by_dealer_brand_model_and_range():
+    index = _index()
+
+    assert index.query(dealerships=["keyes toyota"])[0] == 2
+    assert index.query(brands=["Mercedes-Benz"])[1] == [ROWS[2]]
+
+    total, rows = index.query(model="rav4")
+    assert total == 2
+
+    total, rows = index.query(model="rav4", ranges={"monthly": (None, 300)})
+    assert rows == [ROWS[0]]
+
+
+def test_index_cache_keeps_each_index_with_the_version_it_was_built_for():
+    cache = OfferIndexCache(lambda dealer: BRANDS.get(dealer, "Toyota"))
+    runs = {"1": ROWS[:1], "2": ROWS}
+
+    first = cache.get("1", lambda: ("1", runs["1"]))
+    assert cache.get("1", lambda: ("1", runs["1"])) is first
+    second = cache.get("2", lambda: ("2", runs["2"]))
+
+    assert second is not first and second.query()[0] == 4
+    assert cache._entry == ("2", second)
+    assert cache.builds == 2
+
+
+def test_model_search_folds_case_like_the_sort_keys():
+    rows = [{"Dealership": "Keyes Toyota", "Model": "GROSSE Edition"}, {"Dealership": "Keyes Toyota", "Model": "Große Edition"}]
+    index = OfferIndex(rows, lambda dealer: "Toyota")
+
+    assert index.query(model="große")[0] == 2
+    assert index.query(model="GROSSE")[0] == 2
+
+
+def test_query_sorts_with_missing_values_last_and_paginates():
+    index = _index()
+
+    _, rows = index.query(sort=["monthly"])
+    assert [r["Monthly ($)"] for r in rows] == [259.0, 299.0, 569.0, None]
+
+    _, rows = index.query(sort=["-monthly"])
+    assert [r["Monthly ($)"] for r in rows] == [569.0, 299.0, 259.0, None]
+
+    _, rows = index.query(sort=["-term", "model"], page=2, limit=2)
+    assert [r["Model"] for r in rows] == ["2025 Toyota RAV4 LE", "GLC 300"]
+
+
+def test_query_endpoint_validates_and_pages():
+    client = app_module.app.test_client()
+    with app_module.SCRAPE_LOCK:
+        app_module.SCRAPE_STATE["generation"] += 1
+        app_module.SCRAPE_STATE["rows"] = list(ROWS)
+
+    body = client.get("/scrape-results/query?model=toyota&sort=-msrp&limit=2").get_json()
+    assert body["total"] == 3
+    assert body["pages"] == 2
+    assert [r["MSRP ($)"] for r in body["rows"]] == [34000.0, 32009.0]
+
+    assert client.get("/scrape-results/query?sort=price").status_code == 400
+    assert client.get("/scrape-results/query?min_monthly=cheap").status_code == 400
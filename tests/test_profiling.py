@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import pytest
+
+from profiling import ProfileStore, parse_targets, wants_profile
+
+
+def test_parse_targets_and_wants_profile():
+    assert parse_targets(None) is None
+    assert parse_targets("") is None
+    assert parse_targets("all") == {"*"}
+    assert parse_targets("Keyes Toyota, Cabe Toyota") == {"Keyes Toyota", "Cabe Toyota"}
+
+    assert wants_profile({"*"}, "Anyone")
+    assert wants_profile({"Keyes Toyota"}, "Keyes Toyota")
+    assert not wants_profile({"Keyes Toyota"}, "Cabe Toyota")
+    assert not wants_profile(None, "Keyes Toyota")
+
+
+def test_profile_call_saves_artifacts_even_when_fetch_fails(tmp_path):
+    store = ProfileStore(str(tmp_path))
+    run_dir = store.run_dir(7, datetime(2026, 1, 5, 8, 30))
+
+    assert store.profile_call(run_dir, "Keyes Toyota", lambda: sum(range(1000))) == 499500
+
+    def boom():
+        raise RuntimeError("blocked")
+
+    with pytest.raises(RuntimeError):
+        store.profile_call(run_dir, "Cabe Toyota", boom)
+
+    runs = store.list_profiles()
+
+    assert [run["run"] for run in runs] == ["20260105T083000-run7"]
+    dealers = {d["dealer"]: d for d in runs[0]["dealers"]}
+    assert set(dealers) == {"Keyes_Toyota", "Cabe_Toyota"}
+    assert dealers["Keyes_Toyota"]["size"] > 0
+    summary = (tmp_path / dealers["Keyes_Toyota"]["summary"]).read_text()
+    assert summary.startswith("Keyes Toyota")
+    assert "cumulative" in summary
@@ -0,0 +1,93 @@
+import ast
+import importlib.util
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_registry():
+    # Other test modules stub sys.modules["registry"]; load the real file under its own name
+    spec = importlib.util.spec_from_file_location("registry_under_test", os.path.join(ROOT, "registry.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _class_attributes(target):
+    """dealer_name / specials_url as written in the scraper's source, without importing it."""
+    module_name, _, class_name = target.partition(":")
+    path = os.path.join(ROOT, *module_name.split(".")) + ".py"
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    attributes = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            for statement in node.body:
+                if isinstance(statement, ast.Assign):
+                    targets, value = statement.targets, statement.value
+                elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                    targets, value = [statement.target], statement.value
+                else:
+                    continue
+                for name in targets:
+                    if isinstance(name, ast.Name) and name.id in ("dealer_name", "specials_url", "brand"):
+                        attributes[name.id] = ast.literal_eval(value)
+    return attributes
+
+
+def test_specs_match_the_scraper_classes():
+    registry = _load_registry()
+    assert len(registry.SPECS) == 20
+    assert len({spec.dealer_name for spec in registry.SPECS}) == 20
+
+    for spec in registry.SPECS:
+        attributes = _class_attributes(spec.target)
+        assert attributes["dealer_name"] == spec.dealer_name
+        assert attributes["specials_url"] == spec.specials_url
+        assert attributes.get("brand", spec.brand) == spec.brand
+
+
+def test_importing_the_registry_loads_no_scraper_module():
+    code = (
+        "import sys, registry; "
+        "print(len(registry.SCRAPERS), any(name.startswith('scrapers.dealers') for name in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["20", "False"]
+
+
+def test_importing_the_app_loads_no_pandas_numpy_or_pyarrow(tmp_path):
+    code = "import sys, app; print([name for name in ('pandas', 'numpy', 'pyarrow') if name in sys.modules])"
+    env = {**os.environ, "SCRAPE_DATA_DIR": str(tmp_path)}
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    assert output.strip().splitlines()[-1] == "[]"
+
+
+def test_lazy_scraper_imports_its_module_on_first_fetch(tmp_path, monkeypatch):
+    (tmp_path / "fake_dealer_scraper.py").write_text(
+        "LOADS = []\n"
+        "class FakeScraper:\n"
+        "    dedup_keys = '*'\n"
+        "    def __init__(self):\n"
+        "        LOADS.append(1)\n"
+        "    def fetch_df(self):\n"
+        "        return 'rows'\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = _load_registry()
+
+    scraper = registry.LazyScraper(
+        registry.ScraperSpec("Fake Toyota", "Toyota", "https://example.com", "requests", "fake_dealer_scraper:FakeScraper")
+    )
+    assert (scraper.dealer_name, scraper.brand, scraper.class_name) == ("Fake Toyota", "Toyota", "FakeScraper")
+    assert not scraper.loaded
+    assert "fake_dealer_scraper" not in sys.modules
+
+    assert scraper.fetch_df() == "rows"
+    assert scraper.dedup_keys == "*"
+    scraper.fetch_df()
+    assert sys.modules["fake_dealer_scraper"].LOADS == [1]
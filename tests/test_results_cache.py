@@ -0,0 +1,56 @@
+import gzip
+import json
+import sys
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from results_cache import ResultsCache, encode_json  # noqa: E402
+
+
+def test_encode_json_writes_nan_and_inf_as_null():
+    body = encode_json([{"Monthly ($)": float("nan"), "MSRP ($)": float("inf"), "Model": "RAV4"}])
+
+    assert json.loads(body) == [{"Monthly ($)": None, "MSRP ($)": None, "Model": "RAV4"}]
+
+
+def test_results_cache_only_rebuilds_when_version_moves():
+    cache = ResultsCache()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return "1.1", [{"Model": "RAV4"}]
+
+    first = cache.get("1.1", load)
+    again = cache.get("1.1", load)
+
+    assert again is first
+    assert len(loads) == 1
+    assert gzip.decompress(first.encoded("gzip")) == first.body
+
+
+def test_scrape_results_serves_cached_bytes_with_etag_and_gzip():
+    client = app_module.app.test_client()
+    with app_module.SCRAPE_LOCK:
+        app_module.SCRAPE_STATE["generation"] += 1
+        app_module.SCRAPE_STATE["rows"] = [{"Model": "Camry", "Monthly ($)": float("nan")}]
+
+    builds = app_module.RESULTS_CACHE.builds
+    first = client.get("/scrape-results")
+    assert first.status_code == 200
+    assert first.get_json() == [{"Model": "Camry", "Monthly ($)": None}]
+    assert "Accept-Encoding" in first.headers["Vary"]
+
+    repeat = client.get("/scrape-results", headers={"If-None-Match": first.headers["ETag"]})
+    assert repeat.status_code == 304
+
+    zipped = client.get("/scrape-results", headers={"Accept-Encoding": "gzip"})
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.headers["ETag"] != first.headers["ETag"]
+    assert json.loads(gzip.decompress(zipped.get_data())) == first.get_json()
+
+    assert app_module.RESULTS_CACHE.builds == builds + 1
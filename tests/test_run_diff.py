@@ -0,0 +1,106 @@
+import sys
+import types
+from datetime import datetime
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from run_diff import diff_runs  # noqa: E402
+from run_history import RunHistoryStore  # noqa: E402
+
+
+def _row(dealer, model, monthly, term=36, due=2999.0):
+    return {"Dealership": dealer, "Model": model, "Monthly ($)": monthly, "Term (months)": term, "Due at Signing ($)": due}
+
+
+PREVIOUS = [
+    _row("Keyes Toyota", "2025 Toyota RAV4 LE", 299.0),
+    _row("Keyes Toyota", "2025 Toyota Camry SE", 259.0),
+    _row("Cabe Toyota", "2025 Toyota Tacoma SR5", 399.0),
+    _row("Hamer Toyota", "2025 Toyota Prius", 289.0),
+]
+CURRENT = [
+    # Same offer under another title spelling
+    _row("Keyes Toyota", "New 2025 Toyota rav-4 LE", 299.0),
+    _row("Keyes Toyota", "2025 Toyota Camry SE", 269.0),
+    _row("Keyes Toyota", "2025 Toyota Camry SE", 249.0, term=24),
+]
+
+
+def test_diff_reports_added_removed_and_repriced_per_dealer():
+    diffs = diff_runs(PREVIOUS, CURRENT, skip_dealers=["Hamer Toyota"])
+
+    keyes = diffs["Keyes Toyota"]
+    assert [(e["model_key"], e["term"], e["monthly"]) for e in keyes["added"]] == [("toyota camry se", 24, 249.0)]
+    assert keyes["removed"] == []
+    assert [(e["before"]["monthly"], e["after"]["monthly"]) for e in keyes["repriced"]] == [(259.0, 269.0)]
+
+    assert [e["model"] for e in diffs["Cabe Toyota"]["removed"]] == ["2025 Toyota Tacoma SR5"]
+    # Failed this run: its missing rows are not reported as removed
+    assert "Hamer Toyota" not in diffs
+
+
+def test_model_years_and_repeated_identities_are_separate_offers():
+    previous = [
+        _row("Keyes Toyota", "2025 Toyota RAV4 LE", 299.0),
+        _row("Keyes Toyota", "2026 Toyota RAV4 LE", 349.0),
+        _row("Keyes Toyota", "2025 Toyota Camry SE", 259.0, due=2999.0),
+        _row("Keyes Toyota", "2025 Toyota Camry SE", 309.0, due=0.0),
+        _row("Keyes Toyota", "2025 Toyota Prius", 289.0),
+        _row("Keyes Toyota", "2025 Toyota Prius", 289.0),
+    ]
+    current = [
+        _row("Keyes Toyota", "2026 Toyota RAV4 LE", 349.0),
+        _row("Keyes Toyota", "2025 Toyota Camry SE", 309.0, due=0.0),
+        _row("Keyes Toyota", "2025 Toyota Camry SE", 269.0, due=2999.0),
+        _row("Keyes Toyota", "2025 Toyota Prius", 289.0),
+    ]
+    keyes = diff_runs(previous, current)["Keyes Toyota"]
+
+    assert [(e["model"], e["monthly"]) for e in keyes["removed"]] == [
+        ("2025 Toyota Prius", 289.0),
+        ("2025 Toyota RAV4 LE", 299.0),
+    ]
+    assert [(e["before"]["monthly"], e["after"]["monthly"]) for e in keyes["repriced"]] == [(259.0, 269.0)]
+    assert keyes["added"] == []
+
+
+def test_diff_is_stored_with_the_run_and_served(tmp_path, monkeypatch):
+    store = RunHistoryStore(str(tmp_path / "history.sqlite3"))
+    first = store.start_run(datetime(2026, 1, 5, 8))
+    second = store.start_run(datetime(2026, 1, 6, 8))
+    store.record_diff(second, first, diff_runs(PREVIOUS, CURRENT))
+    monkeypatch.setattr(app_module, "RUN_HISTORY", store)
+    client = app_module.app.test_client()
+
+    body = client.get(f"/history/runs/{second}/diff").get_json()
+    assert body["previous_run_id"] == first
+    assert body["summary"] == {"added": 1, "removed": 2, "repriced": 1}
+
+    only = client.get(f"/history/runs/{second}/diff?dealer=Cabe Toyota").get_json()
+    assert list(only["dealers"]) == ["Cabe Toyota"]
+    assert client.get(f"/history/runs/{first}/diff").status_code == 404
+
+
+def test_history_runs_limit_is_clamped(tmp_path, monkeypatch):
+    store = RunHistoryStore(str(tmp_path / "history.sqlite3"))
+    for day in (5, 6, 7):
+        store.start_run(datetime(2026, 1, day, 8))
+    monkeypatch.setattr(app_module, "RUN_HISTORY", store)
+    client = app_module.app.test_client()
+
+    # SQLite reads a negative LIMIT as "no limit"
+    assert len(client.get("/history/runs?limit=-1").get_json()) == 1
+    assert len(client.get("/history/runs?limit=0").get_json()) == 1
+    assert len(client.get("/history/runs?limit=2").get_json()) == 2
+
+
+def test_history_days_are_clamped(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, "RUN_HISTORY", RunHistoryStore(str(tmp_path / "history.sqlite3")))
+    client = app_module.app.test_client()
+
+    assert client.get("/history/success-rate?days=-5").get_json()["days"] == 1
+    assert client.get("/history/dealers/Keyes Toyota?days=0").get_json()["days"] == 1
+    assert client.get("/history/dealers/Keyes Toyota?days=9999").get_json()["days"] == 365
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from run_history import RunHistoryStore
+
+
+def _entry(status, rows, issues=None):
+    return {
+        "status": status,
+        "total_rows": rows,
+        "invalid_required_rows": 0,
+        "attention_rows": 0,
+        "top_issues": issues or [],
+    }
+
+
+def test_runs_and_dealer_results_are_recorded(tmp_path):
+    store = RunHistoryStore(str(tmp_path / "history.sqlite3"))
+
+    run_id = store.start_run(datetime(2024, 1, 1, 10, 0, 0))
+    store.record_dealer(run_id, "Dealer A", _entry("OK", 12), duration_s=1.5, now=datetime(2024, 1, 1, 10, 0, 5))
+    store.record_dealer(
+        run_id, "Dealer B", _entry("FAIL", 0, ["exception: boom"]), duration_s=0.5, now=datetime(2024, 1, 1, 10, 0, 6)
+    )
+    store.finish_run(run_id, datetime(2024, 1, 1, 10, 1, 0))
+
+    runs = store.recent_runs()
+    assert len(runs) == 1
+    assert runs[0]["row_count"] == 12
+    assert runs[0]["dealer_count"] == 2
+    assert round(runs[0]["duration_s"]) == 60
+
+    results = store.run_results(run_id)
+    assert [r["dealer"] for r in results] == ["Dealer A", "Dealer B"]
+    assert results[1]["top_issues"] == ["exception: boom"]
+
+
+def test_success_rates_come_from_daily_rollup(tmp_path):
+    store = RunHistoryStore(str(tmp_path / "history.sqlite3"))
+
+    for day, status in [(1, "OK"), (2, "FAIL"), (2, "NEEDS_ATTENTION"), (3, "OK")]:
+        run_id = store.start_run(datetime(2024, 1, day))
+        store.record_dealer(run_id, "Dealer A", _entry(status, 10), duration_s=2.0, now=datetime(2024, 1, day, 12))
+
+    rates = store.success_rates(days=30, now=datetime(2024, 1, 10))
+    assert rates == [
+        {
+            "dealer": "Dealer A",
+            "results": 4,
+            "ok_results": 2,
+            "attention_results": 1,
+            "fail_results": 1,
+            "success_rate": 0.75,
+            "avg_rows": 10.0,
+            "avg_duration_s": 2.0,
+        }
+    ]
+
+    daily = store.dealer_daily("Dealer A", days=30, now=datetime(2024, 1, 10))
+    assert [point["day"] for point in daily] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert daily[1]["success_rate"] == 0.5
+
+    assert store.success_rates(days=3, now=datetime(2024, 1, 10)) == []
@@ -31,4 +31,20 @@ def test_scrape_monitor_renders_shell_when_logged_in():
     html = response.get_data(as_text=True)
     assert "Scrape Monitor" in html
     assert "monitor-table-body" in html
-    assert "monitor-running" in html
\ No newline at end of file
+    assert "monitor-running" in html
+
+
+def test_scraper_monitor_json_supports_etag_revalidation():
+    app.config["TESTING"] = True
+    client = app.test_client()
+
+    first = client.get("/scraper-monitor")
+    etag = first.headers.get("ETag")
+
+    assert first.status_code == 200
+    assert first.is_json
+    assert etag
+
+    second = client.get("/scraper-monitor", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.get_data() == b""
@@ -0,0 +1,90 @@
+import sys
+import types
+
+import pandas as pd
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+from run_history import RunHistoryStore  # noqa: E402
+
+
+def _set_rows(rows, generation):
+    with app_module.SCRAPE_LOCK:
+        app_module.SCRAPE_STATE["rows"] = list(rows)
+        app_module.SCRAPE_STATE["generation"] = generation
+        app_module.SCRAPE_STATE["running"] = True
+
+
+def test_delta_feed_returns_only_new_rows_after_cursor():
+    client = app_module.app.test_client()
+    _set_rows([{"Model": "RAV4"}, {"Model": "Camry"}], generation=3)
+
+    first = client.get("/scrape-results/delta").get_json()
+    assert first["reset"] is True
+    assert [r["Model"] for r in first["rows"]] == ["RAV4", "Camry"]
+    assert first["cursor"] == "3.2"
+    assert first["running"] is True
+
+    with app_module.SCRAPE_LOCK:
+        app_module.SCRAPE_STATE["rows"].append({"Model": "Tacoma", "Monthly ($)": float("nan")})
+
+    second = client.get("/scrape-results/delta", query_string={"cursor": first["cursor"]}).get_json()
+    assert second["reset"] is False
+    assert second["rows"] == [{"Model": "Tacoma", "Monthly ($)": None}]
+    assert second["cursor"] == "3.3"
+
+    idle = client.get("/scrape-results/delta", query_string={"cursor": second["cursor"]}).get_json()
+    assert idle["rows"] == []
+    assert idle["cursor"] == "3.3"
+
+
+def test_delta_feed_resets_for_cursor_from_previous_run():
+    client = app_module.app.test_client()
+    _set_rows([{"Model": "Prius"}], generation=5)
+
+    for stale in ("4.10", "5.9", "garbage"):
+        body = client.get("/scrape-results/delta", query_string={"cursor": stale}).get_json()
+        assert body["reset"] is True
+        assert body["rows"] == [{"Model": "Prius"}]
+        assert body["cursor"] == "5.1"
+
+
+class _Dealer:
+    """Fake scraper that records what readers saw while the run was in progress."""
+
+    dealer_name = "Keyes Toyota"
+    brand = "Toyota"
+
+    def __init__(self, client):
+        self.client = client
+        self.seen = {}
+
+    def fetch_df(self):
+        self.seen["published"] = self.client.get("/scrape-results").get_json()
+        self.seen["live"] = self.client.get("/scrape-results?live=1").get_json()
+        return pd.DataFrame([{"Model": "2025 Toyota Camry", "Monthly ($)": 259.0}])
+
+
+def test_run_fills_staging_while_previous_rows_stay_published(tmp_path, monkeypatch):
+    client = app_module.app.test_client()
+    dealer = _Dealer(client)
+    monkeypatch.setattr(app_module, "SCRAPERS", [dealer])
+    monkeypatch.setattr(app_module, "RUN_HISTORY", RunHistoryStore(str(tmp_path / "history.sqlite3")))
+    monkeypatch.setattr(app_module, "LAST_RUN_PATH", str(tmp_path / "last_run.json.gz"))
+    monkeypatch.setattr(app_module, "load_manual_offers", lambda: [{"Model": "manual"}])
+    _set_rows([{"Model": "Prius"}], generation=7)
+
+    app_module.background_scrape()
+
+    assert [r["Model"] for r in dealer.seen["published"]] == ["Prius"]
+    assert [r["Model"] for r in dealer.seen["live"]] == ["manual"]
+
+    body = client.get("/scrape-results/delta", query_string={"cursor": "7.1"}).get_json()
+    assert body["reset"] is True
+    assert body["generation"] == 8
+    assert [r["Model"] for r in body["rows"]] == ["manual", "2025 Toyota Camry"]
+    # Between runs there is no staging buffer; live readers get the published rows
+    assert client.get("/scrape-results?live=1").get_json() == client.get("/scrape-results").get_json()
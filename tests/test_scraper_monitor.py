@@ -169,6 +169,7 @@ def test_dealer_health_ok_when_majority_valid_and_no_attention():
     assert health["attention_rows"] == 0
     assert health["top_issues"] == []
 
+
 def test_record_dealer_result_normalizes_common_aliases():
     fixed_now = datetime(2024, 1, 1)
     reset_monitor_state(now=fixed_now)
@@ -194,4 +195,22 @@ def test_record_dealer_result_normalizes_common_aliases():
     assert dealer_state["status"] == "OK"
     assert dealer_state["total_rows"] == 1
     assert dealer_state["invalid_required_rows"] == 0
-    assert dealer_state["attention_rows"] == 0
\ No newline at end of file
+    assert dealer_state["attention_rows"] == 0
+
+
+def test_monitor_snapshot_is_cached_per_version():
+    from scraper_monitor import monitor_snapshot, monitor_version
+
+    reset_monitor_state(now=datetime(2024, 1, 1))
+    etag, body = monitor_snapshot()
+    version = monitor_version()
+
+    assert monitor_snapshot() == (etag, body)
+    assert b'"updated_at": "2024-01-01T00:00:00"' in body
+
+    record_dealer_result("Dealer B", [], run_date=date(2024, 1, 1), now=datetime(2024, 1, 2))
+
+    new_etag, new_body = monitor_snapshot()
+    assert monitor_version() == version + 1
+    assert new_etag != etag
+    assert b"Dealer B" in new_body
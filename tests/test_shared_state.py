@@ -0,0 +1,118 @@
+import sys
+import threading
+import time
+import types
+
+registry_stub = types.ModuleType("registry")
+registry_stub.SCRAPERS = []
+sys.modules["registry"] = registry_stub
+
+import app as app_module  # noqa: E402
+import scraper_monitor  # noqa: E402
+import shared_state  # noqa: E402
+from shared_state import SharedScrapeState  # noqa: E402
+
+
+def test_run_lock_is_exclusive_until_released(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    first, second = SharedScrapeState(path), SharedScrapeState(path)
+
+    assert first.acquire_run() is True
+    assert second.acquire_run() is False
+    assert second.read_state()["running"] is True
+
+    first.release_run()
+    assert second.acquire_run() is True
+
+
+def test_run_lock_of_another_host_is_reclaimed_once_its_lease_expires(tmp_path, monkeypatch):
+    path = str(tmp_path / "shared.sqlite3")
+    owner, other = SharedScrapeState(path, lease_seconds=60), SharedScrapeState(path, lease_seconds=60)
+    assert owner.acquire_run() is True
+    assert owner.heartbeat() is True
+
+    # Seen from a worker on another machine
+    monkeypatch.setattr(shared_state, "_HOST", "other-host")
+    assert other.acquire_run() is False
+    assert other.heartbeat() is False
+
+    clock = time.time() + 61
+    monkeypatch.setattr(shared_state, "time", types.SimpleNamespace(time=lambda: clock))
+    assert other.read_state()["running"] is False
+    assert other.acquire_run() is True
+
+
+def test_rows_are_appended_per_generation(tmp_path):
+    store = SharedScrapeState(str(tmp_path / "shared.sqlite3"))
+
+    generation = store.begin_run(total=2, run_id=9, rows=[{"Model": "manual"}])
+    store.append_rows(generation, 1, [{"Model": "RAV4", "Monthly ($)": float("nan")}], progress=1)
+
+    state = store.read_state()
+    assert (state["generation"], state["row_count"], state["progress"]) == (generation, 2, 1)
+    assert store.read_rows(generation, 1) == [{"Model": "RAV4", "Monthly ($)": None}]
+
+    next_generation = store.begin_run(total=2, run_id=10, rows=[])
+    assert next_generation == generation + 1
+    assert store.read_rows(generation) == []
+
+
+def test_reader_worker_mirrors_writer_worker(tmp_path, monkeypatch):
+    path = str(tmp_path / "shared.sqlite3")
+    writer = SharedScrapeState(path)
+    monkeypatch.setattr(app_module, "SHARED", SharedScrapeState(path))
+    monkeypatch.setitem(app_module._SHARED_SYNC, "monitor_version", None)
+
+    # Another worker starts a run and finishes one dealer
+    assert writer.acquire_run()
+    generation = writer.begin_run(total=3, run_id=1, rows=[{"Model": "manual"}])
+    writer.append_rows(generation, 1, [{"Dealership": "Keyes Toyota", "Model": "Camry"}], progress=1)
+    writer.put_monitor({"running": True, "dealers": {"Keyes Toyota": {"status": "OK"}}})
+
+    client = app_module.app.test_client()
+    published = client.get("/scrape-results").get_json()
+    app_module.sync_shared_state()
+
+    status = client.get("/scrape-status").get_json()
+    assert status["running"] is True
+    assert status["progress"] == 1
+    assert len(client.get("/scrape-results?live=1").get_json()) == 2
+    # Nothing has been published yet; readers outside live mode keep the previous table
+    assert client.get("/scrape-results").get_json() == published
+    assert scraper_monitor.SCRAPER_MONITOR["dealers"]["Keyes Toyota"]["status"] == "OK"
+    assert client.get("/start-scraping").get_json()["status"] == "already_running"
+
+    writer.append_rows(generation, 2, [{"Dealership": "Cabe Toyota", "Model": "Prius"}], progress=2)
+    writer.finish_run("2026-01-05T08:00:00")
+    writer.release_run()
+    app_module.sync_shared_state()
+
+    status = client.get("/scrape-status").get_json()
+    assert status["running"] is False
+    assert status["last_completed_at"] == "2026-01-05T08:00:00"
+    assert [r["Model"] for r in client.get("/scrape-results").get_json()] == ["manual", "Camry", "Prius"]
+    scraper_monitor.reset_monitor_state()
+
+
+def test_start_scraping_claims_the_run_before_it_starts(monkeypatch):
+    release = threading.Event()
+    runs = []
+
+    def slow_scrape(profile_targets=None):
+        runs.append(profile_targets)
+        release.wait(5)
+
+    monkeypatch.setattr(app_module, "SHARED", None)
+    monkeypatch.setattr(app_module, "background_scrape", slow_scrape)
+    client = app_module.app.test_client()
+
+    # background_scrape hasn't set running yet; the claim alone turns the second call away
+    assert client.get("/start-scraping").get_json()["status"] == "started"
+    assert client.get("/start-scraping").get_json()["status"] == "already_running"
+
+    release.set()
+    deadline = time.time() + 5
+    while app_module.SCRAPE_STATE["starting"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert app_module.SCRAPE_STATE["starting"] is False
+    assert len(runs) == 1
@@ -0,0 +1,59 @@
+import time
+
+from scrapers.base.stage_timer import STAGES, StageTimer, add_bytes, stage
+
+
+@stage("normalize")
+def _normalize(rows):
+    return rows
+
+
+def _fake_fetch_df():
+    with stage("fetch"):
+        time.sleep(0.01)
+        add_bytes(2048)
+    time.sleep(0.01)  # "parsing"
+    return _normalize([1, 2, 3])
+
+
+def test_stage_timer_attributes_fetch_df_time_to_stages():
+    timer = StageTimer()
+
+    with timer.activate():
+        started = time.perf_counter()
+        assert _fake_fetch_df() == [1, 2, 3]
+        timer.attribute_parse(time.perf_counter() - started)
+
+    with timer.stage("publish"):
+        pass
+
+    summary = timer.summary()
+
+    assert list(summary["timings"]) == list(STAGES)
+    assert summary["bytes_downloaded"] == 2048
+    assert summary["timings"]["fetch"] >= 0.01
+    assert summary["timings"]["parse"] >= 0.005
+    assert summary["duration_s"] >= summary["timings"]["fetch"] + summary["timings"]["parse"]
+
+
+def test_explicit_parse_stage_is_not_counted_twice():
+    timer = StageTimer()
+
+    with timer.activate():
+        started = time.perf_counter()
+        with stage("parse"):
+            time.sleep(0.02)
+        elapsed = time.perf_counter() - started
+        timer.attribute_parse(elapsed)
+
+    # summary() rounds to 0.1 ms
+    assert 0.02 <= timer.summary()["timings"]["parse"] <= elapsed + 1e-4
+
+
+def test_stage_helpers_are_noops_without_active_timer():
+    timer = StageTimer()
+
+    _fake_fetch_df()
+
+    assert timer.summary()["bytes_downloaded"] == 0
+    assert timer.summary()["timings"]["fetch"] == 0.0
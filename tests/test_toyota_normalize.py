@@ -0,0 +1,59 @@
+import pandas as pd
+
+from scrapers.base.toyota_base import ToyotaBaseScraper
+
+
+def test_normalize_df_orders_columns_and_coerces_types():
+    df = pd.DataFrame(
+        [
+            {
+                "Dealer Specials Link": "https://example.com",
+                "Due at Signing ($)": "$3,999",
+                "Expires": "01/05/26",
+                "MSRP ($)": 32009.0,
+                "Model": "2025 Toyota RAV4 LE",
+                "Monthly ($)": "299",
+                "Term (months)": "39",
+            },
+            {
+                "Model": "2025 Toyota Camry",
+                "Monthly ($)": None,
+                "Term (months)": "N/A",
+                "Expires": "2026-01-05T23:59:59-08:00",
+            },
+        ]
+    )
+
+    out = ToyotaBaseScraper.normalize_df(df)
+
+    assert list(out.columns) == ToyotaBaseScraper.TABLE_COLUMNS
+    assert str(out["Monthly ($)"].dtype) == "Float64"
+    assert str(out["Term (months)"].dtype) == "Int64"
+
+    first = out.iloc[0]
+    assert first["Monthly ($)"] == 299.0
+    assert first["Due at Signing ($)"] == 3999.0
+    assert first["MSRP ($)"] == 32009.0
+    assert first["Term (months)"] == 39
+    assert first["Expires"] == "1/5/2026"
+
+    second = out.iloc[1]
+    assert pd.isna(second["Monthly ($)"])
+    assert pd.isna(second["Term (months)"])
+    assert second["Expires"] == "1/5/2026"
+
+
+def test_normalize_df_keeps_unparseable_expiry_text_and_extra_columns():
+    df = pd.DataFrame([{"Model": "Tacoma", "Expires": "see dealer", "Dealership": "Penske Toyota"}])
+
+    out = ToyotaBaseScraper.normalize_df(df)
+
+    assert out.iloc[0]["Expires"] == "see dealer"
+    assert list(out.columns) == ToyotaBaseScraper.TABLE_COLUMNS + ["Dealership"]
+
+
+def test_normalize_df_handles_empty_frame():
+    out = ToyotaBaseScraper.normalize_df(pd.DataFrame(columns=["Expires", "Model"]))
+
+    assert out.empty
+    assert list(out.columns) == ToyotaBaseScraper.TABLE_COLUMNS
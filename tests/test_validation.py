@@ -119,4 +119,73 @@ def test_validate_row_supports_hyphenated_expires_date():
     assert result["normalized_row"]["expires"].year == 2026
     assert result["normalized_row"]["expires"].month == 4
     assert result["normalized_row"]["expires"].day == 5
-    assert result["row_status"] == "VALID"
\ No newline at end of file
+    assert result["row_status"] == "VALID"
+
+
+def test_validate_batch_matches_validate_row():
+    from validation import ISSUE_COLUMNS, compute_dealer_health, compute_frame_health, validate_batch
+
+    run_date = date(2024, 3, 1)
+    rows = [
+        {"monthly": "$299", "due_at_signing": "$2,999", "model": "Camry", "expires": "04-05-2026", "term_months": "36"},
+        {"monthly": 0, "due_at_signing": "-100", "model": "", "expires": "12/31/30", "term_months": 36.0},
+        {"monthly": "$199", "due_at_signing": 1999, "model": "RAV4", "expires": "01/01/24", "term_months": "25"},
+        {"monthly": 199.0, "due_at_signing": "N/A", "model": "bZ4X", "msrp": "not-a-number"},
+        {},
+    ]
+
+    per_row = [validate_row(row, run_date) for row in rows]
+    batch = validate_batch(rows, run_date)
+
+    assert list(batch["row_status"]) == [result["row_status"] for result in per_row]
+    for i, result in enumerate(per_row):
+        expected = set(result["required_errors"] + result["moderate_warnings"])
+        assert {issue for issue in ISSUE_COLUMNS if batch[issue].iloc[i]} == expected
+    assert compute_frame_health(batch) == compute_dealer_health(per_row)
+
+
+def test_row_and_frame_field_normalization_agree():
+    from validation import normalize_frame_fields, normalize_row_fields, validate_frame
+
+    rows = [
+        # A present but empty alias falls through to the next one holding a value
+        {"monthly": None, "Monthly ($)": "$299", "Model": "Camry", "model": float("nan"), "Term (months)": 36},
+        {"Monthly": 259.0, "Due at Signing": "$1,999", "term_months": float("nan"), "Term": "39"},
+        {"Monthly ($)": float("nan"), "Monthly": None, "MSRP": "31,000", "Expires": "1/5/2027"},
+        {},
+    ]
+
+    frame = normalize_frame_fields(rows)
+    per_row = [normalize_row_fields(row) for row in rows]
+    cleaned = frame.astype(object).where(frame.notna(), None).to_dict("records")
+    assert cleaned == per_row
+
+    run_date = date(2026, 1, 1)
+    assert list(validate_frame(frame, run_date)["row_status"]) == [validate_row(row, run_date)["row_status"] for row in per_row]
+
+
+def test_validate_batch_empty_is_fail():
+    from validation import compute_frame_health, validate_batch
+
+    health = compute_frame_health(validate_batch([], date(2024, 1, 1)))
+
+    assert health["status"] == "FAIL"
+    assert health["total_rows"] == 0
+
+
+def test_expires_parsing_is_memoized_with_fast_path():
+    from validation import _normalize_expires, clear_expires_cache, expires_cache_stats
+
+    clear_expires_cache()
+
+    assert _normalize_expires("01/05/2026") == date(2026, 1, 5)
+    assert _normalize_expires("01/05/2026") == date(2026, 1, 5)
+    assert _normalize_expires("1/5/26") == date(2026, 1, 5)
+    assert _normalize_expires("2026-01-05T23:59:59-08:00") == date(2026, 1, 5)
+    assert _normalize_expires("Jan 5, 2026") == date(2026, 1, 5)
+
+    stats = expires_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 4
+    assert stats["hit_rate"] == 0.2
+    assert stats["dateutil_fallbacks"] == 1
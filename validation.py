@@ -1,6 +1,11 @@
+import re
+import time
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 from dateutil import parser
+import numpy as np
+import pandas as pd
 
 _REQUIRED_NUMERIC_LIMITS = {
     "monthly": (0, 5000),
@@ -11,14 +16,71 @@ _VALID_TERMS = {24, 27, 36, 39, 48, 60, 72}
 
 _EMPTY_VALUES = {"", "—", "N/A", None}
 
+# Expiry strings repeat heavily across rows and runs; keep parsed dates around
+_EXPIRES_CACHE_SIZE = 4096
 
-def _first_present(row: Dict[str, Any], keys: List[str]) -> Any:
+# M/D/YYYY, MM/DD/YY and the hyphenated variants
+_US_DATE_RE = re.compile(r"(\d{1,2})([/-])(\d{1,2})\2(\d{4}|\d{2})")
+# YYYY-MM-DD, optionally followed by a time
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ][\d:.]+(?:Z|[+-]\d{2}:?\d{2})?)?")
+
+_EXPIRES_FALLBACKS = {"dateutil": 0}
+
+_ROW_FIELDS = ["due_at_signing", "monthly", "model", "expires", "term_months", "msrp"]
+
+# Issue messages, exactly as validate_row reports them
+_REQUIRED_MISSING = {field: f"{field} is required and must be a number" for field in _REQUIRED_NUMERIC_LIMITS}
+_REQUIRED_RANGE = {
+    field: f"{field} must be numeric {'> 0' if field == 'monthly' else '≥ 0'} and under {upper}"
+    for field, (_, upper) in _REQUIRED_NUMERIC_LIMITS.items()
+}
+_MODEL_MISSING = "model is required and must be a meaningful string"
+_EXPIRES_INVALID = "expires date is missing or invalid"
+_EXPIRES_PAST = "expires date is before the run date"
+_TERM_INVALID = "term_months is missing or invalid"
+_TERM_UNEXPECTED = "term_months is not in the expected set"
+_MSRP_INVALID = "msrp provided but invalid"
+
+ISSUE_COLUMNS = [
+    *[message for field in _REQUIRED_NUMERIC_LIMITS for message in (_REQUIRED_MISSING[field], _REQUIRED_RANGE[field])],
+    _MODEL_MISSING,
+    _EXPIRES_INVALID,
+    _EXPIRES_PAST,
+    _TERM_INVALID,
+    _TERM_UNEXPECTED,
+    _MSRP_INVALID,
+]
+# Issues that make a row INVALID_REQUIRED; the rest are warnings
+REQUIRED_ISSUES = frozenset([*_REQUIRED_MISSING.values(), *_REQUIRED_RANGE.values(), _MODEL_MISSING])
+
+
+# Normalized field -> the row keys it is read from; the first one holding a value wins
+FIELD_ALIASES = {
+    "due_at_signing": ["due_at_signing", "Due at Signing ($)", "Due at Signing"],
+    "monthly": ["monthly", "Monthly ($)", "Monthly"],
+    "model": ["model", "Model"],
+    "expires": ["expires", "Expires"],
+    "term_months": ["term_months", "Term (months)", "Term"],
+    "msrp": ["msrp", "MSRP ($)", "MSRP"],
+}
+
+
+def _is_missing(value: Any) -> bool:
+    """None / NaN / NA / NaT: what ``notna`` treats as missing in normalize_frame_fields."""
+    return value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value)
+
+
+def _first_value(row: Dict[str, Any], keys: List[str]) -> Any:
     for key in keys:
-        if key in row:
-            return row[key]
+        value = row.get(key)
+        if not _is_missing(value):
+            return value
     return None
 
 
+def normalize_row_fields(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Scraped / manual row -> the field names validate_row expects (see FIELD_ALIASES)."""
+    return {normalized: _first_value(row, aliases) for normalized, aliases in FIELD_ALIASES.items()}
 
 
 def _normalize_scalar(value: Any) -> Optional[str]:
@@ -33,7 +95,14 @@ def _normalize_scalar(value: Any) -> Optional[str]:
     return str(value)
 
 
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
 def _normalize_money(value: Any) -> Optional[float]:
+    # Already-typed values (e.g. from ToyotaBaseScraper.normalize_df) skip string parsing
+    if _is_number(value):
+        return float(value)
     normalized = _normalize_scalar(value)
     if normalized is None:
         return None
@@ -45,6 +114,8 @@ def _normalize_money(value: Any) -> Optional[float]:
 
 
 def _normalize_term(value: Any) -> Optional[int]:
+    if _is_number(value):
+        return int(value) if float(value).is_integer() else None
     normalized = _normalize_scalar(value)
     if normalized is None:
         return None
@@ -54,15 +125,72 @@ def _normalize_term(value: Any) -> Optional[int]:
         return None
 
 
+def _expand_two_digit_year(year: int) -> int:
+    """Same rule as dateutil: pick the century that lands within ±50 years of today."""
+    this_year = time.localtime().tm_year
+    year += this_year // 100 * 100
+    if year >= this_year + 50:
+        year -= 100
+    elif year < this_year - 50:
+        year += 100
+    return year
+
+
+def _parse_known_date_format(text: str) -> Optional[date]:
+    m = _US_DATE_RE.fullmatch(text)
+    if m:
+        month, day, year = int(m.group(1)), int(m.group(3)), m.group(4)
+        return date(int(year) if len(year) == 4 else _expand_two_digit_year(int(year)), month, day)
+
+    m = _ISO_DATE_RE.fullmatch(text)
+    if m:
+        return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+    return None
+
+
+@lru_cache(maxsize=_EXPIRES_CACHE_SIZE)
+def _parse_expires(text: str) -> Optional[date]:
+    try:
+        parsed = _parse_known_date_format(text)
+    except ValueError:
+        # e.g. 13/01/2026 – let dateutil decide, as it always has
+        parsed = None
+    if parsed is not None:
+        return parsed
+
+    _EXPIRES_FALLBACKS["dateutil"] += 1
+    try:
+        return parser.parse(text, dayfirst=False, yearfirst=False).date()
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
 def _normalize_expires(value: Any) -> Optional[date]:
     normalized = _normalize_scalar(value)
     if normalized is None:
         return None
 
-    try:
-        return parser.parse(normalized, dayfirst=False, yearfirst=False).date()
-    except (ValueError, TypeError):
-        return None
+    return _parse_expires(normalized)
+
+
+def expires_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the expiry-date memo (and how often dateutil was needed)."""
+    info = _parse_expires.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "dateutil_fallbacks": _EXPIRES_FALLBACKS["dateutil"],
+    }
+
+
+def clear_expires_cache() -> None:
+    _parse_expires.cache_clear()
+    _EXPIRES_FALLBACKS["dateutil"] = 0
 
 
 
@@ -82,41 +210,37 @@ def validate_row(row: Dict[str, Any], run_date: date) -> Dict[str, Any]:
     for field, (lower, upper) in _REQUIRED_NUMERIC_LIMITS.items():
         value = normalized_row[field]
         if value is None:
-            required_errors.append(f"{field} is required and must be a number")
+            required_errors.append(_REQUIRED_MISSING[field])
             continue
 
         if field == "monthly":
             is_valid = lower < value < upper
-            comparator = "> 0"
         else:
             is_valid = lower <= value < upper
-            comparator = "≥ 0"
 
         if not is_valid:
-            required_errors.append(
-                f"{field} must be numeric {comparator} and under {upper}"
-            )
+            required_errors.append(_REQUIRED_RANGE[field])
 
     model_value = normalized_row["model"]
     if model_value is None or not str(model_value).strip():
-        required_errors.append("model is required and must be a meaningful string")
+        required_errors.append(_MODEL_MISSING)
 
     expires_value = normalized_row["expires"]
     if expires_value is None:
-        moderate_warnings.append("expires date is missing or invalid")
+        moderate_warnings.append(_EXPIRES_INVALID)
     elif expires_value < run_date:
-        moderate_warnings.append("expires date is before the run date")
+        moderate_warnings.append(_EXPIRES_PAST)
 
     term_value = normalized_row["term_months"]
     if term_value is None:
-        moderate_warnings.append("term_months is missing or invalid")
+        moderate_warnings.append(_TERM_INVALID)
     elif term_value not in _VALID_TERMS:
-        moderate_warnings.append("term_months is not in the expected set")
+        moderate_warnings.append(_TERM_UNEXPECTED)
 
     msrp_value = row.get("msrp")
     if msrp_value is not None and msrp_value not in _EMPTY_VALUES:
         if normalized_row["msrp"] is None:
-            moderate_warnings.append("msrp provided but invalid")
+            moderate_warnings.append(_MSRP_INVALID)
 
     if required_errors:
         row_status = "INVALID_REQUIRED"
@@ -182,4 +306,174 @@ def compute_dealer_health(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
         "invalid_required_rows": invalid_required_rows,
         "attention_rows": attention_rows,
         "top_issues": top_issues,
-    }
\ No newline at end of file
+    }
+
+
+# ---------------- BATCH VALIDATION ----------------
+#
+# Same rules as validate_row, evaluated as column masks over a whole
+# DataFrame. Cell values repeat heavily (a dealer's expiry date, "$3,999"
+# due at signing, the usual 36/39 terms), so each column is factorized and
+# the scalar normalizers above run once per distinct value. NaN / NA count
+# as missing, like None.
+
+
+def _per_unique(values: pd.Series, fn, missing: Any = None) -> np.ndarray:
+    """Apply ``fn`` to each distinct value of ``values`` and broadcast back."""
+    # NB: True/False hash equal to 1/0 here; booleans never appear in scraped rows
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    lookup = np.array([fn(value) for value in uniques] + [missing], dtype=object)
+    return lookup[codes]
+
+
+def _money_column(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        return values.astype("float64")
+
+    parsed = _per_unique(values, _normalize_money, missing=np.nan)
+    return pd.Series(parsed, index=values.index, dtype=object).fillna(np.nan).astype("float64")
+
+
+def _term_column(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        numbers = values.astype("float64")
+        numbers = numbers.where(np.isfinite(numbers) & (numbers == np.floor(numbers)))
+        return numbers.astype("Int64")
+
+    parsed = _per_unique(values, _normalize_term)
+    return pd.array(parsed, dtype="Int64")
+
+
+def _model_column(values: pd.Series) -> pd.Series:
+    return pd.Series(_per_unique(values, _normalize_scalar), index=values.index, dtype=object)
+
+
+def _expires_column(values: pd.Series, run_date: date) -> tuple[pd.Series, pd.Series]:
+    """Parsed expiry dates plus a "before run_date" mask."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    parsed = [_normalize_expires(value) for value in uniques] + [None]
+    before = [d is not None and d < run_date for d in parsed]
+    return (
+        pd.Series(np.array(parsed, dtype=object)[codes], index=values.index, dtype=object),
+        pd.Series(np.array(before, dtype=bool)[codes], index=values.index),
+    )
+
+
+def _provided_column(values: pd.Series) -> pd.Series:
+    """validate_row's "msrp provided" test: present and not an empty-like marker."""
+    provided = _per_unique(values, lambda value: value not in _EMPTY_VALUES, missing=False)
+    return pd.Series(provided.astype(bool), index=values.index)
+
+
+def normalize_frame_fields(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Column-wise normalize_row_fields: first alias column with a value wins."""
+    raw = pd.DataFrame.from_records(rows)
+    frame = pd.DataFrame(index=raw.index)
+
+    for normalized, aliases in FIELD_ALIASES.items():
+        column = pd.Series(None, index=raw.index, dtype=object)
+        for alias in reversed(aliases):
+            if alias in raw.columns:
+                column = raw[alias].where(raw[alias].notna(), column)
+        frame[normalized] = column
+
+    return frame
+
+
+def validate_frame(frame: pd.DataFrame, run_date: date) -> pd.DataFrame:
+    """
+    Vectorized validate_row over a DataFrame keyed by the normalized field names
+    (monthly, due_at_signing, model, expires, term_months, msrp).
+
+    Returns one row per input row with the normalized values, ``row_status``
+    and one boolean column per issue message (see ISSUE_COLUMNS).
+    """
+    index = frame.index
+    raw = {
+        field: frame[field] if field in frame.columns else pd.Series(None, index=index, dtype=object)
+        for field in _ROW_FIELDS
+    }
+
+    out = pd.DataFrame(index=index)
+    out["due_at_signing"] = _money_column(raw["due_at_signing"])
+    out["monthly"] = _money_column(raw["monthly"])
+    out["model"] = _model_column(raw["model"])
+    out["expires"], expires_past = _expires_column(raw["expires"], run_date)
+    out["term_months"] = _term_column(raw["term_months"])
+    out["msrp"] = _money_column(raw["msrp"])
+
+    required = pd.Series(False, index=index)
+    for field, (lower, upper) in _REQUIRED_NUMERIC_LIMITS.items():
+        value = out[field]
+        missing = value.isna()
+        if field == "monthly":
+            in_range = (value > lower) & (value < upper)
+        else:
+            in_range = (value >= lower) & (value < upper)
+        out[_REQUIRED_MISSING[field]] = missing
+        out[_REQUIRED_RANGE[field]] = ~missing & ~in_range
+        required |= missing | ~in_range
+
+    out[_MODEL_MISSING] = out["model"].isna()
+    required |= out[_MODEL_MISSING]
+
+    out[_EXPIRES_INVALID] = out["expires"].isna()
+    out[_EXPIRES_PAST] = expires_past
+
+    term = out["term_months"]
+    out[_TERM_INVALID] = term.isna().astype(bool)
+    out[_TERM_UNEXPECTED] = (term.notna() & ~term.isin(list(_VALID_TERMS))).astype(bool)
+
+    out[_MSRP_INVALID] = _provided_column(raw["msrp"]) & out["msrp"].isna()
+
+    attention = out[_EXPIRES_INVALID] | out[_EXPIRES_PAST] | out[_TERM_INVALID] | out[_TERM_UNEXPECTED]
+    out["row_status"] = np.select(
+        [required.to_numpy(), attention.to_numpy()],
+        ["INVALID_REQUIRED", "ATTENTION_MODERATE"],
+        default="VALID",
+    )
+
+    return out
+
+
+def validate_batch(rows: Iterable[Dict[str, Any]], run_date: date) -> pd.DataFrame:
+    """validate_frame for a list of dicts shaped like validate_row's input."""
+    frame = pd.DataFrame.from_records(list(rows), columns=_ROW_FIELDS)
+    return validate_frame(frame, run_date)
+
+
+def compute_frame_health(validated: pd.DataFrame) -> Dict[str, Any]:
+    """compute_dealer_health for the output of validate_frame / validate_batch."""
+    total_rows = len(validated)
+
+    if total_rows == 0:
+        return compute_dealer_health([])
+
+    status_counts = validated["row_status"].value_counts()
+    valid_rows = int(status_counts.get("VALID", 0))
+    invalid_required_rows = int(status_counts.get("INVALID_REQUIRED", 0))
+    attention_rows = int(status_counts.get("ATTENTION_MODERATE", 0))
+
+    issue_totals = validated[ISSUE_COLUMNS].sum()
+    issue_counts = {issue: int(count) for issue, count in issue_totals.items() if count}
+
+    if valid_rows == 0:
+        status = "FAIL"
+    elif invalid_required_rows / total_rows > 0.5:
+        status = "FAIL"
+    elif attention_rows > 0:
+        status = "NEEDS_ATTENTION"
+    else:
+        status = "OK"
+
+    sorted_issues = sorted(issue_counts.items(), key=lambda item: (-item[1], item[0]))
+    top_issues = [issue for issue, _ in sorted_issues[:3]]
+
+    return {
+        "status": status,
+        "total_rows": total_rows,
+        "valid_rows": valid_rows,
+        "invalid_required_rows": invalid_required_rows,
+        "attention_rows": attention_rows,
+        "top_issues": top_issues,
+    }